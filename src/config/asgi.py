@@ -11,7 +11,9 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from src.config.lifespan import LifespanMiddleware
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.config.django.base")
 
 
-application = get_asgi_application()
+application = LifespanMiddleware(get_asgi_application())
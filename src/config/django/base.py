@@ -107,6 +107,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "src.utils.middleware.request_deadline_middleware",
 ]
 
 # =============================================================================
@@ -200,6 +201,39 @@ NO_SQL_DATABASE_NAME = config("NO_SQL_DATABASE_NAME")
 NO_SQL_QUESTIONS_DATABASE_NAME = config("NO_SQL_QUESTIONS_DATABASE_NAME")
 NO_SQL_ATTEMPTS_DATABASE = config("NO_SQL_ATTEMPTS_DATABASE")
 NO_SQL_GRADING_RESPONSE_DATABASE_NAME = config("NO_SQL_GRADING_RESPONSE_DATABASE_NAME")
+# Connection pool of each worker process; the minimum pool is opened at startup
+MONGO_MAX_POOL_SIZE = config("MONGO_MAX_POOL_SIZE", cast=int, default=100)
+MONGO_MIN_POOL_SIZE = config("MONGO_MIN_POOL_SIZE", cast=int, default=5)
+MONGO_MAX_IDLE_TIME_MS = config("MONGO_MAX_IDLE_TIME_MS", cast=int, default=300000)
+# Fail fast instead of waiting out the driver's 30s server selection timeout
+MONGO_SERVER_SELECTION_TIMEOUT_MS = config(
+    "MONGO_SERVER_SELECTION_TIMEOUT_MS", cast=int, default=5000
+)
+MONGO_SOCKET_TIMEOUT_MS = config("MONGO_SOCKET_TIMEOUT_MS", cast=int, default=10000)
+# Operations beyond MONGO_MAX_IN_FLIGHT per worker are shed; a database's
+# circuit opens after the failure threshold and is probed after the timeout
+MONGO_MAX_IN_FLIGHT = config("MONGO_MAX_IN_FLIGHT", cast=int, default=200)
+MONGO_CIRCUIT_FAILURE_THRESHOLD = config(
+    "MONGO_CIRCUIT_FAILURE_THRESHOLD", cast=int, default=5
+)
+MONGO_CIRCUIT_RESET_TIMEOUT_SECONDS = config(
+    "MONGO_CIRCUIT_RESET_TIMEOUT_SECONDS", cast=float, default=30.0
+)
+# Time a request may spend on retries of temporary MongoDB errors, in total
+REQUEST_DEADLINE_SECONDS = config("REQUEST_DEADLINE_SECONDS", cast=float, default=10.0)
+# Opt-in write-behind buffer for append-only collections, drained on shutdown
+MONGO_WRITE_BEHIND_ENABLED = config(
+    "MONGO_WRITE_BEHIND_ENABLED", cast=bool, default=False
+)
+MONGO_WRITE_BEHIND_BATCH_SIZE = config(
+    "MONGO_WRITE_BEHIND_BATCH_SIZE", cast=int, default=500
+)
+MONGO_WRITE_BEHIND_FLUSH_SECONDS = config(
+    "MONGO_WRITE_BEHIND_FLUSH_SECONDS", cast=float, default=1.0
+)
+MONGO_WRITE_BEHIND_MAX_QUEUE_SIZE = config(
+    "MONGO_WRITE_BEHIND_MAX_QUEUE_SIZE", cast=int, default=10000
+)
 
 
 # =============================================================================
@@ -306,6 +340,23 @@ MINIMUM_QUESTIONS_THRESHOLD = 9
 COMPLETION_THRESHOLD = 2 / 3
 LEARNING_HISTORY_COLLECTION_NAME = "learning_history"
 
+# Course Sync Configuration
+# Change events of a course are collapsed until it has been quiet for the
+# debounce window, but never delayed past the max delay
+COURSE_SYNC_DEBOUNCE_SECONDS = config(
+    "COURSE_SYNC_DEBOUNCE_SECONDS", cast=int, default=30
+)
+COURSE_SYNC_MAX_DELAY_SECONDS = config(
+    "COURSE_SYNC_MAX_DELAY_SECONDS", cast=int, default=300
+)
+
+# Question Cache Configuration
+# Longest time a question edited outside the question repository is served
+# stale from the shared Redis tier
+QUESTION_CACHE_REDIS_TTL_SECONDS = config(
+    "QUESTION_CACHE_REDIS_TTL_SECONDS", cast=int, default=300
+)
+
 # =============================================================================
 # DJANGO DEFAULTS
 # =============================================================================
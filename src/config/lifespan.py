@@ -0,0 +1,92 @@
+"""
+ASGI lifespan handling for edu_vault.
+
+Django's ASGI handler only serves HTTP, so the lifespan protocol is handled
+here: shared connection pools are opened on startup, before the worker takes
+traffic, and closed on shutdown.
+"""
+
+import logging
+
+from src.exceptions import MongoDbConnectionError
+
+logger = logging.getLogger(__name__)
+
+
+class LifespanMiddleware:
+    """
+    ASGI middleware answering lifespan events and passing everything else on.
+
+    An error during startup or shutdown is reported to the server with the
+    matching lifespan failure event, as the ASGI spec requires.
+    """
+
+    __slots__ = ("_app",)
+
+    def __init__(self, app) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application serving all other connection types
+        """
+        self._app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "lifespan":
+            await self._app(scope, receive, send)
+            return
+
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as e:
+                    logger.exception("ASGI startup failed")
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                try:
+                    await self.shutdown()
+                except Exception as e:
+                    logger.exception("ASGI shutdown failed")
+                    await send({"type": "lifespan.shutdown.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def startup() -> None:
+        """
+        Warm up the MongoDB connection pool and start the write-behind buffer.
+
+        A failed warm-up does not keep the worker from starting, the client is
+        then created by the first request instead.
+        """
+        from src.repository.databases.no_sql_database.mongo.mongodb import \
+            mongo_database
+        from src.repository.databases.no_sql_database.write_behind import \
+            WriteBehindBuffer
+
+        try:
+            await mongo_database.connect()
+        except MongoDbConnectionError as e:
+            logger.error("MongoDB warm-up failed, connecting on demand: %s", e)
+
+        if (write_behind_buffer := WriteBehindBuffer.get_buffer()) is not None:
+            await write_behind_buffer.start()
+
+    @staticmethod
+    async def shutdown() -> None:
+        """Drain the write-behind buffer and close the MongoDB connection pool"""
+        from src.repository.databases.no_sql_database.mongo.mongodb import \
+            mongo_database
+        from src.repository.databases.no_sql_database.write_behind import \
+            WriteBehindBuffer
+
+        if (write_behind_buffer := WriteBehindBuffer.get_buffer()) is not None:
+            await write_behind_buffer.stop()
+
+        await mongo_database.disconnect()
@@ -20,6 +20,8 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
+# Library packages are not Django apps, so their task modules are listed here.
+app.autodiscover_tasks(["src.library.course_sync"])
 
 
 @app.task(bind=True, ignore_result=True)
@@ -0,0 +1,66 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.config.lifespan import LifespanMiddleware
+
+
+async def _run_lifespan(middleware, *message_types):
+    receive = AsyncMock(side_effect=[{"type": type_} for type_ in message_types])
+    send = AsyncMock()
+    await middleware({"type": "lifespan"}, receive, send)
+    return [call.args[0] for call in send.await_args_list]
+
+
+class TestLifespanMiddleware:
+    @pytest.mark.asyncio
+    async def test_startup_and_shutdown_complete(self):
+        middleware = LifespanMiddleware(AsyncMock())
+        with (
+            patch.object(LifespanMiddleware, "startup", AsyncMock()),
+            patch.object(LifespanMiddleware, "shutdown", AsyncMock()),
+        ):
+            sent = await _run_lifespan(
+                middleware, "lifespan.startup", "lifespan.shutdown"
+            )
+
+        assert sent == [
+            {"type": "lifespan.startup.complete"},
+            {"type": "lifespan.shutdown.complete"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_startup_is_reported(self):
+        middleware = LifespanMiddleware(AsyncMock())
+        with patch.object(
+            LifespanMiddleware, "startup", AsyncMock(side_effect=RuntimeError("boom"))
+        ):
+            sent = await _run_lifespan(middleware, "lifespan.startup")
+
+        assert sent == [{"type": "lifespan.startup.failed", "message": "boom"}]
+
+    @pytest.mark.asyncio
+    async def test_failed_shutdown_is_reported(self):
+        middleware = LifespanMiddleware(AsyncMock())
+        with (
+            patch.object(LifespanMiddleware, "startup", AsyncMock()),
+            patch.object(
+                LifespanMiddleware,
+                "shutdown",
+                AsyncMock(side_effect=RuntimeError("boom")),
+            ),
+        ):
+            sent = await _run_lifespan(
+                middleware, "lifespan.startup", "lifespan.shutdown"
+            )
+
+        assert sent[-1] == {"type": "lifespan.shutdown.failed", "message": "boom"}
+
+    @pytest.mark.asyncio
+    async def test_other_scopes_are_passed_on(self):
+        app = AsyncMock()
+        receive, send = AsyncMock(), AsyncMock()
+
+        await LifespanMiddleware(app)({"type": "http"}, receive, send)
+
+        app.assert_awaited_once_with({"type": "http"}, receive, send)
@@ -3,8 +3,9 @@ from .base import (VirtuEducateBusinessError, VirtuEducateError,
                    VirtuEducateValidationError)
 from .content.assessment import (AssessmentAlreadyGradedError,
                                  NoActiveAssessmentError)
-from .database.mongo import (MongoDbConfigurationError, MongoDbConnectionError,
-                             MongoDbOperationError,
+from .database.mongo import (MongoDbCircuitOpenError,
+                             MongoDbConfigurationError, MongoDbConnectionError,
+                             MongoDbOperationError, MongoDbOverloadedError,
                              MongoDbTemporaryConnectionError,
                              MongoDbTemporaryOperationError)
 from .integration.webhook import (WebhookEventNotSupportedError,
@@ -14,10 +15,12 @@ from .integration.webhook import (WebhookEventNotSupportedError,
                                   WebhookSchemaValidationError,
                                   WebhookValidationError)
 from .library.assessments import UserQuestionSetNotFoundError
-from .library.course_sync import InvalidChangeDataTypeError
+from .library.course_sync import (CourseSyncLockedError,
+                                  InvalidChangeDataTypeError)
 from .library.scheduler import SchedulingError
 from .repository.attempts import (InvalidAttemptInputError, InvalidScoreError,
                                   MaximumAttemptsExceededError)
+from .repository.pagination import InvalidContinuationTokenError
 from .repository.questions import QuestionNotFoundError
 
 __all__ = [
@@ -33,12 +36,16 @@ __all__ = [
     "MongoDbTemporaryConnectionError",
     "MongoDbOperationError",
     "MongoDbTemporaryOperationError",
+    "MongoDbCircuitOpenError",
+    "MongoDbOverloadedError",
     # Attempts
     "MaximumAttemptsExceededError",
     "InvalidAttemptInputError",
     "InvalidScoreError",
     # Question
     "QuestionNotFoundError",
+    # Pagination
+    "InvalidContinuationTokenError",
     # Scheduler
     "SchedulingError",
     # webhooks
@@ -52,6 +59,7 @@ __all__ = [
     "UserQuestionSetNotFoundError",
     # course sync
     "InvalidChangeDataTypeError",
+    "CourseSyncLockedError",
     "NoActiveAssessmentError",
     "AssessmentAlreadyGradedError",
 ]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from .base import DatabaseError
 
@@ -129,6 +129,8 @@ class MongoDbOperationError(MongoDbError):
         operation: Optional[str] = None,
         collection: Optional[str] = None,
         query: Optional[dict] = None,
+        details: Optional[str] = None,
+        write_errors: Optional[List[dict]] = None,
         **kwargs,
     ):
         super().__init__(message, **kwargs)
@@ -141,6 +143,8 @@ class MongoDbOperationError(MongoDbError):
                 "operation": operation,
                 "collection": collection,
                 "query": str(query) if query else None,
+                "details": details,
+                "write_errors": write_errors,
                 "error_type": "MONGODB_OPERATION_ERROR",
             }.items()
             if v is not None
@@ -188,3 +192,57 @@ class MongoDbTemporaryOperationError(MongoDbError):
             }.items()
             if v is not None
         }
+
+
+class MongoDbCircuitOpenError(MongoDbError):
+    """
+    Raised without contacting MongoDB while the database's circuit is open.
+    """
+
+    def __init__(
+        self,
+        message: str = "MongoDB is unavailable, failing fast",
+        database: Optional[str] = None,
+        retry_after_seconds: Optional[float] = None,
+        **kwargs,
+    ):
+        super().__init__(message, **kwargs)
+
+        self.error_code = "503"
+
+        self.context = {
+            k: v
+            for k, v in {
+                "database": database,
+                "retry_after_seconds": retry_after_seconds,
+                "error_type": "MONGODB_CIRCUIT_OPEN",
+                "recoverable": True,
+            }.items()
+            if v is not None
+        }
+
+
+class MongoDbOverloadedError(MongoDbError):
+    """
+    Raised when an operation is shed because too many are already in flight.
+    """
+
+    def __init__(
+        self,
+        message: str = "Too many MongoDB operations in flight",
+        max_in_flight: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(message, **kwargs)
+
+        self.error_code = "503"
+
+        self.context = {
+            k: v
+            for k, v in {
+                "max_in_flight": max_in_flight,
+                "error_type": "MONGODB_OVERLOADED",
+                "recoverable": True,
+            }.items()
+            if v is not None
+        }
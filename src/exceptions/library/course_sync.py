@@ -1,6 +1,6 @@
 from typing import Optional
 
-from src.exceptions import VirtuEducateValidationError
+from src.exceptions import VirtuEducateSystemError, VirtuEducateValidationError
 
 
 class InvalidChangeDataTypeError(VirtuEducateValidationError):
@@ -26,3 +26,19 @@ class InvalidChangeDataTypeError(VirtuEducateValidationError):
             "operation": operation,
         }
         super().__init__(message, error_code, context, *args)
+
+
+class CourseSyncLockedError(VirtuEducateSystemError):
+    """Raised when another sync holds the per-course lock."""
+
+    def __init__(
+        self,
+        course_key: str,
+        message: Optional[str] = None,
+        error_code: str = "COURSE_SYNC_LOCKED",
+        context: Optional[dict] = None,
+        *args,
+    ):
+        message = message or f"Course {course_key} is being synchronized"
+        context = context or {"course_key": course_key}
+        super().__init__(message, error_code, context, *args)
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from src.exceptions import VirtuEducateValidationError
+
+
+class InvalidContinuationTokenError(VirtuEducateValidationError):
+    """Raised when a continuation token is malformed or belongs to another query"""
+
+    def __init__(self, reason: Optional[str] = None, **kwargs):
+        message = "Invalid continuation token"
+        if reason:
+            message += f": {reason}"
+
+        super().__init__(message, **kwargs)
+
+        self.error_code = "400"
+
+        self.context = {
+            k: v
+            for k, v in {
+                "reason": reason,
+                "error_type": "INVALID_CONTINUATION_TOKEN",
+            }.items()
+            if v is not None
+        }
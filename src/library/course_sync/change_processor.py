@@ -8,9 +8,10 @@ using the Strategy pattern with Command elements.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Union
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple, Union
 
-from django.db import OperationalError, transaction
+from django.db import transaction
 
 from src.apps.core.content.models import SubTopic, Topic
 from src.apps.core.courses.models import (AcademicClass, Course,
@@ -227,6 +228,10 @@ class ChangeProcessor:
     """
     Processes change operations using appropriate strategies based on operation type.
     Acts as an adapter between the diff engine and the processing logic.
+
+    Concurrent syncs of the same course are serialized by the per-course lock
+    of the sync pipeline; database errors propagate so the transaction is
+    rolled back and the caller can retry.
     """
 
     def __init__(
@@ -260,37 +265,240 @@ class ChangeProcessor:
         failed_changes = []
 
         for change in changes:
-            logger.info(
-                f"Processing: Operation={change.operation.name}, Entity={change.entity_type.name}, ID={change.entity_id}"
-            )
+            if not self._process_change(change):
+                failed_changes.append(change)
+
+        return failed_changes
+
+    def _process_change(self, change: ChangeOperation) -> bool:
+        """
+        Process a single change operation with its strategy
+
+        Args:
+            change: The change operation to process
+
+        Returns:
+            bool: False if the change failed, True otherwise
+        """
+        logger.info(
+            f"Processing: Operation={change.operation.name}, Entity={change.entity_type.name}, ID={change.entity_id}"
+        )
 
-            strategy = self._strategies.get(change.operation)
-            try:
-                if strategy:
-                    success = strategy.process(change)
-                    if not success:
-                        logger.error(
-                            f"Failed to process change: {change.operation.name} {change.entity_type.name} {change.entity_id}",
-                            exc_info=True,
-                        )
-                        failed_changes.append(change)
-                else:
+        strategy = self._strategies.get(change.operation)
+        try:
+            if strategy:
+                success = strategy.process(change)
+                if not success:
                     logger.error(
-                        f"No strategy found for operation type: {change.operation}",
+                        f"Failed to process change: {change.operation.name} {change.entity_type.name} {change.entity_id}",
                         exc_info=True,
                     )
-                    failed_changes.append(change)
-
-            except (Topic.DoesNotExist, Course.DoesNotExist, SubTopic.DoesNotExist):
+                    return False
+            else:
                 logger.error(
                     f"No strategy found for operation type: {change.operation}",
                     exc_info=True,
                 )
-                failed_changes.append(change)
+                return False
+
+        except (Topic.DoesNotExist, Course.DoesNotExist, SubTopic.DoesNotExist):
+            logger.error(
+                f"No strategy found for operation type: {change.operation}",
+                exc_info=True,
+            )
+            return False
+
+        return True
+
+
+class BulkChangeProcessor(ChangeProcessor):
+    """
+    Processes change operations in bulk, grouped by (operation, entity type).
+
+    Topic and subtopic changes of each group are applied with a handful of
+    queries (in_bulk lookups, bulk_create, bulk_update and filtered deletes)
+    instead of a few queries per change. Groups run in the same order the
+    diff engine emits them, and course-level changes fall back to the
+    per-change strategies. A change is reported as failed in the same cases
+    as with ChangeProcessor, e.g. when its entity or parent topic is missing.
+    """
+
+    BULK_BATCH_SIZE = 500
+
+    # Order in which grouped changes are applied, matching the diff engine order
+    GROUP_ORDER: Tuple[Tuple[OperationType, EntityType], ...] = (
+        (OperationType.DELETE, EntityType.TOPIC),
+        (OperationType.CREATE, EntityType.TOPIC),
+        (OperationType.UPDATE, EntityType.TOPIC),
+        (OperationType.DELETE, EntityType.SUBTOPIC),
+        (OperationType.CREATE, EntityType.SUBTOPIC),
+        (OperationType.UPDATE, EntityType.SUBTOPIC),
+    )
+
+    def __init__(
+        self,
+        course: Course,
+        examination_level: ExaminationLevel,
+        academic_class: AcademicClass,
+    ):
+        super().__init__(course, examination_level, academic_class)
+        self._course = course
+        self._examination_level = examination_level
+        self._academic_class = academic_class
+
+    @transaction.atomic
+    def process_changes(self, changes: List[ChangeOperation]) -> List[ChangeOperation]:
+        """
+        Process a list of change operations in bulk
+
+        Args:
+            changes: List of change operations to process
+
+        Returns:
+            List of failed change operations, in their original order
+
+        Raises:
+            InvalidChangeDataTypeError: If a subtopic CREATE carries the wrong data type
+        """
+        groups: Dict[Tuple[OperationType, EntityType], List[ChangeOperation]] = (
+            defaultdict(list)
+        )
+        failed_ids: Set[int] = set()
+
+        for change in changes:
+            key = (change.operation, change.entity_type)
+            if key in self.GROUP_ORDER:
+                groups[key].append(change)
+            elif not self._process_change(change):
+                failed_ids.add(id(change))
+
+        handlers = {
+            (OperationType.DELETE, EntityType.TOPIC): self._delete_topics,
+            (OperationType.CREATE, EntityType.TOPIC): self._create_topics,
+            (OperationType.UPDATE, EntityType.TOPIC): self._update_topics,
+            (OperationType.DELETE, EntityType.SUBTOPIC): self._delete_subtopics,
+            (OperationType.CREATE, EntityType.SUBTOPIC): self._create_subtopics,
+            (OperationType.UPDATE, EntityType.SUBTOPIC): self._update_subtopics,
+        }
+
+        for key in self.GROUP_ORDER:
+            group = groups.get(key)
+            if not group:
+                continue
 
-            except OperationalError:
-                logger.warning(
-                    "Database is probably locked. Need to fix this by hashing event types from webhooks"
+            logger.info(
+                "Processing %d %s %s changes in bulk",
+                len(group),
+                key[0].name,
+                key[1].name,
+            )
+            for change in handlers[key](group):
+                logger.error(
+                    "Failed to process change: %s %s %s",
+                    change.operation.name,
+                    change.entity_type.name,
+                    change.entity_id,
                 )
+                failed_ids.add(id(change))
 
-        return failed_changes
+        return [change for change in changes if id(change) in failed_ids]
+
+    @staticmethod
+    def _missing(
+        changes: Iterable[ChangeOperation], found_ids: Set[str]
+    ) -> List[ChangeOperation]:
+        return [change for change in changes if change.entity_id not in found_ids]
+
+    def _delete_topics(self, changes: List[ChangeOperation]) -> List[ChangeOperation]:
+        return self._delete(Topic, changes)
+
+    def _delete_subtopics(
+        self, changes: List[ChangeOperation]
+    ) -> List[ChangeOperation]:
+        return self._delete(SubTopic, changes)
+
+    def _delete(self, model, changes: List[ChangeOperation]) -> List[ChangeOperation]:
+        """Delete every existing entity of the group with a single query"""
+        block_ids = [change.entity_id for change in changes]
+        found_ids = set(
+            model.objects.filter(block_id__in=block_ids).values_list(
+                "block_id", flat=True
+            )
+        )
+        model.objects.filter(block_id__in=found_ids).delete()
+        return self._missing(changes, found_ids)
+
+    def _create_topics(self, changes: List[ChangeOperation]) -> List[ChangeOperation]:
+        """Create missing topics; topics that already exist are left untouched"""
+        Topic.objects.bulk_create(
+            [
+                Topic(
+                    block_id=change.entity_id,
+                    name=change.data.name,
+                    examination_level=self._examination_level,
+                    academic_class=self._academic_class,
+                    course=self._course,
+                )
+                for change in changes
+            ],
+            batch_size=self.BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        return []
+
+    def _create_subtopics(
+        self, changes: List[ChangeOperation]
+    ) -> List[ChangeOperation]:
+        """Create missing subtopics, resolving all parent topics with one query"""
+        for change in changes:
+            if not isinstance(change.data, SubTopicChangeData):
+                raise InvalidChangeDataTypeError(
+                    expected_type="SubTopicChangeData",
+                    actual_type=type(change.data).__name__,
+                    operation="creating a subtopic",
+                )
+
+        topics = Topic.objects.in_bulk(
+            {change.data.topic_id for change in changes}, field_name="block_id"
+        )
+
+        failed = []
+        subtopics = []
+        for change in changes:
+            topic = topics.get(change.data.topic_id)
+            if topic is None:
+                failed.append(change)
+                continue
+            subtopics.append(
+                SubTopic(block_id=change.entity_id, name=change.data.name, topic=topic)
+            )
+
+        SubTopic.objects.bulk_create(
+            subtopics, batch_size=self.BULK_BATCH_SIZE, ignore_conflicts=True
+        )
+        return failed
+
+    def _update_topics(self, changes: List[ChangeOperation]) -> List[ChangeOperation]:
+        return self._update_names(Topic, changes)
+
+    def _update_subtopics(
+        self, changes: List[ChangeOperation]
+    ) -> List[ChangeOperation]:
+        return self._update_names(SubTopic, changes)
+
+    def _update_names(
+        self, model, changes: List[ChangeOperation]
+    ) -> List[ChangeOperation]:
+        """Rename every existing entity of the group with one lookup and one bulk update"""
+        entities = model.objects.in_bulk(
+            [change.entity_id for change in changes], field_name="block_id"
+        )
+        for change in changes:
+            entity = entities.get(change.entity_id)
+            if entity is not None:
+                entity.name = change.data.name
+
+        model.objects.bulk_update(
+            entities.values(), ["name"], batch_size=self.BULK_BATCH_SIZE
+        )
+        return self._missing(changes, set(entities))
@@ -0,0 +1,176 @@
+"""
+course_sync.content_hash
+~~~~~~~~~~~~
+
+Merkle-style content hashes for course outlines (course -> topic -> subtopic),
+used to skip unchanged courses and to narrow a diff to the topics that changed.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Optional, Set
+
+from redis import Redis, RedisError
+
+from .data_types import CourseStructure, EdxCourseOutline, SubTopics, Topic
+
+log = logging.getLogger(__name__)
+
+_SEPARATOR = "\x1f"
+
+
+def _digest(*parts: Optional[str]) -> str:
+    payload = _SEPARATOR.join("" if part is None else part for part in parts)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class OutlineHashes:
+    """
+    Content hashes of a course outline.
+
+    Attributes:
+        root: Hash of the whole course, changes whenever anything in it changes
+        topics: Hash of each topic subtree, by topic ID
+    """
+
+    root: str
+    topics: Dict[str, str] = field(default_factory=dict)
+
+    def changed_topic_ids(self, other: "OutlineHashes") -> Set[str]:
+        """Topic IDs whose subtree differs between the two outlines, or exists in one only"""
+        return {
+            topic_id
+            for topic_id in self.topics.keys() | other.topics.keys()
+            if self.topics.get(topic_id) != other.topics.get(topic_id)
+        }
+
+
+def _sub_topic_hash(sub_topic: SubTopics, structure: CourseStructure) -> str:
+    # Structure membership is part of what the diff reads, so it is hashed too
+    return _digest(
+        sub_topic.id,
+        sub_topic.name,
+        sub_topic.topic_id,
+        "1" if sub_topic.id in structure.sub_topics else "0",
+        structure.topic_to_sub_topic.get(sub_topic.id),
+    )
+
+
+def _topic_hash(topic: Topic, structure: CourseStructure) -> str:
+    return _digest(
+        topic.id,
+        topic.name,
+        *(_sub_topic_hash(sub_topic, structure) for sub_topic in topic.sub_topics),
+    )
+
+
+def compute_outline_hashes(outline: EdxCourseOutline) -> OutlineHashes:
+    """
+    Hash every subtopic, then every topic from its subtopics, then the course.
+
+    Args:
+        outline: The course outline to hash
+
+    Returns:
+        The outline's root and per-topic hashes
+    """
+    structure = outline.structure
+    topic_hashes = {topic.id: _topic_hash(topic, structure) for topic in outline.topics}
+    # Structure entries that do not hang off a known topic only affect the root
+    orphaned_sub_topics = sorted(
+        f"{sub_topic_id}:{topic_id}"
+        for sub_topic_id, topic_id in structure.topic_to_sub_topic.items()
+        if topic_id not in topic_hashes
+    )
+    root = _digest(
+        outline.course_id,
+        outline.title,
+        *(f"{topic_id}:{digest}" for topic_id, digest in topic_hashes.items()),
+        *orphaned_sub_topics,
+    )
+    return OutlineHashes(root=root, topics=topic_hashes)
+
+
+def prune_outline(
+    outline: EdxCourseOutline, topic_ids: Iterable[str]
+) -> EdxCourseOutline:
+    """
+    Narrow an outline down to the given topics and their subtopics.
+
+    Outlines with subtopics that are not attached to a known topic are
+    returned unchanged, since they cannot be pruned safely.
+
+    Args:
+        outline: The full course outline
+        topic_ids: IDs of the topics to keep
+
+    Returns:
+        An outline containing only the kept topics
+    """
+    keep = set(topic_ids)
+    structure = outline.structure
+    known_topic_ids = {topic.id for topic in outline.topics}
+
+    if any(
+        structure.topic_to_sub_topic.get(sub_topic_id) not in known_topic_ids
+        for sub_topic_id in structure.sub_topics
+    ):
+        log.debug("Outline %s has orphaned subtopics, not pruning", outline.course_id)
+        return outline
+
+    topic_to_sub_topic = {
+        sub_topic_id: topic_id
+        for sub_topic_id, topic_id in structure.topic_to_sub_topic.items()
+        if topic_id in keep
+    }
+    return EdxCourseOutline(
+        course_id=outline.course_id,
+        title=outline.title,
+        structure=CourseStructure(
+            topics=structure.topics & keep,
+            sub_topics={
+                sub_topic_id
+                for sub_topic_id in structure.sub_topics
+                if sub_topic_id in topic_to_sub_topic
+            },
+            topic_to_sub_topic=topic_to_sub_topic,
+        ),
+        topics=[topic for topic in outline.topics if topic.id in keep],
+    )
+
+
+class OutlineHashStore:
+    """
+    Stores the hashes of the last successfully synced outline of each course in Redis.
+
+    Redis failures are logged and treated as a missing entry, which falls
+    back to a full diff.
+    """
+
+    KEY_PREFIX = "course_outline_hashes:v1"
+
+    def __init__(self, redis_client: Redis) -> None:
+        self._redis_client = redis_client
+
+    def get(self, course_key: str) -> Optional[OutlineHashes]:
+        try:
+            payload = self._redis_client.get(self._key(course_key))
+        except RedisError as e:
+            log.warning("Failed to read outline hashes for %s: %s", course_key, e)
+            return None
+
+        if payload is None:
+            return None
+        return OutlineHashes(**json.loads(payload))
+
+    def set(self, course_key: str, hashes: OutlineHashes) -> None:
+        try:
+            self._redis_client.set(self._key(course_key), json.dumps(asdict(hashes)))
+        except RedisError as e:
+            log.warning("Failed to store outline hashes for %s: %s", course_key, e)
+
+    def _key(self, course_key: str) -> str:
+        return f"{self.KEY_PREFIX}:{course_key}"
@@ -8,14 +8,20 @@ the DiffEngine and ChangeProcessor to synchronize course content.
 
 import logging
 from collections import namedtuple
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple, Type
 
 from src.apps.core.courses.models import (AcademicClass, Course,
                                           ExaminationLevel)
+from src.library.resource_context_cache import \
+    invalidate_resource_context_cache
+from src.repository.question_repository.cache.cached_repo import \
+    invalidate_question_cache
 
-from .change_processor import ChangeProcessor
+from .change_processor import BulkChangeProcessor, ChangeProcessor
+from .content_hash import (OutlineHashes, OutlineHashStore,
+                           compute_outline_hashes, prune_outline)
 from .data_transformer import EdxDataTransformer
-from .data_types import ChangeOperation, EdxCourseOutline
+from .data_types import ChangeOperation, CourseChangeData, EdxCourseOutline
 from .diff_engine import DiffEngine
 
 log = logging.getLogger(__name__)
@@ -23,6 +29,12 @@ log = logging.getLogger(__name__)
 ChangeResult = namedtuple("ChangeResult", ["num_failed", "num_success"])
 
 
+def invalidate_course_caches(course_key: str) -> None:
+    """Drop cached questions and resource contexts of a synced course"""
+    invalidate_question_cache(course_key)
+    invalidate_resource_context_cache(course_key)
+
+
 class CourseSyncService:
     """
     Service that orchestrates the course synchronization process.
@@ -31,8 +43,28 @@ class CourseSyncService:
     the application of those changes using ChangeProcessor.
     """
 
-    def __init__(self, diff_engine: DiffEngine):
+    def __init__(
+        self,
+        diff_engine: DiffEngine,
+        question_cache_invalidator: Optional[Callable[[str], None]] = None,
+        outline_hash_store: Optional[OutlineHashStore] = None,
+        change_processor_class: Optional[Type[ChangeProcessor]] = None,
+    ):
+        """
+        Args:
+            diff_engine: Engine used to detect outline changes
+            question_cache_invalidator: Called with the course key after changes
+                are applied so cached questions for the course are dropped
+            outline_hash_store: Hashes of the last synced outline per course; when
+                set, unchanged courses are skipped and diffs only cover the
+                topics whose content hash changed
+            change_processor_class: Processor used to apply the changes,
+                defaults to the per-change ChangeProcessor
+        """
         self.diff_engine = diff_engine
+        self.question_cache_invalidator = question_cache_invalidator
+        self.outline_hash_store = outline_hash_store
+        self.change_processor_class = change_processor_class
 
     def sync_course(
         self,
@@ -45,6 +77,10 @@ class CourseSyncService:
         Synchronizes a course by detecting changes between the existing course
         outline and the new course outline, then applying those changes.
 
+        This applies every change in the calling process. Course change
+        webhooks should use tasks.submit_course_sync instead, which debounces
+        the event and runs the resumable pipeline on Celery.
+
         Args:
             new_course_outline: The new course outline from edX
             course: The existing course in the database
@@ -61,36 +97,103 @@ class CourseSyncService:
             academic_class.name,
         )
 
+        changes, new_hashes = self.detect_course_changes(new_course_outline, course)
+        if not changes:
+            self._store_outline_hashes(course.course_key, new_hashes)
+            return ChangeResult(num_failed=0, num_success=0)
+
+        failed_changes = self.apply_changes(
+            changes, course, examination_level, academic_class
+        )
+
+        return self.complete_sync(
+            course,
+            new_hashes,
+            num_success=len(changes) - len(failed_changes),
+            num_failed=len(failed_changes),
+        )
+
+    def detect_course_changes(
+        self, new_course_outline: EdxCourseOutline, course: Course
+    ) -> Tuple[List[ChangeOperation], Optional[OutlineHashes]]:
+        """
+        Detects the changes needed to bring a course up to date with a new outline.
+
+        Args:
+            new_course_outline: The new course outline from edX
+            course: The existing course in the database
+
+        Returns:
+            The change operations, empty if nothing changed, and the hashes of
+            the new outline to store once the changes are applied (None when
+            there is no hash store or the outline is already up to date)
+        """
+        new_hashes = stored_hashes = None
+        if self.outline_hash_store is not None:
+            new_hashes = compute_outline_hashes(new_course_outline)
+            stored_hashes = self.outline_hash_store.get(course.course_key)
+            if stored_hashes is not None and stored_hashes.root == new_hashes.root:
+                log.info("Course outline unchanged for course ID: %s", course.id)
+                return [], None
+
         old_course_outline = EdxDataTransformer.transform_to_course_outline(
             structure=course.course_outline,
             course_id=course.course_key,
             title=course.name,
         )
 
-        changes = self._detect_changes(old_course_outline, new_course_outline)
+        if new_hashes is None:
+            changes = self._detect_changes(old_course_outline, new_course_outline)
+        else:
+            changes = self._detect_changed_subtrees(
+                old_course_outline,
+                new_course_outline,
+                stored_hashes or compute_outline_hashes(old_course_outline),
+                new_hashes,
+            )
 
         if not changes:
             log.info("No changes detected for course ID: %s", course.id)
-            return ChangeResult(num_failed=0, num_success=0)
+        else:
+            log.info("Detected %d changes for course ID: %s", len(changes), course.id)
+        return changes, new_hashes
 
-        log.info("Detected %d changes for course ID: %s", len(changes), course.id)
+    def complete_sync(
+        self,
+        course: Course,
+        new_hashes: Optional[OutlineHashes],
+        num_success: int,
+        num_failed: int,
+    ) -> ChangeResult:
+        """
+        Records the outcome of applying a course's changes.
 
-        failed_changes = self._process_changes(
-            changes, course, examination_level, academic_class
-        )
+        The new outline hashes are only stored when every change succeeded, so
+        a partially applied outline is diffed again on the next sync.
+
+        Args:
+            course: The synchronized course
+            new_hashes: Hashes of the new outline, if any
+            num_success: Number of changes applied
+            num_failed: Number of changes that failed
+
+        Returns:
+            The sync result
+        """
+        if not num_failed:
+            self._store_outline_hashes(course.course_key, new_hashes)
 
-        successful_changes = len(changes) - len(failed_changes)
+        if num_success and self.question_cache_invalidator:
+            self.question_cache_invalidator(course.course_key)
 
         log.info(
             "Course sync completed for course ID: %s - %d changes applied, %d changes failed",
             course.id,
-            successful_changes,
-            len(failed_changes),
+            num_success,
+            num_failed,
         )
 
-        return ChangeResult(
-            num_failed=len(failed_changes), num_success=successful_changes
-        )
+        return ChangeResult(num_failed=num_failed, num_success=num_success)
 
     def _detect_changes(
         self,
@@ -110,15 +213,63 @@ class CourseSyncService:
         log.info("Detecting changes for course ID: %s", new_course_outline.course_id)
         return self.diff_engine.diff(old_course_outline, new_course_outline)
 
-    @staticmethod
-    def _process_changes(
+    def _detect_changed_subtrees(
+        self,
+        old_course_outline: EdxCourseOutline,
+        new_course_outline: EdxCourseOutline,
+        old_hashes: OutlineHashes,
+        new_hashes: OutlineHashes,
+    ) -> List[ChangeOperation]:
+        """
+        Detects changes, diffing only the topics whose content hash changed.
+
+        Args:
+            old_course_outline: The existing course outline
+            new_course_outline: The new course outline
+            old_hashes: Hashes of the last synced outline
+            new_hashes: Hashes of the new outline
+
+        Returns:
+            List of change operations
+        """
+        if old_hashes.root == new_hashes.root:
+            return []
+
+        changed_topic_ids = new_hashes.changed_topic_ids(old_hashes)
+        log.info(
+            "Diffing %d changed topics out of %d for course ID: %s",
+            len(changed_topic_ids),
+            len(new_hashes.topics),
+            new_course_outline.course_id,
+        )
+
+        changes = self._detect_changes(
+            prune_outline(old_course_outline, changed_topic_ids),
+            prune_outline(new_course_outline, changed_topic_ids),
+        )
+
+        # Course-level changes carry the outline to store, which must be the full one
+        for change in changes:
+            if isinstance(change.data, CourseChangeData):
+                change.data.course_outline = new_course_outline
+
+        return changes
+
+    def _store_outline_hashes(
+        self, course_key: str, hashes: Optional[OutlineHashes]
+    ) -> None:
+        if self.outline_hash_store is not None and hashes is not None:
+            self.outline_hash_store.set(course_key, hashes)
+
+    def apply_changes(
+        self,
         changes: List[ChangeOperation],
         course: Course,
         examination_level: ExaminationLevel,
         academic_class: AcademicClass,
     ) -> List[ChangeOperation]:
         """
-        Processes the detected changes using the ChangeProcessor.
+        Applies change operations in one transaction using the ChangeProcessor.
 
         Args:
             changes: List of change operations
@@ -131,7 +282,8 @@ class CourseSyncService:
         """
         log.info("Processing %d changes for course ID: %s", len(changes), course.id)
 
-        change_processor = ChangeProcessor(
+        change_processor_class = self.change_processor_class or ChangeProcessor
+        change_processor = change_processor_class(
             course=course,
             examination_level=examination_level,
             academic_class=academic_class,
@@ -141,4 +293,11 @@ class CourseSyncService:
 
     @classmethod
     def create_service(cls):
-        return CourseSyncService(diff_engine=DiffEngine())
+        from src.config.settings.redis import REDIS_CLIENT
+
+        return CourseSyncService(
+            diff_engine=DiffEngine(),
+            question_cache_invalidator=invalidate_course_caches,
+            outline_hash_store=OutlineHashStore(REDIS_CLIENT),
+            change_processor_class=BulkChangeProcessor,
+        )
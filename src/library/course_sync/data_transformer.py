@@ -7,12 +7,15 @@ into our domain model objects for processing
 """
 
 import logging
-from typing import Dict, List
+from typing import IO, Dict, Iterable, List, Tuple
 
 from .data_types import CourseStructure, EdxCourseOutline, SubTopics, Topic
 
 log = logging.getLogger(__name__)
 
+# ijson prefix of the topic nodes inside a raw edX course structure document
+TOPICS_JSON_PREFIX = "course_structure.child_info.children.item"
+
 
 class EdxDataTransformer:
     """Responsible for transforming edX course data into our domain model"""
@@ -27,64 +30,130 @@ class EdxDataTransformer:
         Returns:
            course structure(CourseStructure): transformed edX course structure
         """
+        course_structure, _ = EdxDataTransformer._transform_topic_nodes(
+            EdxDataTransformer._topic_nodes(structure), include_topics=False
+        )
+        return course_structure
+
+    @staticmethod
+    def transform_topics(structure: Dict) -> List[Topic]:
+        _, topics = EdxDataTransformer._transform_topic_nodes(
+            EdxDataTransformer._topic_nodes(structure)
+        )
+        return topics
+
+    @staticmethod
+    def transform_to_course_outline(
+        structure: Dict, course_id: str, title: str
+    ) -> EdxCourseOutline:
+        """Transforms the raw edX data into a complete EdxCourseOutline"""
+        course_structure, topics = EdxDataTransformer._transform_topic_nodes(
+            EdxDataTransformer._topic_nodes(structure)
+        )
+
+        return EdxCourseOutline(
+            course_id=course_id, title=title, structure=course_structure, topics=topics
+        )
+
+    @staticmethod
+    def transform_stream_to_course_outline(
+        source: IO[bytes], course_id: str, title: str
+    ) -> EdxCourseOutline:
+        """
+        Transforms a raw edX course structure JSON stream into an EdxCourseOutline.
+
+        The JSON is parsed incrementally and only one topic node is held in
+        memory at a time, so large webhook bodies are never materialized as a
+        whole dict. ijson is only imported here, so the dict transform does not
+        pay for it.
+
+        Args:
+            source: Binary file-like object containing the raw edX JSON
+            course_id: Course ID for the outline
+            title: Course title for the outline
+
+        Returns:
+            The transformed course outline
+
+        Raises:
+            ImportError: If ijson is not installed
+        """
+        try:
+            import ijson
+        except ImportError as e:
+            raise ImportError(
+                "Streaming course outlines requires the 'ijson' package"
+            ) from e
+
+        course_structure, topics = EdxDataTransformer._transform_topic_nodes(
+            ijson.items(source, TOPICS_JSON_PREFIX)
+        )
+
+        return EdxCourseOutline(
+            course_id=course_id, title=title, structure=course_structure, topics=topics
+        )
+
+    @staticmethod
+    def _topic_nodes(structure: Dict) -> List[Dict]:
+        course_data = structure.get("course_structure", {})
+        return course_data.get("child_info", {}).get("children", [])
+
+    @staticmethod
+    def _transform_topic_nodes(
+        topic_nodes: Iterable[Dict], include_topics: bool = True
+    ) -> Tuple[CourseStructure, List[Topic]]:
+        """
+        Builds the ID sets, the sub_topic mapping and the topic list in one pass.
+
+        Args:
+            topic_nodes: Raw edX topic nodes, in course order
+            include_topics: Whether to build the topic list as well
+
+        Returns:
+            The course structure and the list of topics
+        """
         topics_set = set()
         sub_topics_set = set()
         topic_to_sub_topic = {}
+        topics = []
+
+        for topic_data in topic_nodes:
+            topic_id = topic_data.get("id")
+            sub_topic_nodes = topic_data.get("child_info", {}).get("children", [])
 
-        course_data = structure.get("course_structure", {})
-        for topic in course_data.get("child_info", {}).get("children", []):
-            topic_id = topic.get("id")
             if topic_id:
                 topics_set.add(topic_id)
 
-            if topic.get("has_children"):
-                for sub_topic in topic.get("child_info", {}).get("children", []):
-                    sub_topic_id = sub_topic.get("id")
+            # Only topics flagged as having children contribute to the structure
+            if topic_data.get("has_children"):
+                for sub_topic_data in sub_topic_nodes:
+                    sub_topic_id = sub_topic_data.get("id")
                     if sub_topic_id:
                         sub_topics_set.add(sub_topic_id)
                         topic_to_sub_topic[sub_topic_id] = topic_id
 
-        return CourseStructure(topics_set, sub_topics_set, topic_to_sub_topic)
-
-    @staticmethod
-    def transform_topics(structure: Dict) -> List[Topic]:
-        topics = []
-        course_data = structure.get("course_structure", {})
-
-        for topic_data in course_data.get("child_info", {}).get("children", []):
-            if topic_data.get("id"):
-                # Transform sub_topics for this topic
-                sub_topics = []
-                for sub_topic_data in topic_data.get("child_info", {}).get(
-                    "children", []
-                ):
-                    if sub_topic_data.get("id"):
-                        sub_topics.append(
-                            SubTopics(
-                                id=sub_topic_data["id"],
-                                name=sub_topic_data["display_name"],
-                                topic_id=topic_data["id"],
-                            )
-                        )
-
-                # Create the Topic object
+            if topic_id and include_topics:
+                sub_topics = [
+                    SubTopics(
+                        id=sub_topic_data["id"],
+                        name=sub_topic_data["display_name"],
+                        topic_id=topic_id,
+                    )
+                    for sub_topic_data in sub_topic_nodes
+                    if sub_topic_data.get("id")
+                ]
                 topics.append(
                     Topic(
-                        id=topic_data["id"],
+                        id=topic_id,
                         name=topic_data["display_name"],
                         sub_topics=sub_topics,
                     )
                 )
-        return topics
-
-    @staticmethod
-    def transform_to_course_outline(
-        structure: Dict, course_id: str, title: str
-    ) -> EdxCourseOutline:
-        """Transforms the raw edX data into a complete EdxCourseOutline"""
-        course_structure = EdxDataTransformer.transform_structure(structure)
-        topics = EdxDataTransformer.transform_topics(structure)
 
-        return EdxCourseOutline(
-            course_id=course_id, title=title, structure=course_structure, topics=topics
+        log.debug(
+            "Transformed %d topics and %d sub_topics", len(topics), len(sub_topics_set)
+        )
+        return (
+            CourseStructure(topics_set, sub_topics_set, topic_to_sub_topic),
+            topics,
         )
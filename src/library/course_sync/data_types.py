@@ -44,19 +44,35 @@ class CourseStructure:
 
 @dataclass
 class EdxCourseOutline:
-    """Top-level representation of the complete edX course outline"""
+    """
+    Top-level representation of the complete edX course outline
+
+    ID lookups go through indexes that are built on first use, so the
+    outline must not be modified once it has been queried.
+    """
 
     course_id: str
     title: str
     structure: CourseStructure
     topics: List[Topic] = field(default_factory=list)
+    _topics_by_id: Optional[Dict[str, Topic]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sub_topics_by_id: Optional[Dict[str, SubTopics]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_topic_by_id(self, topic_id: str) -> Optional[Topic]:
         """Retrieves a specific topic by its ID"""
-        for topic in self.topics:
-            if topic.id == topic_id:
-                return topic
-        return None
+        if self._topics_by_id is None:
+            self._build_indexes()
+        return self._topics_by_id.get(topic_id)
+
+    def get_sub_topic_by_id(self, sub_topic_id: str) -> Optional[SubTopics]:
+        """Retrieves a specific sub_topic by its ID, whichever topic it belongs to"""
+        if self._sub_topics_by_id is None:
+            self._build_indexes()
+        return self._sub_topics_by_id.get(sub_topic_id)
 
     def get_sub_topics_by_topic_id(self, topic_id: str) -> List[SubTopics]:
         """Retrieves all sub_topics for a specific topic_id"""
@@ -69,6 +85,18 @@ class EdxCourseOutline:
             if obj.id
         ]
 
+    def _build_indexes(self) -> None:
+        """Index topics and sub_topics by ID, keeping the first occurrence of an ID"""
+        topics_by_id: Dict[str, Topic] = {}
+        sub_topics_by_id: Dict[str, SubTopics] = {}
+        for topic in self.topics:
+            topics_by_id.setdefault(topic.id, topic)
+            for sub_topic in topic.sub_topics:
+                sub_topics_by_id.setdefault(sub_topic.id, sub_topic)
+
+        self._topics_by_id = topics_by_id
+        self._sub_topics_by_id = sub_topics_by_id
+
 
 class OperationType(Enum):
     """Operation types"""
@@ -0,0 +1,204 @@
+"""
+course_sync.debounce
+~~~~~~~~~~~~
+
+Debounces course change events: events for a course are collapsed within a
+window, using a Redis sorted set of course keys scored by their due time as
+the delay queue, and only the latest outline of each course is synced.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+from redis import Redis
+
+log = logging.getLogger(__name__)
+
+# Stores the latest payload and (re)schedules the course. The due time moves
+# with every event, but never past first event + max delay. Also returns
+# whether the course needs a flush scheduled: it was not queued yet, or it is
+# overdue, i.e. its flush gave up.
+_SUBMIT_SCRIPT = """
+local previous = redis.call('ZSCORE', KEYS[1], ARGV[1])
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+redis.call('HSETNX', KEYS[3], ARGV[1], ARGV[3])
+local first_seen = tonumber(redis.call('HGET', KEYS[3], ARGV[1]))
+local due = math.min(tonumber(ARGV[3]) + tonumber(ARGV[4]), first_seen + tonumber(ARGV[5]))
+redis.call('ZADD', KEYS[1], due, ARGV[1])
+local schedule = (not previous) or tonumber(previous) <= tonumber(ARGV[3])
+return {tostring(due), schedule and 1 or 0}
+"""
+
+# Leases a due course to one consumer by moving its due time to the end of the
+# lease; the payload is kept until the consumer acknowledges it
+_CLAIM_SCRIPT = """
+local due = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if not due then
+    return false
+end
+if tonumber(due) > tonumber(ARGV[2]) then
+    return {due}
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+return {due, redis.call('HGET', KEYS[2], ARGV[1])}
+"""
+
+# Removes a claimed course, unless a newer event replaced its payload meanwhile
+_ACK_SCRIPT = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+    return redis.call('ZSCORE', KEYS[1], ARGV[1])
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[3], ARGV[1])
+return false
+"""
+
+
+class Submission(NamedTuple):
+    """Outcome of submitting a change event"""
+
+    due: float
+    # Whether the caller must schedule a flush for the course, as no flush is
+    # pending for it yet
+    schedule_flush: bool
+
+
+class Claim(NamedTuple):
+    """Outcome of claiming a course; payload is None if it was not due"""
+
+    due: Optional[float] = None
+    payload: Optional[Dict[str, Any]] = None
+    # Raw payload, passed back to ack
+    token: Optional[str] = None
+
+
+class CourseSyncDebouncer:
+    """
+    Delay queue collapsing course change events per course key.
+
+    Every event replaces the pending payload of its course and pushes the
+    course's due time to window_seconds from now, capped at max_delay_seconds
+    after the first pending event, so a course being edited continuously is
+    still synced regularly.
+
+    A due course is claimed with a lease and only removed once its consumer
+    acknowledges it, so a consumer that fails leaves the course to be claimed
+    again when the lease expires.
+    """
+
+    KEY_PREFIX = "course_sync:debounce:v1"
+    DEFAULT_WINDOW_SECONDS = 30
+    DEFAULT_MAX_DELAY_SECONDS = 5 * 60
+    DEFAULT_LEASE_SECONDS = 60
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        self._redis_client = redis_client
+        self.window_seconds = window_seconds
+        self.max_delay_seconds = max(max_delay_seconds, window_seconds)
+        self.lease_seconds = lease_seconds
+        self._keys = [
+            f"{self.KEY_PREFIX}:queue",
+            f"{self.KEY_PREFIX}:payloads",
+            f"{self.KEY_PREFIX}:first_seen",
+        ]
+        self._submit_script = redis_client.register_script(_SUBMIT_SCRIPT)
+        self._claim_script = redis_client.register_script(_CLAIM_SCRIPT)
+        self._ack_script = redis_client.register_script(_ACK_SCRIPT)
+
+    def submit(
+        self, course_key: str, payload: Dict[str, Any], now: Optional[float] = None
+    ) -> Submission:
+        """
+        Record a change event for a course.
+
+        Args:
+            course_key: The course the event belongs to
+            payload: JSON-serializable event data, replacing any pending one
+            now: Current timestamp, defaults to the current time
+
+        Returns:
+            When the course becomes due, and whether a flush must be scheduled
+        """
+        now = time.time() if now is None else now
+        due, schedule_flush = self._submit_script(
+            keys=self._keys,
+            args=[
+                course_key,
+                json.dumps(payload),
+                now,
+                self.window_seconds,
+                self.max_delay_seconds,
+            ],
+        )
+        log.debug("Course %s sync due at %s", course_key, due)
+        return Submission(due=float(due), schedule_flush=bool(schedule_flush))
+
+    def claim(self, course_key: str, now: Optional[float] = None) -> Claim:
+        """
+        Claim the pending payload of a course if it is due.
+
+        Args:
+            course_key: The course to claim
+            now: Current timestamp, defaults to the current time
+
+        Returns:
+            The claimed payload; or, if the course is not due yet, only its due
+            time; or an empty claim if nothing is pending for the course
+        """
+        now = time.time() if now is None else now
+        result = self._claim_script(
+            keys=self._keys, args=[course_key, now, now + self.lease_seconds]
+        )
+        if not result:
+            return Claim()
+        if len(result) == 1:
+            return Claim(due=float(result[0]))
+
+        token = result[1]
+        log.info("Claimed debounced course sync of %s", course_key)
+        return Claim(due=float(result[0]), payload=json.loads(token), token=token)
+
+    def ack(self, course_key: str, claim: Claim) -> Optional[float]:
+        """
+        Remove a claimed course once its payload was handled.
+
+        Args:
+            course_key: The claimed course
+            claim: The claim returned by claim
+
+        Returns:
+            None, or the due time of a newer event that arrived meanwhile and
+            is left pending
+        """
+        due = self._ack_script(keys=self._keys, args=[course_key, claim.token])
+        return None if due is None else float(due)
+
+    def pending_count(self) -> int:
+        return self._redis_client.zcard(self._keys[0])
+
+    @classmethod
+    def create_debouncer(cls):
+        from django.conf import settings
+
+        from src.config.settings.redis import REDIS_CLIENT
+
+        return CourseSyncDebouncer(
+            redis_client=REDIS_CLIENT,
+            window_seconds=getattr(
+                settings, "COURSE_SYNC_DEBOUNCE_SECONDS", cls.DEFAULT_WINDOW_SECONDS
+            ),
+            max_delay_seconds=getattr(
+                settings,
+                "COURSE_SYNC_MAX_DELAY_SECONDS",
+                cls.DEFAULT_MAX_DELAY_SECONDS,
+            ),
+        )
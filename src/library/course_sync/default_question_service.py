@@ -1,5 +1,6 @@
 import logging
-from typing import Optional, Type, TypedDict
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Type, TypedDict
 
 from asgiref.sync import async_to_sync
 from django.core.exceptions import ObjectDoesNotExist
@@ -20,6 +21,8 @@ class QuestionId(TypedDict):
 class DefaultQuestionService:
     """Service for handling default question sets for a given Learning Objective"""
 
+    BULK_BATCH_SIZE = 500
+
     def __init__(
         self,
         question_repo: Type[MongoQuestionRepository] = MongoQuestionRepository,
@@ -117,3 +120,110 @@ class DefaultQuestionService:
                 f"learning objective ID {objective.id}: {str(e)}"
             )
             raise
+
+    def process_default_questions(
+        self, objectives: Iterable[LearningObjective], collection_name: str
+    ) -> List[DefaultQuestionSet]:
+        """
+        Creates or updates the default question sets of many learning objectives at once.
+
+        All categories are resolved with one query, questions for all of them are
+        fetched with a single Mongo `$in` query, and every DefaultQuestionSet is
+        upserted with one bulk insert. Objectives without a QuestionCategory are
+        logged and skipped instead of failing the whole batch.
+
+        Args:
+            objectives (Iterable[LearningObjective]): Learning objectives to process
+            collection_name (str): NoSQL document collection name to query for questions
+
+        Returns:
+            List[DefaultQuestionSet]: The created or updated DefaultQuestionSet objects,
+                                      in the order of the objectives
+        """
+        objectives = list(objectives)
+        if not objectives:
+            return []
+
+        logger.info(
+            "Processing default questions for %d objectives in %s",
+            len(objectives),
+            collection_name,
+        )
+
+        categories_by_objective_id = {
+            category.learning_objective_id: category
+            for category in QuestionCategory.objects.filter(
+                learning_objective__in=objectives
+            )
+        }
+
+        missing = [
+            objective.id
+            for objective in objectives
+            if objective.id not in categories_by_objective_id
+        ]
+        if missing:
+            logger.error(
+                "Question category not found for learning objective IDs %s", missing
+            )
+        if not categories_by_objective_id:
+            return []
+
+        # Queried as stored, like process_default_question does; only the
+        # grouping below compares them as strings
+        category_ids = list(
+            dict.fromkeys(
+                category.category_id for category in categories_by_objective_id.values()
+            )
+        )
+        question_collection = async_to_sync(
+            self._question_repo.get_question_by_custom_query
+        )(
+            collection_name=collection_name,
+            query={"category_id": {"$in": category_ids}},
+        )
+
+        question_ids_by_category: Dict[str, List[QuestionId]] = defaultdict(list)
+        for question in question_collection:
+            question_ids_by_category[str(question.category_id)].append(
+                QuestionId(id=str(question.id))
+            )
+
+        default_question_sets = []
+        for objective in objectives:
+            category = categories_by_objective_id.get(objective.id)
+            if category is None:
+                continue
+
+            question_list_ids = question_ids_by_category.get(
+                str(category.category_id), []
+            )
+            if not question_list_ids:
+                logger.warning(
+                    "No questions found for category '%s'. "
+                    "Check if questions exist in collection '%s'.",
+                    category.category_id,
+                    collection_name,
+                )
+
+            default_question_sets.append(
+                DefaultQuestionSet(
+                    learning_objective=objective, question_list_ids=question_list_ids
+                )
+            )
+
+        default_question_sets = DefaultQuestionSet.objects.bulk_create(
+            default_question_sets,
+            batch_size=self.BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["learning_objective"],
+            update_fields=["question_list_ids"],
+        )
+
+        logger.info(
+            "Upserted %d default question sets with %d questions from %d categories",
+            len(default_question_sets),
+            len(question_collection),
+            len(category_ids),
+        )
+        return default_question_sets
@@ -8,8 +8,10 @@ edx course outline, implemented using Chain of Responsibility pattern
 
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from dataclasses import replace
 from functools import wraps
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from .data_types import (ChangeOperation, CourseChangeData, EdxCourseOutline,
                          EntityType, OperationType, SubTopicChangeData)
@@ -221,6 +223,35 @@ class SubtopicDiffHandler(BaseDiffHandler):
         log.debug("SubtopicDiffHandler: New subtopic IDs: %s", new_subtopic_ids)
 
         # Handle deleted subtopics
+        changes.extend(
+            self._handle_deleted_subtopics(old_subtopic_ids, new_subtopic_ids)
+        )
+
+        # Handle created or updated subtopics
+        changes.extend(
+            self._handle_created_or_updated_subtopics(old_course, new_course)
+        )
+
+        log.debug(
+            "SubtopicDiffHandler: Completed subtopic diff with %d changes", len(changes)
+        )
+        return changes
+
+    def _handle_deleted_subtopics(
+        self, old_subtopic_ids: set, new_subtopic_ids: set
+    ) -> List[ChangeOperation]:
+        """
+        Process subtopics that have been deleted.
+
+        Args:
+            old_subtopic_ids: Set of subtopic IDs from the old course
+            new_subtopic_ids: Set of subtopic IDs from the new course
+
+        Returns:
+            List of DELETE change operations
+        """
+        changes = []
+
         deleted_subtopics = old_subtopic_ids - new_subtopic_ids
         log.debug(
             "SubtopicDiffHandler: Found %d deleted subtopics", len(deleted_subtopics)
@@ -241,6 +272,24 @@ class SubtopicDiffHandler(BaseDiffHandler):
                 )
             )
 
+        return changes
+
+    def _handle_created_or_updated_subtopics(
+        self, old_course: EdxCourseOutline, new_course: EdxCourseOutline
+    ) -> List[ChangeOperation]:
+        """
+        Process subtopics of the new course's topics that have been created or updated.
+
+        Args:
+            old_course: The original course
+            new_course: The new course
+
+        Returns:
+            List of CREATE and UPDATE change operations
+        """
+        changes = []
+        old_subtopic_ids = old_course.structure.sub_topics
+
         # Process created and updated subtopics by comparing across all topics
         log.debug("SubtopicDiffHandler: Checking for created and updated subtopics")
         for new_topic in new_course.topics:
@@ -261,66 +310,15 @@ class SubtopicDiffHandler(BaseDiffHandler):
                     new_subtopic.name,
                 )
 
-                # Find if this subtopic existed in the old course
-                old_subtopic = None
-                old_topic_id = None
-
-                # First check if we can find it using the mapping
-                if new_subtopic.id in old_course.structure.topic_to_sub_topic:
-                    old_topic_id = old_course.structure.topic_to_sub_topic.get(
-                        new_subtopic.id
-                    )
+                # Find if this subtopic existed in the old course, under any topic
+                old_subtopic = old_course.get_sub_topic_by_id(new_subtopic.id)
+                if old_subtopic:
                     log.debug(
-                        "SubtopicDiffHandler: Found subtopic %s in mapping with parent topic %s",
+                        "SubtopicDiffHandler: Found subtopic %s in topic %s",
                         new_subtopic.id,
-                        old_topic_id,
+                        old_subtopic.topic_id,
                     )
 
-                    if old_topic_id:
-                        old_topic = old_course.get_topic_by_id(old_topic_id)
-                        if old_topic:
-                            log.debug(
-                                "SubtopicDiffHandler: Found parent topic %s (%s)",
-                                old_topic.id,
-                                old_topic.name,
-                            )
-                            old_subtopic = next(
-                                (
-                                    sub
-                                    for sub in old_topic.sub_topics
-                                    if sub.id == new_subtopic.id
-                                ),
-                                None,
-                            )
-                            if old_subtopic:
-                                log.debug(
-                                    "SubtopicDiffHandler: Found subtopic %s in expected topic",
-                                    new_subtopic.id,
-                                )
-
-                # If we couldn't find it in the expected topic, search all topics
-                if not old_subtopic:
-                    log.debug(
-                        "SubtopicDiffHandler: Subtopic not found in expected topic, searching all topics"
-                    )
-                    for topic in old_course.topics:
-                        old_subtopic = next(
-                            (
-                                sub
-                                for sub in topic.sub_topics
-                                if sub.id == new_subtopic.id
-                            ),
-                            None,
-                        )
-                        if old_subtopic:
-                            old_topic_id = topic.id
-                            log.debug(
-                                "SubtopicDiffHandler: Found subtopic %s in topic %s",
-                                new_subtopic.id,
-                                old_topic_id,
-                            )
-                            break
-
                 if old_subtopic is None or new_subtopic.id not in old_subtopic_ids:
                     # This is a new subtopic
                     log.info("New subtopic detected: %s", new_subtopic.id)
@@ -371,9 +369,6 @@ class SubtopicDiffHandler(BaseDiffHandler):
                             )
                         )
 
-        log.debug(
-            "SubtopicDiffHandler: Completed subtopic diff with %d changes", len(changes)
-        )
         return changes
 
 
@@ -504,9 +499,7 @@ class TopicDiffHandler(BaseDiffHandler):
             log.debug(
                 "TopicDiffHandler: Checking topic %s (%s)", new_topic.id, new_topic.name
             )
-            old_topic = next(
-                (topic for topic in old_course.topics if topic.id == new_topic.id), None
-            )
+            old_topic = old_course.get_topic_by_id(new_topic.id)
 
             if old_topic is None:
                 # Handle newly created topics
@@ -619,14 +612,39 @@ def validate_handlers(func):
     return wrapper
 
 
+DiffTask = Tuple[Callable[..., List[ChangeOperation]], tuple]
+
+
 class DiffEngine:
     """
     Detect differences between course outline versions and generate change operations.
     Implements Chain of Responsibility pattern.
+
+    With an executor, the diff steps of the handlers run independently instead
+    of as a serial chain: course, topic and subtopic diffs only read the two
+    immutable outlines, and created/updated topics and subtopics can further
+    be split into partitions of the new course's topics. Results are merged in
+    the order the chain produces them, so both modes return the same changes.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        topic_partition_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            executor: Executor to fan the diff steps out to; diffs run as a
+                serial chain when not set
+            topic_partition_size: Number of new course topics per created/updated
+                diff task, all topics go to a single task when not set
+        """
         log.debug("DiffEngine: Initializing")
+        if topic_partition_size is not None and topic_partition_size < 1:
+            raise ValueError("topic_partition_size must be a positive integer")
+
+        self.executor = executor
+        self.topic_partition_size = topic_partition_size
         # Initialize the chain
         self.chain = self._create_handler_chain()
         log.debug("DiffEngine: Handler chain created")
@@ -646,6 +664,9 @@ class DiffEngine:
         topic_handler = topic_handler()
 
         log.debug("DiffEngine: Instantiated handlers")
+        self._course_handler = course_handler
+        self._subtopic_handler = subtopic_handler
+        self._topic_handler = topic_handler
 
         # Link the chain
         log.debug("DiffEngine: Linking handler chain")
@@ -686,7 +707,10 @@ class DiffEngine:
             new_course.structure.sub_topic_count,
         )
 
-        changes = self.chain.handle(old_course, new_course)
+        if self.executor is None or old_course is None:
+            changes = self.chain.handle(old_course, new_course)
+        else:
+            changes = self._diff_in_parallel(old_course, new_course)
 
         log.info("Diff process completed with %d change operations", len(changes))
         for i, change in enumerate(changes):
@@ -699,3 +723,74 @@ class DiffEngine:
             )
 
         return changes
+
+    def _diff_in_parallel(
+        self, old_course: EdxCourseOutline, new_course: EdxCourseOutline
+    ) -> List[ChangeOperation]:
+        """
+        Run the diff steps on the executor and merge their results.
+
+        Args:
+            old_course: Previous course outline version
+            new_course: Current course outline version
+
+        Returns:
+            List of change operations, in the same order as the handler chain
+        """
+        tasks = self._plan_diff_tasks(old_course, new_course)
+        log.debug("DiffEngine: Submitting %d diff tasks", len(tasks))
+
+        futures = [self.executor.submit(step, *args) for step, args in tasks]
+
+        # Merge in submission order, which is the chain order
+        changes: List[ChangeOperation] = []
+        for future in futures:
+            changes.extend(future.result())
+        return changes
+
+    def _plan_diff_tasks(
+        self, old_course: EdxCourseOutline, new_course: EdxCourseOutline
+    ) -> List[DiffTask]:
+        """
+        Split the chain into independent diff steps, ordered as the chain runs them:
+        course, deleted topics, created/updated topics, deleted subtopics and
+        created/updated subtopics, with the created/updated steps per partition.
+        """
+        partitions = [
+            replace(new_course, topics=topics)
+            for topics in self._partition_topics(new_course.topics)
+        ]
+
+        tasks: List[DiffTask] = [
+            (self._course_handler._diff_course_properties, (old_course, new_course)),
+            (
+                self._topic_handler._handle_deleted_topics,
+                (old_course.structure.topics, new_course.structure.topics),
+            ),
+        ]
+        tasks.extend(
+            (self._topic_handler._handle_created_or_updated_topics, (old_course, part))
+            for part in partitions
+        )
+        tasks.append(
+            (
+                self._subtopic_handler._handle_deleted_subtopics,
+                (old_course.structure.sub_topics, new_course.structure.sub_topics),
+            )
+        )
+        tasks.extend(
+            (
+                self._subtopic_handler._handle_created_or_updated_subtopics,
+                (old_course, part),
+            )
+            for part in partitions
+        )
+        return tasks
+
+    def _partition_topics(self, topics: Sequence) -> List[Sequence]:
+        if not self.topic_partition_size or len(topics) <= self.topic_partition_size:
+            return [topics]
+        return [
+            topics[start : start + self.topic_partition_size]
+            for start in range(0, len(topics), self.topic_partition_size)
+        ]
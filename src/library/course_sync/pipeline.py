@@ -0,0 +1,605 @@
+"""
+course_sync.pipeline
+~~~~~~~~~~~~
+
+Staged course synchronization: fetch outline -> transform -> diff -> chunked
+apply. Each stage reads and writes its artifacts on a Redis-backed run keyed
+by course key and run id, so stages can be retried independently, and
+duplicate webhooks coalesce into the course's latest run.
+"""
+
+import hashlib
+import json
+import logging
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from redis import Redis, WatchError
+from redis.lock import Lock
+
+from src.apps.core.courses.models import (AcademicClass, Course,
+                                          ExaminationLevel)
+
+from ...exceptions import CourseSyncLockedError
+from .content_hash import OutlineHashes
+from .course_sync import ChangeResult, CourseSyncService
+from .data_transformer import EdxDataTransformer
+from .data_types import (ChangeOperation, CourseChangeData, CourseStructure,
+                         DefaultChangeData, EdxCourseOutline, EntityType,
+                         OperationType, SubTopicChangeData, SubTopics, Topic)
+
+log = logging.getLogger(__name__)
+
+
+def outline_digest(structure: Dict) -> str:
+    """Digest of a raw edX course structure, identical for identical payloads"""
+    payload = json.dumps(structure, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _topic_to_dict(topic: Topic) -> Dict:
+    return {
+        "id": topic.id,
+        "name": topic.name,
+        "sub_topics": [asdict(sub_topic) for sub_topic in topic.sub_topics],
+    }
+
+
+def _topic_from_dict(data: Dict) -> Topic:
+    return Topic(
+        id=data["id"],
+        name=data["name"],
+        sub_topics=[SubTopics(**sub_topic) for sub_topic in data["sub_topics"]],
+    )
+
+
+def outline_to_dict(outline: EdxCourseOutline) -> Dict:
+    """Convert an outline to JSON-serializable data"""
+    return {
+        "course_id": outline.course_id,
+        "title": outline.title,
+        "structure": {
+            "topics": sorted(outline.structure.topics),
+            "sub_topics": sorted(outline.structure.sub_topics),
+            "topic_to_sub_topic": outline.structure.topic_to_sub_topic,
+        },
+        "topics": [_topic_to_dict(topic) for topic in outline.topics],
+    }
+
+
+def outline_from_dict(data: Dict) -> EdxCourseOutline:
+    """Rebuild an outline from the output of outline_to_dict"""
+    structure = data["structure"]
+    return EdxCourseOutline(
+        course_id=data["course_id"],
+        title=data["title"],
+        structure=CourseStructure(
+            topics=set(structure["topics"]),
+            sub_topics=set(structure["sub_topics"]),
+            topic_to_sub_topic=structure["topic_to_sub_topic"],
+        ),
+        topics=[_topic_from_dict(topic) for topic in data["topics"]],
+    )
+
+
+def change_to_dict(change: ChangeOperation) -> Dict:
+    """Convert a change operation to JSON-serializable data"""
+    data = change.data
+    if data is None:
+        payload = None
+    elif isinstance(data, CourseChangeData):
+        payload = {
+            "type": "course",
+            "name": data.name,
+            "course_outline": outline_to_dict(data.course_outline),
+        }
+    elif isinstance(data, SubTopicChangeData):
+        payload = {"type": "subtopic", "name": data.name, "topic_id": data.topic_id}
+    elif isinstance(data, Topic):
+        payload = {"type": "topic", **_topic_to_dict(data)}
+    else:
+        payload = {"type": "default", "name": data.name}
+
+    return {
+        "operation": change.operation.value,
+        "entity_type": change.entity_type.value,
+        "entity_id": change.entity_id,
+        "data": payload,
+    }
+
+
+def change_from_dict(data: Dict) -> ChangeOperation:
+    """Rebuild a change operation from the output of change_to_dict"""
+    payload = data["data"]
+    if payload is None:
+        change_data = None
+    elif payload["type"] == "course":
+        change_data = CourseChangeData(
+            name=payload["name"],
+            course_outline=outline_from_dict(payload["course_outline"]),
+        )
+    elif payload["type"] == "subtopic":
+        change_data = SubTopicChangeData(
+            name=payload["name"], topic_id=payload["topic_id"]
+        )
+    elif payload["type"] == "topic":
+        change_data = _topic_from_dict(payload)
+    else:
+        change_data = DefaultChangeData(name=payload["name"])
+
+    return ChangeOperation(
+        operation=OperationType(data["operation"]),
+        entity_type=EntityType(data["entity_type"]),
+        entity_id=data["entity_id"],
+        data=change_data,
+    )
+
+
+class CourseSyncRun:
+    """
+    State of one pipeline run, stored as a Redis hash of JSON fields.
+
+    The latest run of each course is tracked separately, so stages of runs
+    that were superseded by a newer outline stop early. So is the run whose
+    changes are being applied, which a newer run rolls forward before diffing.
+    """
+
+    KEY_PREFIX = "course_sync:v1"
+    TTL_SECONDS = 24 * 60 * 60
+    LOCK_TIMEOUT_SECONDS = 10 * 60
+
+    def __init__(self, redis_client: Redis, course_key: str, run_id: str) -> None:
+        self._redis_client = redis_client
+        self.course_key = course_key
+        self.run_id = run_id
+
+    @property
+    def digest(self) -> str:
+        """Digest of the outline the run syncs to"""
+        return self.run_id.rsplit("-", 1)[0]
+
+    @property
+    def key(self) -> str:
+        return f"{self.KEY_PREFIX}:{self.course_key}:{self.run_id}"
+
+    @property
+    def _latest_key(self) -> str:
+        return self._latest_key_of(self.course_key)
+
+    @classmethod
+    def _latest_key_of(cls, course_key: str) -> str:
+        return f"{cls.KEY_PREFIX}:{course_key}:latest"
+
+    @property
+    def _applying_key(self) -> str:
+        return f"{self.KEY_PREFIX}:{self.course_key}:applying"
+
+    @classmethod
+    def start(
+        cls, redis_client: Redis, course_key: str, digest: str, params: Dict[str, Any]
+    ) -> Tuple["CourseSyncRun", bool]:
+        """
+        Start a run for an outline and mark it as the course's latest.
+
+        The course's latest run is reused instead if it is for the same
+        outline and has not finished. Every other run gets a new id, so an
+        outline synced before, e.g. on a revert, is synced again.
+
+        Args:
+            redis_client: Redis client holding the runs
+            course_key: The course to synchronize
+            digest: Digest of the raw outline
+            params: Parameters of the run
+
+        Returns:
+            The run, and whether it was newly started
+        """
+        latest_key = cls._latest_key_of(course_key)
+        with redis_client.pipeline() as pipe:
+            while True:
+                try:
+                    pipe.watch(latest_key)
+                    latest = pipe.get(latest_key)
+                    if latest is not None:
+                        run = cls(redis_client, course_key, json.loads(latest))
+                        if (
+                            run.digest == digest
+                            and pipe.exists(run.key)
+                            and not pipe.hexists(run.key, "result")
+                        ):
+                            pipe.unwatch()
+                            return run, False
+
+                    run = cls(redis_client, course_key, f"{digest}-{uuid.uuid4().hex}")
+                    pipe.multi()
+                    pipe.hset(run.key, "params", json.dumps(params))
+                    pipe.expire(run.key, cls.TTL_SECONDS)
+                    pipe.set(latest_key, json.dumps(run.run_id), ex=cls.TTL_SECONDS)
+                    pipe.execute()
+                    return run, True
+                except WatchError:
+                    # Another run of the course was started meanwhile
+                    continue
+
+    def is_current(self) -> bool:
+        """Whether no newer run has been started for the course"""
+        latest = self._redis_client.get(self._latest_key)
+        return latest is not None and json.loads(latest) == self.run_id
+
+    def applying_run_id(self) -> Optional[str]:
+        """Id of the course's run whose changes are being applied, if any"""
+        applying = self._redis_client.get(self._applying_key)
+        return None if applying is None else json.loads(applying)
+
+    def mark_applying(self) -> None:
+        self._redis_client.set(
+            self._applying_key, json.dumps(self.run_id), ex=self.TTL_SECONDS
+        )
+
+    def clear_applying(self) -> None:
+        """Clear the applying mark if it belongs to this run; call under the lock"""
+        if self.applying_run_id() == self.run_id:
+            self._redis_client.delete(self._applying_key)
+
+    def get(self, field: str) -> Optional[Any]:
+        payload = self._redis_client.hget(self.key, field)
+        return None if payload is None else json.loads(payload)
+
+    def get_many(self, fields: List[str]) -> List[Optional[Any]]:
+        if not fields:
+            return []
+        payloads = self._redis_client.hmget(self.key, fields)
+        return [
+            None if payload is None else json.loads(payload) for payload in payloads
+        ]
+
+    def set(self, field: str, value: Any) -> None:
+        pipe = self._redis_client.pipeline()
+        pipe.hset(self.key, field, json.dumps(value))
+        pipe.expire(self.key, self.TTL_SECONDS)
+        pipe.execute()
+
+    def set_once(self, field: str, value: Any) -> bool:
+        """Set a field unless it is already set, returning whether it was set"""
+        return bool(self._redis_client.hsetnx(self.key, field, json.dumps(value)))
+
+    def lock(self) -> Lock:
+        """Per-course lock serializing the database work of all runs of a course"""
+        return self._redis_client.lock(
+            f"{self.KEY_PREFIX}:{self.course_key}:lock",
+            timeout=self.LOCK_TIMEOUT_SECONDS,
+        )
+
+    def __repr__(self):
+        return f"<{type(self).__name__}(key={self.key!r})>"
+
+
+class CourseSyncPipeline:
+    """
+    Runs a course sync as separate, idempotent stages.
+
+    Stages skip work whose artifact is already stored on the run, and stop
+    (returning None or False) once the run expired, or is superseded before
+    its changes were diffed. Database work is done under the per-course lock,
+    and topic and subtopic changes are applied in chunks, each in its own
+    short transaction.
+
+    The course outline that later syncs diff against is only stored by
+    finish, once every chunk is applied. A run that stopped midway, e.g.
+    after exhausting its retries, is rolled forward by the next run's diff,
+    so that diff always starts from a fully applied outline.
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        sync_service: CourseSyncService,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self._redis_client = redis_client
+        self._sync_service = sync_service
+        self._chunk_size = chunk_size
+
+    def start_run(
+        self,
+        course: Course,
+        examination_level: ExaminationLevel,
+        academic_class: AcademicClass,
+        structure: Dict,
+        title: Optional[str] = None,
+    ) -> Optional[CourseSyncRun]:
+        """
+        Stage the raw outline of a course and start a run for it.
+
+        Args:
+            course: The course to synchronize
+            examination_level: The examination level for the course
+            academic_class: The academic class for the course
+            structure: Raw edX course structure
+            title: New course title, defaults to the current course name
+
+        Returns:
+            The run to dispatch, or None if the course's latest run is already
+            syncing the same outline
+        """
+        run, started = CourseSyncRun.start(
+            self._redis_client,
+            course.course_key,
+            outline_digest(structure),
+            {
+                "course_pk": course.pk,
+                "examination_level_pk": examination_level.pk,
+                "academic_class_pk": academic_class.pk,
+                "title": title or course.name,
+                "structure": structure,
+            },
+        )
+        if started:
+            log.info("Started course sync run %s", run.key)
+            return run
+
+        if run.get("dispatched"):
+            log.info("Coalesced duplicate course sync for %s", run.key)
+            return None
+        # Its stages were never queued, e.g. the broker was down
+        log.info("Restarting undispatched course sync run %s", run.key)
+        return run
+
+    def get_run(self, course_key: str, run_id: str) -> CourseSyncRun:
+        return CourseSyncRun(self._redis_client, course_key, run_id)
+
+    def fetch(self, run: CourseSyncRun) -> Optional[Dict]:
+        """
+        Stage 1: load the staged raw outline of the run.
+
+        Returns:
+            The run parameters, or None if the run is superseded, expired, or
+            its course no longer exists
+        """
+        if not run.is_current():
+            log.info("Course sync run %s was superseded", run.key)
+            return None
+        return self._load_params(run)
+
+    def transform(self, run: CourseSyncRun) -> bool:
+        """Stage 2: transform the raw outline and store it on the run"""
+        if run.get("outline") is not None:
+            return True
+
+        params = self.fetch(run)
+        if params is None:
+            return False
+
+        outline = EdxDataTransformer.transform_to_course_outline(
+            params["structure"], run.course_key, params["title"]
+        )
+        run.set("outline", outline_to_dict(outline))
+        return True
+
+    def diff(self, run: CourseSyncRun) -> Optional[int]:
+        """
+        Stage 3: diff the outline against the course and store the changes.
+
+        Returns:
+            Number of change chunks to apply, or None if the run stopped
+
+        Raises:
+            CourseSyncLockedError: If another run holds the course lock
+        """
+        chunk_count = run.get("chunk_count")
+        if chunk_count is not None:
+            return chunk_count
+
+        params = self.fetch(run)
+        outline = run.get("outline")
+        if params is None or outline is None:
+            return None
+
+        with self._locked(run):
+            self._roll_forward(run)
+            course = Course.objects.get(pk=params["course_pk"])
+            changes, new_hashes = self._sync_service.detect_course_changes(
+                outline_from_dict(outline), course
+            )
+
+            # Course changes store the outline, so they wait for every chunk
+            course_changes = [
+                change for change in changes if change.entity_type is EntityType.COURSE
+            ]
+            changes = [
+                change
+                for change in changes
+                if change.entity_type is not EntityType.COURSE
+            ]
+            chunk_count = -(-len(changes) // self._chunk_size)
+            run.set("changes", [change_to_dict(change) for change in changes])
+            run.set(
+                "course_changes", [change_to_dict(change) for change in course_changes]
+            )
+            run.set("hashes", None if new_hashes is None else asdict(new_hashes))
+            run.mark_applying()
+            run.set("chunk_count", chunk_count)
+
+        log.info("Course sync run %s has %d change chunks", run.key, chunk_count)
+        return chunk_count
+
+    def apply_chunk(self, run: CourseSyncRun, index: int) -> bool:
+        """
+        Stage 4: apply one chunk of changes in its own transaction.
+
+        Runs once diffed are applied even when superseded, as the newer run's
+        diff builds on their outcome.
+
+        Returns:
+            False if the run stopped, True otherwise
+
+        Raises:
+            CourseSyncLockedError: If another run holds the course lock
+        """
+        if run.get(f"chunk:{index}") is not None:
+            return True
+
+        params = self._load_params(run)
+        if params is None:
+            return False
+
+        with self._locked(run):
+            self._apply_chunk(run, params, index)
+        return True
+
+    def finish(self, run: CourseSyncRun) -> Optional[ChangeResult]:
+        """
+        Stage 5: apply the course changes and record the outcome once every
+        chunk has been applied.
+
+        Returns:
+            The sync result, or None if the run stopped
+
+        Raises:
+            CourseSyncLockedError: If another run holds the course lock
+        """
+        result = run.get("result")
+        if result is not None:
+            return ChangeResult(**result)
+
+        params = self._load_params(run)
+        chunk_count = run.get("chunk_count")
+        if params is None or chunk_count is None:
+            return None
+
+        with self._locked(run):
+            return self._finish(run, params, chunk_count)
+
+    def _load_params(self, run: CourseSyncRun) -> Optional[Dict]:
+        """Load the run parameters, or None if the run or its course is gone"""
+        params = run.get("params")
+        if params is None:
+            log.warning("Course sync run %s expired", run.key)
+            return None
+
+        if not Course.objects.filter(pk=params["course_pk"]).exists():
+            log.warning("Course of sync run %s no longer exists", run.key)
+            return None
+        return params
+
+    def _apply_chunk(self, run: CourseSyncRun, params: Dict, index: int) -> None:
+        """Apply one chunk of changes unless it is already applied; call under the lock"""
+        if run.get(f"chunk:{index}") is not None:
+            return
+
+        start = index * self._chunk_size
+        changes = [
+            change_from_dict(change)
+            for change in run.get("changes")[start : start + self._chunk_size]
+        ]
+        failed_changes = self._apply_changes(params, changes)
+
+        run.set_once(
+            f"chunk:{index}",
+            {
+                "num_success": len(changes) - len(failed_changes),
+                "num_failed": len(failed_changes),
+            },
+        )
+
+    def _finish(
+        self, run: CourseSyncRun, params: Dict, chunk_count: int
+    ) -> Optional[ChangeResult]:
+        """Apply the course changes and record the outcome; call under the lock"""
+        result = run.get("result")
+        if result is not None:
+            return ChangeResult(**result)
+
+        chunk_results = run.get_many([f"chunk:{i}" for i in range(chunk_count)])
+        if any(chunk_result is None for chunk_result in chunk_results):
+            log.warning("Course sync run %s has unapplied chunks", run.key)
+            return None
+
+        course_changes = [
+            change_from_dict(change) for change in run.get("course_changes") or []
+        ]
+        failed_course_changes = self._apply_changes(params, course_changes)
+
+        hashes = run.get("hashes")
+        result = self._sync_service.complete_sync(
+            Course.objects.get(pk=params["course_pk"]),
+            None if hashes is None else OutlineHashes(**hashes),
+            num_success=sum(chunk["num_success"] for chunk in chunk_results)
+            + len(course_changes)
+            - len(failed_course_changes),
+            num_failed=sum(chunk["num_failed"] for chunk in chunk_results)
+            + len(failed_course_changes),
+        )
+        run.set("result", result._asdict())
+        run.clear_applying()
+        return result
+
+    def _roll_forward(self, run: CourseSyncRun) -> None:
+        """
+        Finish the course's run whose changes are still being applied, if it is
+        not `run`, so `run` diffs against its outcome; call under the lock.
+        """
+        run_id = run.applying_run_id()
+        if run_id is None or run_id == run.run_id:
+            return
+
+        applying_run = self.get_run(run.course_key, run_id)
+        chunk_count = applying_run.get("chunk_count")
+        if chunk_count is None:
+            # Its diff did not complete, so none of its changes were applied
+            applying_run.clear_applying()
+            return
+
+        params = self._load_params(applying_run)
+        if params is None:
+            log.error(
+                "Cannot roll forward course sync run %s, its state is gone",
+                applying_run.key,
+            )
+            applying_run.clear_applying()
+            return
+
+        log.info(
+            "Rolling forward course sync run %s before diffing %s",
+            applying_run.key,
+            run.key,
+        )
+        for index in range(chunk_count):
+            self._apply_chunk(applying_run, params, index)
+        self._finish(applying_run, params, chunk_count)
+
+    def _apply_changes(
+        self, params: Dict, changes: List[ChangeOperation]
+    ) -> List[ChangeOperation]:
+        if not changes:
+            return []
+        return self._sync_service.apply_changes(
+            changes,
+            Course.objects.get(pk=params["course_pk"]),
+            ExaminationLevel.objects.get(pk=params["examination_level_pk"]),
+            AcademicClass.objects.get(pk=params["academic_class_pk"]),
+        )
+
+    @staticmethod
+    @contextmanager
+    def _locked(run: CourseSyncRun) -> Iterator[Lock]:
+        lock = run.lock()
+        if not lock.acquire(blocking=False):
+            raise CourseSyncLockedError(run.course_key)
+        try:
+            yield lock
+        finally:
+            lock.release()
+
+    @classmethod
+    def create_pipeline(cls):
+        from src.config.settings.redis import REDIS_CLIENT
+
+        return CourseSyncPipeline(
+            redis_client=REDIS_CLIENT,
+            sync_service=CourseSyncService.create_service(),
+        )
@@ -0,0 +1,241 @@
+"""
+course_sync.tasks
+~~~~~~~~~~~~
+
+Celery tasks running the course sync pipeline stages:
+fetch outline -> transform -> diff -> chunked apply -> finish,
+and the flush of debounced course change events into the pipeline.
+
+submit_course_sync is the entry point for course change webhooks, in place
+of calling CourseSyncService.sync_course inline.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from celery import chain, shared_task
+from celery.exceptions import Ignore
+from django.db import DatabaseError, OperationalError
+from kombu.exceptions import KombuError
+from redis import RedisError
+
+from src.apps.core.courses.models import (AcademicClass, Course,
+                                          ExaminationLevel)
+
+from ...exceptions import CourseSyncLockedError
+from .debounce import CourseSyncDebouncer
+from .pipeline import CourseSyncPipeline
+
+log = logging.getLogger(__name__)
+
+# Errors a stage is retried on; every stage is safe to run again
+RETRYABLE_ERRORS = (CourseSyncLockedError, OperationalError, RedisError)
+
+# Errors starting a run of a debounced course is retried on
+ENQUEUE_ERRORS = (DatabaseError, KombuError, RedisError)
+
+STAGE_TASK_OPTIONS = {
+    "autoretry_for": RETRYABLE_ERRORS,
+    "retry_backoff": True,
+    "retry_backoff_max": 5 * 60,
+    "max_retries": 10,
+    "acks_late": True,
+    "ignore_result": True,
+}
+
+
+def enqueue_course_sync(
+    course: Course,
+    examination_level: ExaminationLevel,
+    academic_class: AcademicClass,
+    structure: Dict,
+    title: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Start an asynchronous sync of a course to a raw edX outline.
+
+    A duplicate of the outline the course's latest run is still syncing
+    coalesces into that run; any other outline starts a new run, which
+    supersedes the runs still in progress.
+
+    Args:
+        course: The course to synchronize
+        examination_level: The examination level for the course
+        academic_class: The academic class for the course
+        structure: Raw edX course structure
+        title: New course title, defaults to the current course name
+
+    Returns:
+        The run key, or None if the outline is already being synced
+    """
+    run = CourseSyncPipeline.create_pipeline().start_run(
+        course, examination_level, academic_class, structure, title
+    )
+    if run is None:
+        return None
+
+    chain(
+        fetch_course_outline.si(run.course_key, run.run_id),
+        transform_course_outline.si(run.course_key, run.run_id),
+        diff_course_outline.si(run.course_key, run.run_id),
+    ).apply_async()
+    run.set("dispatched", True)
+    return run.key
+
+
+def submit_course_sync(
+    course: Course,
+    examination_level: ExaminationLevel,
+    academic_class: AcademicClass,
+    structure: Dict,
+    title: Optional[str] = None,
+) -> float:
+    """
+    Debounce a course change event before syncing the course.
+
+    Events for the same course collapse while it is being edited, and only the
+    latest outline is passed on to enqueue_course_sync once the course is due.
+
+    Args:
+        course: The course to synchronize
+        examination_level: The examination level for the course
+        academic_class: The academic class for the course
+        structure: Raw edX course structure
+        title: New course title, defaults to the current course name
+
+    Returns:
+        Timestamp at which the course becomes due
+    """
+    submission = CourseSyncDebouncer.create_debouncer().submit(
+        course.course_key,
+        {
+            "course_pk": course.pk,
+            "examination_level_pk": examination_level.pk,
+            "academic_class_pk": academic_class.pk,
+            "title": title,
+            "structure": structure,
+        },
+    )
+    # One flush per pending course; it follows the due time as later events move it
+    if submission.schedule_flush:
+        _schedule_flush(course.course_key, submission.due)
+    return submission.due
+
+
+def _schedule_flush(course_key: str, due: float) -> None:
+    flush_course_sync.apply_async(
+        (course_key,), eta=datetime.fromtimestamp(due, timezone.utc)
+    )
+
+
+def _enqueue_debounced_sync(payload: Dict) -> None:
+    try:
+        course = Course.objects.get(pk=payload["course_pk"])
+        examination_level = ExaminationLevel.objects.get(
+            pk=payload["examination_level_pk"]
+        )
+        academic_class = AcademicClass.objects.get(pk=payload["academic_class_pk"])
+    except (
+        Course.DoesNotExist,
+        ExaminationLevel.DoesNotExist,
+        AcademicClass.DoesNotExist,
+    ):
+        log.warning("Dropping debounced sync of deleted course %s", payload)
+        return
+
+    enqueue_course_sync(
+        course,
+        examination_level,
+        academic_class,
+        payload["structure"],
+        payload["title"],
+    )
+
+
+@shared_task(bind=True, max_retries=10, acks_late=True, ignore_result=True)
+def flush_course_sync(self, course_key: str) -> None:
+    """
+    Start a pipeline run for a debounced course once it is due.
+
+    The course is only removed from the queue after its run was started. If
+    starting it fails, the claim's lease keeps the payload queued, and the
+    flush is retried once the lease expires.
+    """
+    debouncer = CourseSyncDebouncer.create_debouncer()
+    try:
+        claim = debouncer.claim(course_key)
+        if claim.payload is None:
+            # Not due yet because later events moved the due time
+            if claim.due is not None:
+                _schedule_flush(course_key, claim.due)
+            return
+
+        _enqueue_debounced_sync(claim.payload)
+        due = debouncer.ack(course_key, claim)
+    except ENQUEUE_ERRORS as e:
+        if self.request.retries >= self.max_retries:
+            log.error(
+                "Giving up on debounced sync of %s until its next change event",
+                course_key,
+            )
+        raise self.retry(exc=e, countdown=debouncer.lease_seconds)
+
+    # A newer event arrived while the run was being started
+    if due is not None:
+        _schedule_flush(course_key, due)
+
+
+@shared_task(**STAGE_TASK_OPTIONS)
+def fetch_course_outline(course_key: str, run_id: str) -> None:
+    pipeline = CourseSyncPipeline.create_pipeline()
+    if pipeline.fetch(pipeline.get_run(course_key, run_id)) is None:
+        raise Ignore()
+
+
+@shared_task(**STAGE_TASK_OPTIONS)
+def transform_course_outline(course_key: str, run_id: str) -> None:
+    pipeline = CourseSyncPipeline.create_pipeline()
+    if not pipeline.transform(pipeline.get_run(course_key, run_id)):
+        raise Ignore()
+
+
+@shared_task(bind=True, **STAGE_TASK_OPTIONS)
+def diff_course_outline(self, course_key: str, run_id: str) -> None:
+    pipeline = CourseSyncPipeline.create_pipeline()
+    chunk_count = pipeline.diff(pipeline.get_run(course_key, run_id))
+    if chunk_count is None:
+        raise Ignore()
+
+    log.info("Applying %d change chunks for course %s", chunk_count, course_key)
+    raise self.replace(
+        chain(
+            *(
+                apply_course_changes.si(course_key, run_id, index)
+                for index in range(chunk_count)
+            ),
+            finish_course_sync.si(course_key, run_id),
+        )
+    )
+
+
+@shared_task(**STAGE_TASK_OPTIONS)
+def apply_course_changes(course_key: str, run_id: str, index: int) -> None:
+    pipeline = CourseSyncPipeline.create_pipeline()
+    if not pipeline.apply_chunk(pipeline.get_run(course_key, run_id), index):
+        raise Ignore()
+
+
+@shared_task(**STAGE_TASK_OPTIONS)
+def finish_course_sync(course_key: str, run_id: str) -> None:
+    pipeline = CourseSyncPipeline.create_pipeline()
+    result = pipeline.finish(pipeline.get_run(course_key, run_id))
+    if result is None:
+        raise Ignore()
+
+    log.info(
+        "Course sync of %s finished: %d changes applied, %d changes failed",
+        course_key,
+        result.num_success,
+        result.num_failed,
+    )
@@ -0,0 +1,91 @@
+"""
+DiffEngine timing on synthetic course outlines with thousands of subtopics.
+
+Run with:
+    python -m src.library.course_sync.tests.benchmark_diff_engine
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from ..data_transformer import EdxDataTransformer
+from ..diff_engine import DiffEngine
+
+COURSE_SIZES = ((100, 50), (200, 50), (400, 50))
+REPEATS = 3
+
+
+def _build_structure(topic_count, sub_topics_per_topic, renamed_every=10):
+    return {
+        "course_structure": {
+            "child_info": {
+                "children": [
+                    {
+                        "id": f"topic-{t}",
+                        "display_name": f"Topic {t}",
+                        "has_children": True,
+                        "child_info": {
+                            "children": [
+                                {
+                                    "id": f"subtopic-{t}-{s}",
+                                    "display_name": (
+                                        f"Subtopic {t}.{s}"
+                                        if (t + s) % renamed_every
+                                        else f"Renamed {t}.{s}"
+                                    ),
+                                }
+                                for s in range(sub_topics_per_topic)
+                            ]
+                        },
+                    }
+                    for t in range(topic_count)
+                ]
+            }
+        }
+    }
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    with (
+        ThreadPoolExecutor(max_workers=4) as threads,
+        ProcessPoolExecutor(max_workers=4) as processes,
+    ):
+        for mode, engine in (
+            ("serial", DiffEngine()),
+            ("threads", DiffEngine(executor=threads, topic_partition_size=100)),
+            ("processes", DiffEngine(executor=processes, topic_partition_size=100)),
+        ):
+            print(mode)
+            _run(engine)
+
+
+def _run(engine):
+    print(f"{'topics':>7} {'subtopics':>10} {'diff ms':>9} {'changes':>8}")
+    for topic_count, sub_topics_per_topic in COURSE_SIZES:
+        old_structure = _build_structure(
+            topic_count, sub_topics_per_topic, renamed_every=10**9
+        )
+        new_structure = _build_structure(topic_count, sub_topics_per_topic)
+
+        timings = []
+        for _ in range(REPEATS):
+            old = EdxDataTransformer.transform_to_course_outline(
+                old_structure, "course", "Course"
+            )
+            new = EdxDataTransformer.transform_to_course_outline(
+                new_structure, "course", "Course"
+            )
+            started = time.perf_counter()
+            changes = engine.diff(old, new)
+            timings.append(time.perf_counter() - started)
+
+        print(
+            f"{topic_count:>7} {topic_count * sub_topics_per_topic:>10} "
+            f"{min(timings) * 1000:>9.1f} {len(changes):>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,8 @@ from src.apps.core.courses.tests.factories import (AcademicClassFactory,
                                                    CourseFactory,
                                                    ExaminationLevelFactory)
 
-from ..change_processor import (ChangeProcessor, CreateStrategy,
-                                DeleteStrategy, UpdateStrategy)
+from ..change_processor import (BulkChangeProcessor, ChangeProcessor,
+                                CreateStrategy, DeleteStrategy, UpdateStrategy)
 
 
 @pytest.fixture(autouse=True)
@@ -66,3 +66,12 @@ def change_processor(course, examination_level, academic_class):
         examination_level=examination_level,
         academic_class=academic_class,
     )
+
+
+@pytest.fixture
+def bulk_change_processor(course, examination_level, academic_class):
+    return BulkChangeProcessor(
+        course=course,
+        examination_level=examination_level,
+        academic_class=academic_class,
+    )
@@ -384,3 +384,144 @@ class TestChangeProcessor:
         update_strategy_mock.process.assert_called_once_with(failed_change)
         delete_strategy_mock.process.assert_called_once_with(exception_change)
         assert mock_logger.call_count == 2
+
+
+class TestBulkChangeProcessor:
+    """Tests for the BulkChangeProcessor implementation."""
+
+    def test_creates_topics_and_subtopics_in_bulk(self, bulk_change_processor):
+        """Test that new topics and their subtopics are created together."""
+        # Arrange
+        changes = [
+            ChangeOperation(
+                operation=OperationType.CREATE,
+                entity_type=EntityType.TOPIC,
+                entity_id=f"topic-{i}",
+                data=DefaultChangeData(name=f"Topic {i}"),
+            )
+            for i in range(3)
+        ] + [
+            ChangeOperation(
+                operation=OperationType.CREATE,
+                entity_type=EntityType.SUBTOPIC,
+                entity_id=f"subtopic-{i}",
+                data=SubTopicChangeData(name=f"SubTopic {i}", topic_id=f"topic-{i}"),
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        failed_changes = bulk_change_processor.process_changes(changes)
+
+        # Assert
+        assert failed_changes == []
+        assert Topic.objects.filter(block_id__startswith="topic-").count() == 3
+        subtopic = SubTopic.objects.get(block_id="subtopic-1")
+        assert subtopic.name == "SubTopic 1"
+        assert subtopic.topic.block_id == "topic-1"
+
+    def test_existing_topic_creation_is_ignored(self, bulk_change_processor, topic):
+        """Test that creating an existing topic leaves it untouched, like get_or_create."""
+        # Arrange
+        original_name = topic.name
+        change = ChangeOperation(
+            operation=OperationType.CREATE,
+            entity_type=EntityType.TOPIC,
+            entity_id=topic.block_id,
+            data=DefaultChangeData(name="Renamed Topic"),
+        )
+
+        # Act
+        failed_changes = bulk_change_processor.process_changes([change])
+
+        # Assert
+        assert failed_changes == []
+        topic.refresh_from_db()
+        assert topic.name == original_name
+
+    def test_updates_and_deletes_in_bulk(self, bulk_change_processor, topic, subtopic):
+        """Test that updates and deletes of existing entities succeed."""
+        # Arrange
+        changes = [
+            ChangeOperation(
+                operation=OperationType.UPDATE,
+                entity_type=EntityType.TOPIC,
+                entity_id=topic.block_id,
+                data=DefaultChangeData(name="Updated Topic"),
+            ),
+            ChangeOperation(
+                operation=OperationType.DELETE,
+                entity_type=EntityType.SUBTOPIC,
+                entity_id=subtopic.block_id,
+                data=None,
+            ),
+        ]
+
+        # Act
+        failed_changes = bulk_change_processor.process_changes(changes)
+
+        # Assert
+        assert failed_changes == []
+        topic.refresh_from_db()
+        assert topic.name == "Updated Topic"
+        assert not SubTopic.objects.filter(block_id=subtopic.block_id).exists()
+
+    @patch("src.library.course_sync.change_processor.logger.error")
+    def test_missing_entities_are_reported_per_change(
+        self, mock_logger, bulk_change_processor, topic
+    ):
+        """Test that only the changes whose entity or parent is missing fail."""
+        # Arrange
+        valid_update = ChangeOperation(
+            operation=OperationType.UPDATE,
+            entity_type=EntityType.TOPIC,
+            entity_id=topic.block_id,
+            data=DefaultChangeData(name="Updated Topic"),
+        )
+        missing_update = ChangeOperation(
+            operation=OperationType.UPDATE,
+            entity_type=EntityType.SUBTOPIC,
+            entity_id="missing-subtopic",
+            data=DefaultChangeData(name="Missing"),
+        )
+        missing_delete = ChangeOperation(
+            operation=OperationType.DELETE,
+            entity_type=EntityType.TOPIC,
+            entity_id="missing-topic",
+            data=None,
+        )
+        orphan_create = ChangeOperation(
+            operation=OperationType.CREATE,
+            entity_type=EntityType.SUBTOPIC,
+            entity_id="orphan-subtopic",
+            data=SubTopicChangeData(name="Orphan", topic_id="missing-topic"),
+        )
+        changes = [valid_update, missing_update, missing_delete, orphan_create]
+
+        # Act
+        failed_changes = bulk_change_processor.process_changes(changes)
+
+        # Assert
+        assert failed_changes == [missing_update, missing_delete, orphan_create]
+        assert mock_logger.call_count == 3
+        assert not SubTopic.objects.filter(block_id="orphan-subtopic").exists()
+
+    def test_course_changes_use_per_change_strategies(self, bulk_change_processor):
+        """Test that course-level changes are delegated to the strategies."""
+        # Arrange
+        update_strategy = MagicMock()
+        update_strategy.process.return_value = True
+        bulk_change_processor._strategies = {OperationType.UPDATE: update_strategy}
+        change = ChangeOperation(
+            operation=OperationType.UPDATE,
+            entity_type=EntityType.COURSE,
+            entity_id="course-1",
+            data=CourseChangeData(name="Course", course_outline={}),
+        )
+
+        # Act
+        failed_changes = bulk_change_processor.process_changes([change])
+
+        # Assert
+        assert failed_changes == []
+        update_strategy.process.assert_called_once_with(change)
@@ -0,0 +1,86 @@
+import json
+from unittest.mock import MagicMock
+
+from ..content_hash import (OutlineHashStore, compute_outline_hashes,
+                            prune_outline)
+from ..diff_engine import DiffEngine
+from .test_diff_engine import _outline
+
+TOPICS = {
+    "t1": ("Algebra", {"s1": "Equations", "s2": "Inequalities"}),
+    "t2": ("Geometry", {"s3": "Angles"}),
+}
+
+
+class TestComputeOutlineHashes:
+    def test_identical_outlines_share_hashes(self):
+        assert compute_outline_hashes(_outline(TOPICS)) == compute_outline_hashes(
+            _outline(TOPICS)
+        )
+
+    def test_subtopic_edit_only_changes_its_topic(self):
+        edited = {**TOPICS, "t2": ("Geometry", {"s3": "Right angles"})}
+
+        old = compute_outline_hashes(_outline(TOPICS))
+        new = compute_outline_hashes(_outline(edited))
+
+        assert old.root != new.root
+        assert new.changed_topic_ids(old) == {"t2"}
+
+    def test_title_change_only_changes_root(self):
+        old = compute_outline_hashes(_outline(TOPICS))
+        new = compute_outline_hashes(_outline(TOPICS, title="Renamed"))
+
+        assert old.root != new.root
+        assert new.changed_topic_ids(old) == set()
+
+    def test_added_and_removed_topics_are_changed(self):
+        old = compute_outline_hashes(_outline(TOPICS))
+        new = compute_outline_hashes(
+            _outline({"t1": TOPICS["t1"], "t3": ("Statistics", {})})
+        )
+
+        assert new.changed_topic_ids(old) == {"t2", "t3"}
+
+
+class TestPruneOutline:
+    def test_pruned_diff_matches_full_diff(self):
+        edited = {
+            "t1": TOPICS["t1"],
+            "t2": ("Geometry", {"s3": "Right angles", "s4": "Triangles"}),
+        }
+        old, new = _outline(TOPICS), _outline(edited)
+        changed = compute_outline_hashes(new).changed_topic_ids(
+            compute_outline_hashes(old)
+        )
+
+        pruned_changes = DiffEngine().diff(
+            prune_outline(old, changed), prune_outline(new, changed)
+        )
+        full_changes = DiffEngine().diff(old, new)
+
+        assert {(c.operation, c.entity_id) for c in pruned_changes} == {
+            (c.operation, c.entity_id) for c in full_changes
+        }
+        assert [topic.id for topic in prune_outline(new, changed).topics] == ["t2"]
+
+
+class TestOutlineHashStore:
+    def test_round_trip(self):
+        redis_client = MagicMock()
+        store = OutlineHashStore(redis_client)
+        hashes = compute_outline_hashes(_outline(TOPICS))
+
+        store.set("course-1", hashes)
+        key, payload = redis_client.set.call_args.args
+        redis_client.get.return_value = payload
+
+        assert key == "course_outline_hashes:v1:course-1"
+        assert store.get("course-1") == hashes
+        assert json.loads(payload)["root"] == hashes.root
+
+    def test_missing_entry(self):
+        redis_client = MagicMock()
+        redis_client.get.return_value = None
+
+        assert OutlineHashStore(redis_client).get("course-1") is None
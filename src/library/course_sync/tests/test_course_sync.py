@@ -6,11 +6,13 @@ from src.apps.core.courses.tests.factories import (AcademicClassFactory,
                                                    CourseFactory,
                                                    ExaminationLevelFactory)
 
+from ..content_hash import OutlineHashStore, compute_outline_hashes
 from ..course_sync import ChangeResult, CourseSyncService
 from ..data_transformer import EdxDataTransformer
 from ..data_types import (ChangeOperation, CourseChangeData, CourseStructure,
                           EdxCourseOutline, EntityType, OperationType)
 from ..diff_engine import DiffEngine
+from .factories import CourseStructureFactory
 
 
 @pytest.fixture
@@ -294,6 +296,45 @@ class TestCourseSyncService:
             )
             mock_processor.process_changes.assert_called_once_with(changes)
 
+    @patch.object(EdxDataTransformer, "transform_to_course_outline")
+    def test_sync_course_invalidates_question_cache_after_changes(
+        self,
+        mock_transform,
+        mock_diff_engine,
+        course,
+        examination_level,
+        academic_class,
+        mock_course_outline,
+        mock_old_course_outline,
+    ):
+        """Test sync_course drops cached questions for the course once changes apply."""
+        # Arrange
+        invalidator = MagicMock()
+        service = CourseSyncService(
+            diff_engine=mock_diff_engine, question_cache_invalidator=invalidator
+        )
+        mock_transform.return_value = mock_old_course_outline
+        mock_diff_engine.diff.return_value = [
+            ChangeOperation(
+                operation=OperationType.UPDATE,
+                entity_type=EntityType.COURSE,
+                entity_id="test-course-id",
+                data=CourseChangeData(name="Updated Course", course_outline={}),
+            )
+        ]
+
+        # Act
+        with patch(
+            "src.library.course_sync.course_sync.ChangeProcessor"
+        ) as mock_processor_class:
+            mock_processor_class.return_value.process_changes.return_value = []
+            service.sync_course(
+                mock_course_outline, course, examination_level, academic_class
+            )
+
+        # Assert
+        invalidator.assert_called_once_with(course.course_key)
+
     @patch("logging.Logger.info")
     def test_detect_changes_method(
         self, mock_log, course_sync_service, mock_diff_engine, mock_course_outline
@@ -315,10 +356,10 @@ class TestCourseSyncService:
         )
 
     @patch("logging.Logger.info")
-    def test_process_changes_method(
+    def test_apply_changes_method(
         self, mock_log, course_sync_service, course, examination_level, academic_class
     ):
-        """Test the _process_changes method directly."""
+        """Test the apply_changes method directly."""
         # Arrange
         changes = [
             ChangeOperation(
@@ -336,7 +377,7 @@ class TestCourseSyncService:
             mock_processor = mock_processor_class.return_value
             mock_processor.process_changes.return_value = []
 
-            result = course_sync_service._process_changes(
+            result = course_sync_service.apply_changes(
                 changes, course, examination_level, academic_class
             )
 
@@ -364,3 +405,72 @@ class TestCourseSyncService:
             # Assert
             assert isinstance(service, CourseSyncService)
             mock_diff_init.assert_called_once()
+
+
+class TestCourseSyncServiceContentHashes:
+    """Tests for the content-hash short-circuit of CourseSyncService."""
+
+    @pytest.fixture
+    def outline_hash_store(self):
+        store = MagicMock(spec=OutlineHashStore)
+        store.get.return_value = None
+        return store
+
+    @pytest.fixture
+    def hashed_service(self, mock_diff_engine, outline_hash_store):
+        return CourseSyncService(
+            diff_engine=mock_diff_engine, outline_hash_store=outline_hash_store
+        )
+
+    @pytest.fixture
+    def new_outline(self):
+        return EdxDataTransformer.transform_to_course_outline(
+            CourseStructureFactory(), "test-course-id", "Test Course"
+        )
+
+    @patch.object(EdxDataTransformer, "transform_to_course_outline")
+    def test_unchanged_outline_skips_transform_and_diff(
+        self,
+        mock_transform,
+        hashed_service,
+        mock_diff_engine,
+        outline_hash_store,
+        new_outline,
+        course,
+        examination_level,
+        academic_class,
+    ):
+        outline_hash_store.get.return_value = compute_outline_hashes(new_outline)
+
+        result = hashed_service.sync_course(
+            new_outline, course, examination_level, academic_class
+        )
+
+        assert result == ChangeResult(num_failed=0, num_success=0)
+        mock_transform.assert_not_called()
+        mock_diff_engine.diff.assert_not_called()
+
+    @patch.object(EdxDataTransformer, "transform_to_course_outline")
+    def test_hashes_are_stored_after_a_clean_sync(
+        self,
+        mock_transform,
+        hashed_service,
+        mock_diff_engine,
+        outline_hash_store,
+        new_outline,
+        course,
+        examination_level,
+        academic_class,
+    ):
+        mock_transform.return_value = EdxDataTransformer.transform_to_course_outline(
+            {}, "test-course-id", "Test Course"
+        )
+        mock_diff_engine.diff.return_value = []
+
+        hashed_service.sync_course(
+            new_outline, course, examination_level, academic_class
+        )
+
+        outline_hash_store.set.assert_called_once_with(
+            course.course_key, compute_outline_hashes(new_outline)
+        )
@@ -2,6 +2,11 @@
 Tests for ai_core.course_sync.data_transformer
 """
 
+import io
+import json
+
+import pytest
+
 from ..data_transformer import EdxDataTransformer
 from ..data_types import CourseStructure, EdxCourseOutline, Topic
 from ..tests.factories import CourseStructureFactory
@@ -1189,3 +1194,22 @@ class TestEdxDataTransformer:
         result = EdxDataTransformer.transform_structure(structure)
         assert len(result.topics) == 1
         assert len(result.sub_topics) == 0
+
+
+class TestStreamedCourseOutline:
+    """Test cases for transforming a streamed edX JSON body"""
+
+    def test_stream_matches_dict_transform(self):
+        pytest.importorskip("ijson")
+        structure = CourseStructureFactory()
+
+        expected = EdxDataTransformer.transform_to_course_outline(
+            structure, "course-1", "Course"
+        )
+        result = EdxDataTransformer.transform_stream_to_course_outline(
+            io.BytesIO(json.dumps(structure).encode()), "course-1", "Course"
+        )
+
+        assert result == expected
+        assert result.structure.topics_count == 4
+        assert result.structure.sub_topic_count == 12
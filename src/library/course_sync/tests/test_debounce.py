@@ -0,0 +1,85 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from ..debounce import Claim, CourseSyncDebouncer
+
+
+class TestCourseSyncDebouncer:
+    @pytest.fixture
+    def redis_client(self):
+        redis_client = MagicMock()
+        redis_client.register_script.side_effect = lambda script: MagicMock()
+        return redis_client
+
+    @pytest.fixture
+    def debouncer(self, redis_client):
+        return CourseSyncDebouncer(
+            redis_client, window_seconds=30, max_delay_seconds=300, lease_seconds=60
+        )
+
+    def test_submit_schedules_course_with_window_and_max_delay(self, debouncer):
+        submit_script = debouncer._submit_script
+        submit_script.return_value = [b"130.0", 1]
+
+        submission = debouncer.submit("course-1", {"title": "Course"}, now=100.0)
+
+        assert submission.due == 130.0
+        assert submission.schedule_flush is True
+        kwargs = submit_script.call_args.kwargs
+        assert kwargs["args"] == [
+            "course-1",
+            json.dumps({"title": "Course"}),
+            100.0,
+            30,
+            300,
+        ]
+
+    def test_submit_to_queued_course_needs_no_flush(self, debouncer):
+        debouncer._submit_script.return_value = [b"160.0", 0]
+
+        submission = debouncer.submit("course-1", {"title": "Course"}, now=130.0)
+
+        assert submission.schedule_flush is False
+
+    def test_claim_leases_due_course(self, debouncer):
+        payload = json.dumps({"course_pk": 1})
+        debouncer._claim_script.return_value = [b"130.0", payload]
+
+        claim = debouncer.claim("course-1", now=200.0)
+
+        assert claim == Claim(due=130.0, payload={"course_pk": 1}, token=payload)
+        assert debouncer._claim_script.call_args.kwargs["args"] == [
+            "course-1",
+            200.0,
+            260.0,
+        ]
+
+    def test_claim_of_course_not_due_returns_due_time(self, debouncer):
+        debouncer._claim_script.return_value = [b"230.0"]
+
+        claim = debouncer.claim("course-1", now=200.0)
+
+        assert claim.payload is None
+        assert claim.due == 230.0
+
+    def test_claim_of_unknown_course_is_empty(self, debouncer):
+        debouncer._claim_script.return_value = None
+
+        assert debouncer.claim("course-1", now=200.0) == Claim()
+
+    def test_ack_reports_newer_event(self, debouncer):
+        claim = Claim(due=130.0, payload={}, token="{}")
+        debouncer._ack_script.side_effect = [None, b"250.0"]
+
+        assert debouncer.ack("course-1", claim) is None
+        assert debouncer.ack("course-1", claim) == 250.0
+        assert debouncer._ack_script.call_args.kwargs["args"] == ["course-1", "{}"]
+
+    def test_max_delay_is_never_shorter_than_window(self, redis_client):
+        debouncer = CourseSyncDebouncer(
+            redis_client, window_seconds=60, max_delay_seconds=10
+        )
+
+        assert debouncer.max_delay_seconds == 60
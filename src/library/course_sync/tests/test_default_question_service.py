@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ..default_question_service import DefaultQuestionService
+
+MODULE = "src.library.course_sync.default_question_service"
+
+
+class TestProcessDefaultQuestions:
+    @pytest.fixture
+    def question_repo(self):
+        repo = MagicMock()
+        repo.get_question_by_custom_query = AsyncMock()
+        return repo
+
+    @pytest.fixture
+    def service(self, question_repo):
+        repo_class = MagicMock()
+        repo_class.get_repo.return_value = question_repo
+        return DefaultQuestionService(question_repo=repo_class)
+
+    @staticmethod
+    def _question(question_id, category_id):
+        return SimpleNamespace(id=question_id, category_id=category_id)
+
+    def test_batches_queries_and_upserts(self, service, question_repo):
+        objectives = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+        categories = [
+            SimpleNamespace(learning_objective_id=1, category_id="cat-1"),
+            SimpleNamespace(learning_objective_id=2, category_id="cat-2"),
+        ]
+        question_repo.get_question_by_custom_query.return_value = [
+            self._question("q1", "cat-1"),
+            self._question("q2", "cat-2"),
+            self._question("q3", "cat-1"),
+        ]
+
+        with (
+            patch(f"{MODULE}.QuestionCategory") as category_model,
+            patch(f"{MODULE}.DefaultQuestionSet") as default_set_model,
+        ):
+            category_model.objects.filter.return_value = categories
+            default_set_model.objects.bulk_create.side_effect = lambda sets, **_: sets
+
+            result = service.process_default_questions(objectives, "questions")
+
+        category_model.objects.filter.assert_called_once_with(
+            learning_objective__in=objectives
+        )
+        question_repo.get_question_by_custom_query.assert_awaited_once()
+        query = question_repo.get_question_by_custom_query.call_args.kwargs["query"]
+        assert sorted(query["category_id"]["$in"]) == ["cat-1", "cat-2"]
+
+        default_set_model.assert_any_call(
+            learning_objective=objectives[0],
+            question_list_ids=[{"id": "q1"}, {"id": "q3"}],
+        )
+        default_set_model.assert_any_call(
+            learning_objective=objectives[1], question_list_ids=[{"id": "q2"}]
+        )
+        bulk_kwargs = default_set_model.objects.bulk_create.call_args.kwargs
+        assert bulk_kwargs["update_conflicts"] is True
+        assert bulk_kwargs["unique_fields"] == ["learning_objective"]
+        assert bulk_kwargs["update_fields"] == ["question_list_ids"]
+        assert len(result) == 2
+
+    def test_category_ids_are_queried_as_stored(self, service, question_repo):
+        objectives = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+        categories = [
+            SimpleNamespace(learning_objective_id=1, category_id=7),
+            SimpleNamespace(learning_objective_id=2, category_id=7),
+        ]
+        question_repo.get_question_by_custom_query.return_value = [
+            self._question("q1", "7")
+        ]
+
+        with (
+            patch(f"{MODULE}.QuestionCategory") as category_model,
+            patch(f"{MODULE}.DefaultQuestionSet") as default_set_model,
+        ):
+            category_model.objects.filter.return_value = categories
+            default_set_model.objects.bulk_create.side_effect = lambda sets, **_: sets
+
+            service.process_default_questions(objectives, "questions")
+
+        question_repo.get_question_by_custom_query.assert_awaited_once_with(
+            collection_name="questions", query={"category_id": {"$in": [7]}}
+        )
+        default_set_model.assert_any_call(
+            learning_objective=objectives[1], question_list_ids=[{"id": "q1"}]
+        )
+
+    def test_skips_objectives_without_category(self, service, question_repo):
+        objectives = [SimpleNamespace(id=1)]
+
+        with (
+            patch(f"{MODULE}.QuestionCategory") as category_model,
+            patch(f"{MODULE}.DefaultQuestionSet") as default_set_model,
+        ):
+            category_model.objects.filter.return_value = []
+
+            result = service.process_default_questions(objectives, "questions")
+
+        assert result == []
+        question_repo.get_question_by_custom_query.assert_not_awaited()
+        default_set_model.objects.bulk_create.assert_not_called()
@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ..data_transformer import EdxDataTransformer
+from ..data_types import EntityType, OperationType
+from ..diff_engine import DiffEngine
+
+
+def _outline(topics, title="Course"):
+    """Build an outline from {topic_id: (name, {subtopic_id: name})}."""
+    structure = {
+        "course_structure": {
+            "child_info": {
+                "children": [
+                    {
+                        "id": topic_id,
+                        "display_name": name,
+                        "has_children": bool(sub_topics),
+                        "child_info": {
+                            "children": [
+                                {"id": sub_topic_id, "display_name": sub_topic_name}
+                                for sub_topic_id, sub_topic_name in sub_topics.items()
+                            ]
+                        },
+                    }
+                    for topic_id, (name, sub_topics) in topics.items()
+                ]
+            }
+        }
+    }
+    return EdxDataTransformer.transform_to_course_outline(structure, "course-1", title)
+
+
+class TestEdxCourseOutlineIndexes:
+    def test_topic_and_sub_topic_lookup(self):
+        outline = _outline({"t1": ("Algebra", {"s1": "Equations"})})
+
+        assert outline.get_topic_by_id("t1").name == "Algebra"
+        assert outline.get_sub_topic_by_id("s1").topic_id == "t1"
+        assert outline.get_topic_by_id("missing") is None
+        assert outline.get_sub_topic_by_id("missing") is None
+
+
+class TestDiffEngine:
+    def test_detects_subtopic_and_topic_changes(self):
+        old = _outline(
+            {
+                "t1": ("Algebra", {"s1": "Equations", "s2": "Inequalities"}),
+                "t2": ("Geometry", {"s3": "Angles"}),
+            }
+        )
+        new = _outline(
+            {
+                "t1": ("Algebra I", {"s1": "Linear equations"}),
+                "t3": ("Statistics", {"s3": "Angles", "s4": "Mean"}),
+            }
+        )
+
+        changes = {
+            (change.operation, change.entity_type, change.entity_id)
+            for change in DiffEngine().diff(old, new)
+        }
+
+        assert changes == {
+            (OperationType.DELETE, EntityType.TOPIC, "t2"),
+            (OperationType.CREATE, EntityType.TOPIC, "t3"),
+            (OperationType.UPDATE, EntityType.TOPIC, "t1"),
+            (OperationType.DELETE, EntityType.SUBTOPIC, "s2"),
+            (OperationType.UPDATE, EntityType.SUBTOPIC, "s1"),
+            (OperationType.CREATE, EntityType.SUBTOPIC, "s4"),
+        }
+
+    def test_unchanged_course_has_no_changes(self):
+        topics = {"t1": ("Algebra", {"s1": "Equations"})}
+
+        assert DiffEngine().diff(_outline(topics), _outline(topics)) == []
+
+
+class TestParallelDiffEngine:
+    @pytest.fixture
+    def executor(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            yield executor
+
+    @pytest.fixture
+    def outlines(self):
+        old = _outline(
+            {
+                f"t{t}": (f"Topic {t}", {f"s{t}-{s}": f"Sub {t}.{s}" for s in range(3)})
+                for t in range(6)
+            }
+        )
+        new = _outline(
+            {
+                f"t{t}": (
+                    f"Topic {t}" if t % 2 else f"Renamed {t}",
+                    {f"s{t}-{s}": f"Sub {t}.{s}" for s in range(t % 4)},
+                )
+                for t in range(2, 9)
+            },
+            title="Renamed course",
+        )
+        return old, new
+
+    @pytest.mark.parametrize("topic_partition_size", [None, 1, 2, 5, 100])
+    def test_matches_serial_chain_order(self, executor, outlines, topic_partition_size):
+        old, new = outlines
+
+        serial_changes = DiffEngine().diff(old, new)
+        parallel_changes = DiffEngine(
+            executor=executor, topic_partition_size=topic_partition_size
+        ).diff(old, new)
+
+        assert serial_changes
+        assert parallel_changes == serial_changes
+
+    def test_subtopic_changes_follow_topic_changes(self, executor, outlines):
+        old, new = outlines
+
+        changes = DiffEngine(executor=executor, topic_partition_size=2).diff(old, new)
+
+        entity_types = [change.entity_type for change in changes]
+        first_subtopic = entity_types.index(EntityType.SUBTOPIC)
+        assert entity_types[0] == EntityType.COURSE
+        assert EntityType.TOPIC not in entity_types[first_subtopic:]
+
+    def test_new_course_is_a_single_create(self, executor, outlines):
+        _, new = outlines
+
+        changes = DiffEngine(executor=executor).diff(None, new)
+
+        assert [(c.operation, c.entity_type) for c in changes] == [
+            (OperationType.CREATE, EntityType.COURSE)
+        ]
+
+    def test_rejects_invalid_partition_size(self):
+        with pytest.raises(ValueError):
+            DiffEngine(topic_partition_size=0)
@@ -0,0 +1,335 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.exceptions import CourseSyncLockedError
+
+from ..course_sync import ChangeResult, CourseSyncService
+from ..data_types import (ChangeOperation, CourseChangeData, EntityType,
+                          OperationType, SubTopicChangeData)
+from ..diff_engine import DiffEngine
+from ..pipeline import (CourseSyncPipeline, CourseSyncRun, change_from_dict,
+                        change_to_dict, outline_digest, outline_from_dict,
+                        outline_to_dict)
+from .test_diff_engine import _outline
+
+
+class _Redis:
+    """In-memory stand-in for the Redis commands used by course sync runs"""
+
+    def __init__(self):
+        self.hashes, self.values = {}, {}
+
+    def hsetnx(self, key, field, value):
+        fields = self.hashes.setdefault(key, {})
+        if field in fields:
+            return 0
+        fields[field] = value
+        return 1
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hexists(self, key, field):
+        return field in self.hashes.get(key, {})
+
+    def exists(self, key):
+        return int(key in self.hashes or key in self.values)
+
+    def hmget(self, key, fields):
+        return [self.hget(key, field) for field in fields]
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def expire(self, key, seconds):
+        pass
+
+    def pipeline(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def watch(self, *keys):
+        pass
+
+    def unwatch(self):
+        pass
+
+    def multi(self):
+        pass
+
+    def execute(self):
+        pass
+
+    def lock(self, name, timeout=None):
+        return MagicMock()
+
+
+class TestSerialization:
+    def test_outline_round_trip(self):
+        outline = _outline(
+            {"t1": ("Algebra", {"s1": "Equations"}), "t2": ("Geometry", {})}
+        )
+
+        restored = outline_from_dict(json.loads(json.dumps(outline_to_dict(outline))))
+
+        assert restored == outline
+
+    def test_change_round_trip(self):
+        outline = _outline({"t1": ("Algebra", {"s1": "Equations"})})
+        changes = [
+            ChangeOperation(
+                operation=OperationType.UPDATE,
+                entity_type=EntityType.COURSE,
+                entity_id="course-1",
+                data=CourseChangeData(name="Course", course_outline=outline),
+            ),
+            ChangeOperation(
+                operation=OperationType.CREATE,
+                entity_type=EntityType.TOPIC,
+                entity_id="t1",
+                data=outline.topics[0],
+            ),
+            ChangeOperation(
+                operation=OperationType.CREATE,
+                entity_type=EntityType.SUBTOPIC,
+                entity_id="s1",
+                data=SubTopicChangeData(name="Equations", topic_id="t1"),
+            ),
+            ChangeOperation(
+                operation=OperationType.DELETE,
+                entity_type=EntityType.SUBTOPIC,
+                entity_id="s2",
+                data=None,
+            ),
+        ]
+
+        restored = [
+            change_from_dict(json.loads(json.dumps(change_to_dict(change))))
+            for change in changes
+        ]
+
+        assert restored == changes
+
+    def test_digest_ignores_key_order(self):
+        assert outline_digest({"a": 1, "b": [1, 2]}) == outline_digest(
+            {"b": [1, 2], "a": 1}
+        )
+        assert outline_digest({"a": 1}) != outline_digest({"a": 2})
+
+
+class TestCourseSyncPipeline:
+    @pytest.fixture
+    def redis_client(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def pipeline(self, redis_client):
+        return CourseSyncPipeline(
+            redis_client, CourseSyncService(diff_engine=DiffEngine())
+        )
+
+    def test_superseded_run_stops(self, pipeline, redis_client):
+        redis_client.get.return_value = json.dumps("newer-run")
+        redis_client.hget.return_value = None
+
+        run = pipeline.get_run("course-key", "older-run")
+
+        assert pipeline.fetch(run) is None
+        assert pipeline.transform(run) is False
+        # Only the transform's own artifact is looked up, never the params
+        redis_client.hget.assert_called_once_with(run.key, "outline")
+
+    def test_applied_chunk_is_skipped(self, pipeline, redis_client):
+        redis_client.hget.return_value = json.dumps({"num_success": 1, "num_failed": 0})
+
+        assert pipeline.apply_chunk(pipeline.get_run("course-key", "run"), 0)
+        redis_client.lock.assert_not_called()
+
+    def test_locked_course_raises(self, pipeline, redis_client, course):
+        run = pipeline.get_run(course.course_key, "run")
+        redis_client.get.return_value = json.dumps("run")
+        redis_client.hget.side_effect = lambda key, field: {
+            "params": json.dumps({"course_pk": course.pk}),
+            "outline": json.dumps(outline_to_dict(_outline({}))),
+        }.get(field)
+        redis_client.lock.return_value.acquire.return_value = False
+
+        with pytest.raises(CourseSyncLockedError):
+            pipeline.diff(run)
+
+
+class TestCourseSyncPipelineApply:
+    @pytest.fixture
+    def sync_service(self):
+        sync_service = MagicMock()
+        sync_service.apply_changes.return_value = []
+        sync_service.complete_sync.side_effect = (
+            lambda course, hashes, num_success, num_failed: ChangeResult(
+                num_failed=num_failed, num_success=num_success
+            )
+        )
+        return sync_service
+
+    @pytest.fixture
+    def pipeline(self, sync_service):
+        return CourseSyncPipeline(_Redis(), sync_service, chunk_size=1)
+
+    @staticmethod
+    def _changes(course_key, topic_ids):
+        outline = _outline({topic_id: (topic_id, {}) for topic_id in topic_ids})
+        return [
+            ChangeOperation(
+                operation=OperationType.UPDATE,
+                entity_type=EntityType.COURSE,
+                entity_id=course_key,
+                data=CourseChangeData(name="Course", course_outline=outline),
+            ),
+            *(
+                ChangeOperation(
+                    operation=OperationType.CREATE,
+                    entity_type=EntityType.TOPIC,
+                    entity_id=topic.id,
+                    data=topic,
+                )
+                for topic in outline.topics
+            ),
+        ]
+
+    @staticmethod
+    def _structure(name):
+        return {"course_structure": {"name": name}}
+
+    def _start(self, pipeline, course, examination_level, academic_class, name):
+        run = pipeline.start_run(
+            course, examination_level, academic_class, self._structure(name)
+        )
+        run.set("outline", outline_to_dict(_outline({})))
+        return run
+
+    @staticmethod
+    def _applied(sync_service):
+        return [
+            [change.entity_id for change in call.args[0]]
+            for call in sync_service.apply_changes.call_args_list
+        ]
+
+    def test_duplicate_outline_is_coalesced(
+        self, pipeline, course, examination_level, academic_class
+    ):
+        structure = self._structure("a")
+        first = pipeline.start_run(course, examination_level, academic_class, structure)
+        first.set("dispatched", True)
+
+        second = pipeline.start_run(
+            course, examination_level, academic_class, structure
+        )
+
+        assert first.digest == outline_digest(structure)
+        assert second is None
+
+    def test_undispatched_duplicate_is_restarted(
+        self, pipeline, course, examination_level, academic_class
+    ):
+        structure = self._structure("a")
+        first = pipeline.start_run(course, examination_level, academic_class, structure)
+
+        second = pipeline.start_run(
+            course, examination_level, academic_class, structure
+        )
+
+        assert second.run_id == first.run_id
+        assert second.is_current()
+
+    def test_reverted_outline_starts_a_new_current_run(
+        self, pipeline, course, examination_level, academic_class
+    ):
+        outline_a = pipeline.start_run(
+            course, examination_level, academic_class, self._structure("a")
+        )
+        outline_a.set("dispatched", True)
+        outline_b = pipeline.start_run(
+            course, examination_level, academic_class, self._structure("b")
+        )
+        outline_b.set("dispatched", True)
+
+        reverted = pipeline.start_run(
+            course, examination_level, academic_class, self._structure("a")
+        )
+
+        assert reverted is not None
+        assert reverted.digest == outline_a.digest
+        assert reverted.run_id != outline_a.run_id
+        assert reverted.is_current()
+        assert not outline_a.is_current() and not outline_b.is_current()
+        assert pipeline.fetch(reverted) is not None
+
+    def test_finished_outline_is_synced_again(
+        self, pipeline, course, examination_level, academic_class
+    ):
+        first = pipeline.start_run(
+            course, examination_level, academic_class, self._structure("a")
+        )
+        first.set("dispatched", True)
+        first.set("result", {"num_failed": 0, "num_success": 1})
+
+        second = pipeline.start_run(
+            course, examination_level, academic_class, self._structure("a")
+        )
+
+        assert second is not None
+        assert second.run_id != first.run_id
+
+    def test_course_changes_are_applied_after_every_chunk(
+        self, pipeline, sync_service, course, examination_level, academic_class
+    ):
+        run = self._start(pipeline, course, examination_level, academic_class, "a")
+        sync_service.detect_course_changes.return_value = (
+            self._changes(course.course_key, ["t1", "t2"]),
+            None,
+        )
+
+        assert pipeline.diff(run) == 2
+        pipeline.apply_chunk(run, 0)
+        assert pipeline.finish(run) is None
+        pipeline.apply_chunk(run, 1)
+        result = pipeline.finish(run)
+
+        assert self._applied(sync_service) == [["t1"], ["t2"], [course.course_key]]
+        assert result == ChangeResult(num_failed=0, num_success=3)
+
+    def test_next_run_rolls_forward_a_superseded_run(
+        self, pipeline, sync_service, course, examination_level, academic_class
+    ):
+        first = self._start(pipeline, course, examination_level, academic_class, "a")
+        sync_service.detect_course_changes.return_value = (
+            self._changes(course.course_key, ["t1", "t2"]),
+            None,
+        )
+        pipeline.diff(first)
+        pipeline.apply_chunk(first, 0)
+
+        second = self._start(pipeline, course, examination_level, academic_class, "b")
+        sync_service.detect_course_changes.return_value = ([], None)
+        pipeline.diff(second)
+
+        assert self._applied(sync_service) == [["t1"], ["t2"], [course.course_key]]
+        # The superseded run's own remaining stages find nothing left to do
+        assert pipeline.apply_chunk(first, 1)
+        assert pipeline.finish(first) == ChangeResult(num_failed=0, num_success=3)
+        assert sync_service.apply_changes.call_count == 3
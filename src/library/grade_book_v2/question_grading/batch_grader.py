@@ -0,0 +1,116 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from src.apps.learning_tools.assessments.models import StudentQuestionAttempt
+from src.apps.learning_tools.assessments.services.data_types import (
+    GradedResponseSchema, StudentAnswer)
+from src.repository.question_repository.data_types import Question
+
+from .grader_types.base import AbstractQuestionGrader
+from .question_grader import SingleQuestionGrader
+
+logger = logging.getLogger(__name__)
+
+
+class BatchGradingItem(NamedTuple):
+    """A single question attempt within a batch"""
+
+    question: Question
+    answer: StudentAnswer
+    attempt_history: Optional[StudentQuestionAttempt] = None
+
+
+@dataclass
+class BatchGradingResult:
+    """
+    Graded responses for a batch, in submission order, with aggregate score stats.
+
+    Attributes:
+        responses: One graded response per submitted item
+        total_score: Sum of all response scores
+        correct_count: Number of responses graded as correct
+        scores_by_question_type: Sum of scores per question type
+    """
+
+    responses: List[GradedResponseSchema] = field(default_factory=list)
+    total_score: float = 0.0
+    correct_count: int = 0
+    scores_by_question_type: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def question_count(self) -> int:
+        return len(self.responses)
+
+    @property
+    def average_score(self) -> float:
+        return self.total_score / self.question_count if self.question_count else 0.0
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct_count / self.question_count if self.question_count else 0.0
+
+
+class BatchQuestionGrader(SingleQuestionGrader):
+    """
+    Grades every question attempt of a whole assessment in a single pass.
+
+    Each attempt goes through the same routine as SingleQuestionGrader.grade,
+    but the batch looks up one grader per question type, shares a single
+    grading timestamp and adds up the score stats while grading.
+    """
+
+    def grade_batch(
+        self, student_user_id: str, items: Sequence[BatchGradingItem]
+    ) -> BatchGradingResult:
+        """
+        Grade a batch of question attempts for one student.
+
+        Args:
+            student_user_id: Student's unique identifier
+            items: The (question, answer, attempt history) triples to grade
+
+        Returns:
+            Graded responses in the same order as items, with aggregate stats
+
+        Raises:
+            ValueError: If a question type that needs grading has no grader
+        """
+        graded_at = datetime.now()
+        graders: Dict[str, AbstractQuestionGrader] = {}
+
+        def resolve_grader(question_type: str) -> AbstractQuestionGrader:
+            grader = graders.get(question_type)
+            if grader is None:
+                grader = self.question_grader_factory.get_grader(question_type)
+                graders[question_type] = grader
+            return grader
+
+        result = BatchGradingResult()
+        scores_by_question_type: Dict[str, float] = defaultdict(float)
+        for question, answer, attempt_history in items:
+            response = self._grade_attempt(
+                student_user_id,
+                answer,
+                question,
+                attempt_history,
+                grader_resolver=resolve_grader,
+                graded_at=graded_at,
+            )
+            result.responses.append(response)
+            result.total_score += response.score
+            result.correct_count += response.is_correct
+            scores_by_question_type[question.question_type] += response.score
+
+        result.scores_by_question_type = dict(scores_by_question_type)
+        logger.info(
+            "Batch graded %d questions of %d types for user %s: score=%s, correct=%d",
+            len(items),
+            len(scores_by_question_type),
+            student_user_id,
+            result.total_score,
+            result.correct_count,
+        )
+        return result
@@ -1,10 +1,16 @@
+import logging
 from enum import Enum
-from typing import Dict, Type
+from importlib.metadata import entry_points
+from typing import Callable, Dict, Union
 
 from .grader_types.base import AbstractQuestionGrader
 from .grader_types.fill_in_blank import FillInTheBlankGrader
 from .grader_types.multiple_choice import MultipleChoiceGrader
 
+logger = logging.getLogger(__name__)
+
+GraderProvider = Union[AbstractQuestionGrader, Callable[[], AbstractQuestionGrader]]
+
 
 class GraderTypeEnum(Enum):
     MULTIPLE_CHOICE = "multiple-choice"
@@ -12,31 +18,103 @@ class GraderTypeEnum(Enum):
 
 
 class GraderFactory:
-    _graders: Dict[GraderTypeEnum, Type[AbstractQuestionGrader]] = {}
+    """
+    Registry of stateless graders keyed by the raw question_type string.
+
+    Graders are registered either as instances, or as factories (usually the
+    grader class) that are called once on first use. Question types that are
+    not registered in code are looked up once in the ENTRY_POINT_GROUP entry
+    points, so plugin graders cost nothing until they are needed.
+    """
+
+    ENTRY_POINT_GROUP = "grade_book_v2.graders"
+
+    _graders: Dict[str, AbstractQuestionGrader] = {}
+    _grader_factories: Dict[str, Callable[[], AbstractQuestionGrader]] = {}
+    _entry_points_loaded = False
 
     @classmethod
     def register_grader(
-        cls, question_type: GraderTypeEnum, grader_class: Type[AbstractQuestionGrader]
+        cls, question_type: Union[GraderTypeEnum, str], grader: GraderProvider
     ) -> None:
-        """Register a grader class for a specific question type"""
-        cls._graders[question_type] = grader_class
+        """
+        Register a grader instance or grader factory for a question type.
+
+        Args:
+            question_type: The question type, as an enum member or raw string
+            grader: A grader instance, or a callable (such as a grader class)
+                returning one
+        """
+        key = (
+            question_type.value
+            if isinstance(question_type, GraderTypeEnum)
+            else question_type
+        )
+        cls._graders.pop(key, None)
+        cls._grader_factories.pop(key, None)
+
+        if isinstance(grader, AbstractQuestionGrader):
+            cls._graders[key] = grader
+        else:
+            cls._grader_factories[key] = grader
 
     @classmethod
     def get_grader(cls, question_type: str) -> AbstractQuestionGrader:
-        """Get an instance of the appropriate grader for a question type"""
-        try:
-            enum_type = GraderTypeEnum(question_type)
-        except ValueError:
-            raise ValueError(f"Invalid question type: {question_type}")
-
-        grader_class = cls._graders.get(enum_type)
-        if not grader_class:
+        """
+        Get the shared grader for a question type.
+
+        Args:
+            question_type: The raw question_type of the question being graded
+
+        Returns:
+            The grader registered for the question type
+
+        Raises:
+            ValueError: If no grader is registered for the question type
+        """
+        grader = cls._graders.get(question_type)
+        if grader is not None:
+            return grader
+        return cls._build_grader(question_type)
+
+    @classmethod
+    def _build_grader(cls, question_type: str) -> AbstractQuestionGrader:
+        """Instantiate a lazily registered grader on its first use."""
+        grader_factory = cls._grader_factories.get(question_type)
+        if grader_factory is None and not cls._entry_points_loaded:
+            cls._load_entry_points()
+            return cls.get_grader(question_type)
+
+        if grader_factory is None:
             raise ValueError(f"No grader registered for question type: {question_type}")
-        return grader_class()
+
+        grader = cls._graders.setdefault(question_type, grader_factory())
+        cls._grader_factories.pop(question_type, None)
+        logger.debug("Built grader %r for question type '%s'", grader, question_type)
+        return grader
+
+    @classmethod
+    def _load_entry_points(cls) -> None:
+        """Register graders published by installed packages, without overriding."""
+        cls._entry_points_loaded = True
+        for entry_point in entry_points(group=cls.ENTRY_POINT_GROUP):
+            if entry_point.name in cls._graders or (
+                entry_point.name in cls._grader_factories
+            ):
+                continue
+            try:
+                cls.register_grader(entry_point.name, entry_point.load())
+            except (ImportError, AttributeError) as e:
+                logger.error(
+                    "Failed to load grader entry point '%s': %s", entry_point.name, e
+                )
 
     def __repr__(self):
-        return f"<{type(self).__name__}(registered_graders={list(self._graders.keys())!r})>"
+        registered = [*self._graders, *self._grader_factories]
+        return f"<{type(self).__name__}(registered_graders={registered!r})>"
 
 
-GraderFactory.register_grader(GraderTypeEnum.MULTIPLE_CHOICE, MultipleChoiceGrader)
+GraderFactory.register_grader(GraderTypeEnum.MULTIPLE_CHOICE, MultipleChoiceGrader())
+# Registered by class: FillInTheBlankGrader cannot be instantiated until it
+# implements get_correct_answer_id, so it is only built when first requested.
 GraderFactory.register_grader(GraderTypeEnum.FILL_IN_BLANKS, FillInTheBlankGrader)
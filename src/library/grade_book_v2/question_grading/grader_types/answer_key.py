@@ -0,0 +1,164 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import FrozenSet, Optional, Tuple
+
+from src.repository.question_repository.data_types import Question
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class BlankAnswerKey:
+    """
+    Accepted answers for one blank, normalized once at compile time.
+
+    Exact-match blanks are checked with a set lookup; partial-match blanks keep
+    the normalized answers in order for the two-way substring check.
+    """
+
+    blank_id: str
+    accepted_answers: FrozenSet[str]
+    partial_answers: Tuple[str, ...]
+    case_sensitive: bool
+    exact_match: bool
+
+    def matches(self, student_answer: str) -> bool:
+        """
+        Check a student's answer for this blank.
+
+        Args:
+            student_answer: The student's raw answer
+
+        Returns:
+            True if the answer matches any accepted answer
+        """
+        normalized_student = _normalize(student_answer, self.case_sensitive)
+        if not normalized_student:
+            return False
+
+        if self.exact_match:
+            return normalized_student in self.accepted_answers
+
+        return any(
+            normalized_student in accepted or accepted in normalized_student
+            for accepted in self.partial_answers
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AnswerKey:
+    """
+    Everything needed to grade a question, derived once from the Question.
+
+    Attributes:
+        correct_option_ids: Set of correct multiple-choice option IDs
+        ordered_correct_option_ids: Correct option IDs in question order
+        blanks: Compiled keys for fill-in-the-blank slots, in question order
+    """
+
+    correct_option_ids: FrozenSet[str]
+    ordered_correct_option_ids: Tuple[str, ...]
+    blanks: Tuple[BlankAnswerKey, ...]
+
+
+def _normalize(answer: str, case_sensitive: bool) -> str:
+    normalized = answer.strip()
+    return normalized if case_sensitive else normalized.lower()
+
+
+def compile_answer_key(question: Question) -> AnswerKey:
+    """
+    Build the answer key for a question.
+
+    Args:
+        question: The question to compile
+
+    Returns:
+        The compiled AnswerKey
+    """
+    options = question.content.options or []
+    blanks = question.content.blanks or []
+
+    ordered_correct_option_ids = tuple(
+        option.id for option in options if option.is_correct
+    )
+
+    blank_keys = []
+    for blank in blanks:
+        normalized_answers = tuple(
+            _normalize(accepted, blank.case_sensitive)
+            for accepted in blank.accepted_answers
+        )
+        blank_keys.append(
+            BlankAnswerKey(
+                blank_id=str(blank.id),
+                accepted_answers=frozenset(normalized_answers),
+                partial_answers=() if blank.exact_match else normalized_answers,
+                case_sensitive=blank.case_sensitive,
+                exact_match=blank.exact_match,
+            )
+        )
+
+    return AnswerKey(
+        correct_option_ids=frozenset(ordered_correct_option_ids),
+        ordered_correct_option_ids=ordered_correct_option_ids,
+        blanks=tuple(blank_keys),
+    )
+
+
+class AnswerKeyCache:
+    """
+    Thread-safe LRU cache of compiled answer keys.
+
+    Keys are (question_id, updated_at), so an edited question is recompiled
+    on its next use and the stale entry ages out.
+    """
+
+    DEFAULT_MAX_SIZE = 10_000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._max_size = max_size
+        self._keys: OrderedDict[Tuple[str, Optional[datetime]], AnswerKey] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, question: Question) -> AnswerKey:
+        """
+        Return the compiled answer key for a question, compiling it on a miss.
+
+        Args:
+            question: The question being graded
+
+        Returns:
+            The question's AnswerKey
+        """
+        cache_key = (question.id, question.updated_at)
+        with self._lock:
+            answer_key = self._keys.get(cache_key)
+            if answer_key is not None:
+                self._keys.move_to_end(cache_key)
+                return answer_key
+
+        logger.debug("Compiling answer key for question %s", question.id)
+        answer_key = compile_answer_key(question)
+
+        with self._lock:
+            self._keys[cache_key] = answer_key
+            while len(self._keys) > self._max_size:
+                self._keys.popitem(last=False)
+
+        return answer_key
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+answer_key_cache = AnswerKeyCache()
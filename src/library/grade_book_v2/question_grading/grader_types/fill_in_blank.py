@@ -1,8 +1,9 @@
 import logging
-from typing import List
 
 from src.apps.learning_tools.assessments.services.data_types import \
     StudentAnswer
+from src.library.grade_book_v2.question_grading.grader_types.answer_key import \
+    answer_key_cache
 from src.library.grade_book_v2.question_grading.grader_types.base import \
     AbstractQuestionGrader
 from src.repository.question_repository.data_types import Question
@@ -17,6 +18,7 @@ class FillInTheBlankGrader(AbstractQuestionGrader):
 
     This grader compares the student's answers for each blank with the accepted
     answers from the question, considering case sensitivity and matching rules.
+    Accepted answers are normalized once per question in its compiled answer key.
     """
 
     def grade(self, question: Question, attempted_answer: StudentAnswer) -> bool:
@@ -33,25 +35,17 @@ class FillInTheBlankGrader(AbstractQuestionGrader):
         logger.debug(f"Grading fill-in-the-blank question {question.id}")
 
         blank_answers = attempted_answer.question_metadata.get("blank_answers", {})
-        blanks_config = question.content.blanks or []
+        blank_keys = answer_key_cache.get(question).blanks
 
-        logger.debug(f"Student blank answers: {blank_answers}")
-        logger.debug(f"Number of blanks to check: {len(blanks_config)}")
+        logger.debug("Student blank answers: %s", blank_answers)
+        logger.debug("Number of blanks to check: %d", len(blank_keys))
 
         all_correct = True
         correct_count = 0
-        total_blanks = len(blanks_config)
 
-        for blank in blanks_config:
-            blank_id = str(blank.id)
-            student_answer = blank_answers.get(blank_id, "").strip()
-
-            is_blank_correct = self._grade_single_blank(
-                student_answer,
-                blank.accepted_answers,
-                blank.case_sensitive,
-                blank.exact_match,
-            )
+        for blank_key in blank_keys:
+            student_answer = blank_answers.get(blank_key.blank_id, "")
+            is_blank_correct = blank_key.matches(student_answer)
 
             if is_blank_correct:
                 correct_count += 1
@@ -59,62 +53,18 @@ class FillInTheBlankGrader(AbstractQuestionGrader):
                 all_correct = False
 
             logger.debug(
-                f"Blank {blank_id}: '{student_answer}' -> {'correct' if is_blank_correct else 'incorrect'}"
+                "Blank %s: '%s' -> %s",
+                blank_key.blank_id,
+                student_answer,
+                "correct" if is_blank_correct else "incorrect",
             )
 
-        logger.debug(f"Overall result: {correct_count}/{total_blanks} blanks correct")
         logger.debug(
-            f"Answer is {'fully correct' if all_correct else 'not fully correct'}"
+            "Overall result: %d/%d blanks correct", correct_count, len(blank_keys)
         )
 
         return all_correct
 
-    @staticmethod
-    def _grade_single_blank(
-        student_answer: str,
-        accepted_answers: List[str],
-        case_sensitive: bool = False,
-        exact_match: bool = True,
-    ) -> bool:
-        """
-        Grade a single blank against accepted answers.
-
-        Args:
-            student_answer (str): The student's answer for this blank
-            accepted_answers (List[str]): List of acceptable answers
-            case_sensitive (bool): Whether comparison should be case sensitive
-            exact_match (bool): Whether match must be exact or allow partial matching
-
-        Returns:
-            bool: True if the student answer matches any accepted answer
-        """
-        if not student_answer:
-            return False
-
-        # Normalize student answer
-        normalized_student = student_answer.strip()
-        if not case_sensitive:
-            normalized_student = normalized_student.lower()
-
-        for accepted in accepted_answers:
-            normalized_accepted = accepted.strip()
-            if not case_sensitive:
-                normalized_accepted = normalized_accepted.lower()
-
-            if exact_match:
-                if normalized_student == normalized_accepted:
-                    return True
-            else:
-                # For non-exact match, check if student answer contains the accepted answer
-                # or if accepted answer contains the student answer
-                if (
-                    normalized_student in normalized_accepted
-                    or normalized_accepted in normalized_student
-                ):
-                    return True
-
-        return False
-
     def calculate_score(self, is_correct: bool) -> float:
         """
         Calculate score for the question.
@@ -2,6 +2,8 @@ import logging
 
 from src.apps.learning_tools.assessments.services.data_types import \
     StudentAnswer
+from src.library.grade_book_v2.question_grading.grader_types.answer_key import \
+    answer_key_cache
 from src.library.grade_book_v2.question_grading.grader_types.base import \
     AbstractQuestionGrader
 from src.repository.question_repository.data_types import Question
@@ -15,6 +17,7 @@ class MultipleChoiceGrader(AbstractQuestionGrader):
 
     This grader compares the selected option IDs in an attempted answer
     with the correct option IDs from the question to determine correctness.
+    Correct option IDs come from the question's cached compiled answer key.
     """
 
     def grade(self, question: Question, attempted_answer: StudentAnswer) -> bool:
@@ -30,17 +33,14 @@ class MultipleChoiceGrader(AbstractQuestionGrader):
         """
         logger.debug(f"Grading multiple-choice question {question.id}")
 
-        # Get correct options
-        correct_options = [
-            option.id for option in question.content.options if option.is_correct
-        ]
+        correct_options = answer_key_cache.get(question).correct_option_ids
 
         selected_options = attempted_answer.question_metadata["selected_option_ids"]
 
-        logger.debug(f"Correct options: {correct_options}")
-        logger.debug(f"Selected options: {selected_options}")
+        logger.debug("Correct options: %s", correct_options)
+        logger.debug("Selected options: %s", selected_options)
 
-        is_correct = set(selected_options) == set(correct_options)
+        is_correct = correct_options == frozenset(selected_options)
         logger.debug(f"Answer is {'correct' if is_correct else 'incorrect'}")
 
         return is_correct
@@ -72,9 +72,7 @@ class MultipleChoiceGrader(AbstractQuestionGrader):
         Returns:
             str: The correct option ID
         """
-        correct_options = [
-            option.id for option in question.content.options if option.is_correct
-        ]
+        correct_options = answer_key_cache.get(question).ordered_correct_option_ids
 
         if not correct_options:
             logger.warning(f"No correct options found for question {question.id}")
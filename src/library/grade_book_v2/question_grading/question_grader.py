@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import Optional, Type
+from typing import Callable, Optional, Type
 
 from src.apps.learning_tools.assessments.models import StudentQuestionAttempt
 from src.apps.learning_tools.assessments.services.data_types import (
@@ -8,6 +8,7 @@ from src.apps.learning_tools.assessments.services.data_types import (
 from src.repository.question_repository.data_types import Question
 
 from .grader_factory import GraderFactory
+from .grader_types.base import AbstractQuestionGrader
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,39 @@ class SingleQuestionGrader:
             target_question: Question being attempted
             previous_attempt_history: Prior attempt data if exists
 
+        Returns:
+            Complete grading response with score, feedback, and attempt tracking
+        """
+        return self._grade_attempt(
+            student_user_id,
+            submitted_answer,
+            target_question,
+            previous_attempt_history,
+            grader_resolver=self.question_grader_factory.get_grader,
+            graded_at=datetime.now(),
+        )
+
+    def _grade_attempt(
+        self,
+        student_user_id: str,
+        submitted_answer: StudentAnswer,
+        target_question: Question,
+        previous_attempt_history: Optional[StudentQuestionAttempt],
+        grader_resolver: Callable[[str], AbstractQuestionGrader],
+        graded_at: datetime,
+    ) -> GradedResponseSchema:
+        """
+        Grade one attempt with a caller-supplied grader lookup and timestamp.
+
+        Args:
+            student_user_id: Student's unique identifier
+            submitted_answer: The student's submitted answer
+            target_question: Question being attempted
+            previous_attempt_history: Prior attempt data if exists
+            grader_resolver: Returns the grader for a question type; only called
+                when the attempt actually needs grading
+            graded_at: Timestamp recorded on the response
+
         Returns:
             Complete grading response with score, feedback, and attempt tracking
         """
@@ -73,14 +107,13 @@ class SingleQuestionGrader:
             previous_attempt_history,
             submitted_answer,
             student_user_id,
+            graded_at,
         )
         if special_case_response:
             return special_case_response
 
         # Perform actual grading
-        question_type_grader = self.question_grader_factory.get_grader(
-            target_question.question_type
-        )
+        question_type_grader = grader_resolver(target_question.question_type)
         answer_is_correct = question_type_grader.grade(
             target_question, submitted_answer
         )
@@ -112,7 +145,7 @@ class SingleQuestionGrader:
             question_id=target_question.id,
             user_id=int(student_user_id),
             grading_version="1.0",
-            created_at=datetime.now(),
+            created_at=graded_at,
             score=calculated_score,
             feedback=comprehensive_feedback,
             attempts_remaining=remaining_attempts_count,
@@ -241,6 +274,7 @@ class SingleQuestionGrader:
         attempt_history: Optional[StudentQuestionAttempt],
         submitted_answer: StudentAnswer,
         student_user_id: str,
+        graded_at: Optional[datetime] = None,
     ) -> Optional[GradedResponseSchema]:
         """
         Handle edge cases that bypass normal grading flow.
@@ -250,10 +284,13 @@ class SingleQuestionGrader:
             attempt_history: Previous attempt data if exists
             submitted_answer: Student's submitted answer
             student_user_id: Student's unique identifier
+            graded_at: Timestamp recorded on the response, defaults to now
 
         Returns:
             GradedResponse for special cases, None for normal flow
         """
+        graded_at = graded_at or datetime.now()
+
         # Already mastered question
         if attempt_history and getattr(attempt_history, "mastered", False):
             logger.info(
@@ -275,7 +312,7 @@ class SingleQuestionGrader:
                 question_id=target_question.id,
                 user_id=int(student_user_id),
                 grading_version="1.0",
-                created_at=datetime.now(),
+                created_at=graded_at,
                 is_correct=True,
                 score=getattr(attempt_history, "best_score", 1.0),
                 feedback=mastery_feedback,
@@ -300,7 +337,7 @@ class SingleQuestionGrader:
                 question_id=target_question.id,
                 user_id=int(student_user_id),
                 grading_version="1.0",
-                created_at=datetime.now(),
+                created_at=graded_at,
                 is_correct=False,
                 score=0,
                 feedback=exceeded_attempts_feedback,
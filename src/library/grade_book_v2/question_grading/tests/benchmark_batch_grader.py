@@ -0,0 +1,66 @@
+"""
+Per-question grading overhead of SingleQuestionGrader versus BatchQuestionGrader.
+
+Run with:
+    python -m src.library.grade_book_v2.question_grading.tests.benchmark_batch_grader
+"""
+
+import logging
+import time
+
+from src.repository.question_repository.mongo.tests.factories import \
+    QuestionFactory
+
+from ..batch_grader import BatchGradingItem, BatchQuestionGrader
+from ..question_grader import SingleQuestionGrader
+from .factories import StudentAnswerFactory
+
+BATCH_SIZES = (50, 500, 5000)
+REPEATS = 5
+
+
+def _build_items(count):
+    return [
+        BatchGradingItem(
+            QuestionFactory(),
+            StudentAnswerFactory(
+                question_type="multiple-choice",
+                question_metadata={"selected_option_ids": ["option1", "option4"]},
+            ),
+        )
+        for _ in range(count)
+    ]
+
+
+def _best_of(function):
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    single_grader = SingleQuestionGrader()
+    batch_grader = BatchQuestionGrader()
+
+    print(f"{'questions':>10} {'single us/q':>12} {'batch us/q':>12} {'speedup':>8}")
+    for count in BATCH_SIZES:
+        items = _build_items(count)
+        single = _best_of(
+            lambda: [
+                single_grader.grade("1", item.answer, item.question, None)
+                for item in items
+            ]
+        )
+        batch = _best_of(lambda: batch_grader.grade_batch("1", items))
+        print(
+            f"{count:>10} {single / count * 1e6:>12.1f} "
+            f"{batch / count * 1e6:>12.1f} {single / batch:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.repository.question_repository.data_types import Blank, Content
+from src.repository.question_repository.mongo.tests.factories import \
+    QuestionFactory
+
+from ..grader_types.answer_key import AnswerKeyCache, compile_answer_key
+
+
+@pytest.fixture
+def blank_question():
+    return QuestionFactory(
+        question_type="fill-in-the-blank",
+        content=Content(
+            blanks=[
+                Blank(id=1, position=0, accepted_answers=[" Paris "]),
+                Blank(
+                    id=2,
+                    position=1,
+                    accepted_answers=["Seine"],
+                    case_sensitive=True,
+                ),
+                Blank(
+                    id=3,
+                    position=2,
+                    accepted_answers=["photosynthesis"],
+                    exact_match=False,
+                ),
+            ]
+        ),
+    )
+
+
+class TestCompileAnswerKey:
+    def test_correct_option_ids(self):
+        answer_key = compile_answer_key(QuestionFactory())
+
+        assert answer_key.correct_option_ids == frozenset({"option1", "option4"})
+        assert answer_key.ordered_correct_option_ids == ("option1", "option4")
+
+    def test_exact_match_blank_is_normalized(self, blank_question):
+        blank_key = compile_answer_key(blank_question).blanks[0]
+
+        assert blank_key.blank_id == "1"
+        assert blank_key.matches("  PARIS")
+        assert not blank_key.matches("Pari")
+        assert not blank_key.matches("   ")
+
+    def test_case_sensitive_blank(self, blank_question):
+        blank_key = compile_answer_key(blank_question).blanks[1]
+
+        assert blank_key.matches("Seine")
+        assert not blank_key.matches("seine")
+
+    def test_partial_match_blank(self, blank_question):
+        blank_key = compile_answer_key(blank_question).blanks[2]
+
+        assert blank_key.matches("Photosynthesis in plants")
+        assert blank_key.matches("synthesis")
+        assert not blank_key.matches("respiration")
+
+
+class TestAnswerKeyCache:
+    def test_key_is_compiled_once_per_question_version(self):
+        cache = AnswerKeyCache()
+        question = QuestionFactory()
+
+        assert cache.get(question) is cache.get(question)
+        assert len(cache) == 1
+
+    def test_updated_question_is_recompiled(self):
+        cache = AnswerKeyCache()
+        question = QuestionFactory()
+        original = cache.get(question)
+
+        edited = question.model_copy(
+            update={"updated_at": question.updated_at + timedelta(seconds=1)}
+        )
+
+        assert cache.get(edited) is not original
+
+    def test_least_recently_used_key_is_evicted(self):
+        cache = AnswerKeyCache(max_size=1)
+        cache.get(QuestionFactory())
+        cache.get(QuestionFactory(updated_at=datetime.now()))
+
+        assert len(cache) == 1
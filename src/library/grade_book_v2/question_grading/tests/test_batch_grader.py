@@ -0,0 +1,67 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.repository.question_repository.mongo.tests.factories import \
+    QuestionFactory
+
+from ..batch_grader import BatchGradingItem, BatchQuestionGrader
+from ..grader_factory import GraderFactory
+from .factories import StudentAnswerFactory
+
+
+def _answer(selected_option_ids):
+    return StudentAnswerFactory(
+        question_type="multiple-choice",
+        question_metadata={"selected_option_ids": selected_option_ids},
+    )
+
+
+class TestBatchQuestionGrader:
+    """Test suite for the BatchQuestionGrader class."""
+
+    @pytest.fixture
+    def questions(self):
+        return [QuestionFactory() for _ in range(3)]
+
+    @pytest.fixture
+    def items(self, questions):
+        return [
+            BatchGradingItem(questions[0], _answer(["option1", "option4"])),
+            BatchGradingItem(questions[1], _answer(["option2"])),
+            BatchGradingItem(questions[2], _answer(["option1", "option4"])),
+        ]
+
+    def test_responses_follow_submission_order(self, items, questions):
+        result = BatchQuestionGrader().grade_batch("1", items)
+
+        assert [response.question_id for response in result.responses] == [
+            question.id for question in questions
+        ]
+
+    def test_aggregate_stats(self, items):
+        result = BatchQuestionGrader().grade_batch("1", items)
+
+        assert result.question_count == 3
+        assert result.correct_count == 2
+        assert result.total_score == 2.0
+        assert result.scores_by_question_type == {"multiple-choice": 2.0}
+        assert result.accuracy == pytest.approx(2 / 3)
+
+    def test_one_grader_per_question_type(self, items):
+        factory = Mock(wraps=GraderFactory)
+
+        BatchQuestionGrader(question_grader_factory=factory).grade_batch("1", items)
+
+        factory.get_grader.assert_called_once_with("multiple-choice")
+
+    def test_batch_shares_one_grading_timestamp(self, items):
+        result = BatchQuestionGrader().grade_batch("1", items)
+
+        assert len({response.created_at for response in result.responses}) == 1
+
+    def test_empty_batch(self):
+        result = BatchQuestionGrader().grade_batch("1", [])
+
+        assert result.responses == []
+        assert result.average_score == 0.0
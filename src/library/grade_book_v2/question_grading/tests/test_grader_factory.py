@@ -18,8 +18,10 @@ class TestGraderFactory:
         """Reset the graders dictionary before each test to ensure isolation."""
         # Store original graders to restore after the test
         original_graders = GraderFactory._graders.copy()
+        original_factories = GraderFactory._grader_factories.copy()
         # Clear the graders
         GraderFactory._graders = {}
+        GraderFactory._grader_factories = {}
         # Re-register the default grader
         GraderFactory.register_grader(
             GraderTypeEnum.MULTIPLE_CHOICE, MultipleChoiceGrader
@@ -29,6 +31,7 @@ class TestGraderFactory:
 
         # Restore original state after test
         GraderFactory._graders = original_graders
+        GraderFactory._grader_factories = original_factories
 
     def test_register_grader_adds_to_registry(self):
         """Test that a grader can be registered correctly."""
@@ -45,8 +48,8 @@ class TestGraderFactory:
         GraderFactory.register_grader("test-type", TestGrader)
 
         # Assert
-        assert "test-type" in GraderFactory._graders
-        assert GraderFactory._graders["test-type"] == TestGrader
+        assert "test-type" in GraderFactory._grader_factories
+        assert GraderFactory._grader_factories["test-type"] == TestGrader
 
     def test_get_grader_returns_instance_of_registered_class(self):
         """Test that get_grader returns an instance of the registered class."""
@@ -56,14 +59,14 @@ class TestGraderFactory:
         # Assert
         assert isinstance(grader, MultipleChoiceGrader)
 
-    def test_get_grader_returns_new_instance_each_call(self):
-        """Test that each call to get_grader returns a new instance."""
+    def test_get_grader_returns_shared_instance(self):
+        """Test that every call to get_grader returns the same stateless instance."""
         # Act
         grader1 = GraderFactory.get_grader("multiple-choice")
         grader2 = GraderFactory.get_grader("multiple-choice")
 
         # Assert
-        assert grader1 is not grader2
+        assert grader1 is grader2
         assert isinstance(grader1, MultipleChoiceGrader)
         assert isinstance(grader2, MultipleChoiceGrader)
 
@@ -93,3 +96,47 @@ class TestGraderFactory:
         assert not isinstance(grader, MultipleChoiceGrader)
         assert grader.grade(mock_question, mock_answer) is True
         assert grader.calculate_score(True) == 100.0
+
+
+class TestGraderRegistry:
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self, monkeypatch):
+        monkeypatch.setattr(GraderFactory, "_graders", {})
+        monkeypatch.setattr(GraderFactory, "_grader_factories", {})
+        monkeypatch.setattr(GraderFactory, "_entry_points_loaded", True)
+
+    def test_registered_instance_is_returned(self):
+        grader = MultipleChoiceGrader()
+        GraderFactory.register_grader("multiple-choice", grader)
+
+        assert GraderFactory.get_grader("multiple-choice") is grader
+
+    def test_factory_is_called_once(self):
+        factory = Mock(return_value=MultipleChoiceGrader())
+        GraderFactory.register_grader(GraderTypeEnum.MULTIPLE_CHOICE, factory)
+
+        first = GraderFactory.get_grader("multiple-choice")
+        second = GraderFactory.get_grader("multiple-choice")
+
+        assert first is second
+        factory.assert_called_once_with()
+
+    def test_unknown_question_type_raises(self):
+        with pytest.raises(ValueError):
+            GraderFactory.get_grader("essay")
+
+    def test_entry_points_are_loaded_on_first_miss(self, monkeypatch):
+        grader = MultipleChoiceGrader()
+        entry_point = Mock()
+        entry_point.name = "true-false"
+        entry_point.load.return_value = grader
+        entry_points = Mock(return_value=[entry_point])
+        monkeypatch.setattr(
+            "src.library.grade_book_v2.question_grading.grader_factory.entry_points",
+            entry_points,
+        )
+        monkeypatch.setattr(GraderFactory, "_entry_points_loaded", False)
+
+        assert GraderFactory.get_grader("true-false") is grader
+        assert GraderFactory.get_grader("true-false") is grader
+        entry_points.assert_called_once_with(group=GraderFactory.ENTRY_POINT_GROUP)
@@ -1,8 +1,15 @@
 import logging
 from collections import namedtuple
-from typing import Dict
+from typing import Any, Dict, Type
 
+from django.db import models
+
+from src.apps.core.content.models import LearningObjective
+from src.apps.core.users.models import EdxUser
 from src.exceptions import QuestionNotFoundError
+from src.library.resource_context_cache import (ResourceContext,
+                                                ResourceContextCache,
+                                                build_question_index)
 from src.repository.question_repository.mongo.qn_repo import \
     MongoQuestionRepository
 from src.utils.mixins.resource import UserResourceContextMixin
@@ -10,11 +17,44 @@ from src.utils.mixins.resource import UserResourceContextMixin
 log = logging.getLogger(__name__)
 
 
+# question_ids indexes question_set_ids for membership checks; it is built once
+# per resolution and cached along with the rest of the resource context
 Resources = namedtuple(
-    "Resources", ("user", "learning_objective", "question_set_ids", "collection_name")
+    "Resources",
+    (
+        "user",
+        "learning_objective",
+        "question_set_ids",
+        "collection_name",
+        "question_ids",
+    ),
+    defaults=(frozenset(),),
 )
 
 
+def _deferred_instance(
+    model: Type[models.Model], pk: Any, **values: Any
+) -> models.Model:
+    """
+    Build a model instance from known field values, deferring all other fields.
+
+    Args:
+        model: The model class.
+        pk: The primary key of the existing row.
+        **values: Further field values known without a query.
+
+    Returns:
+        The instance; deferred fields are loaded from the database on access.
+    """
+    values[model._meta.pk.attname] = pk
+    field_names = [
+        field.attname
+        for field in model._meta.concrete_fields
+        if field.attname in values
+    ]
+    return model.from_db(None, field_names, [values[name] for name in field_names])
+
+
 class QuestionSetResourceProvider(UserResourceContextMixin):
     """
     Service class for providing question set resources and context.
@@ -36,19 +76,155 @@ class QuestionSetResourceProvider(UserResourceContextMixin):
         self._data = data
         self._initialize_resources()
 
+    @classmethod
+    async def acreate(cls, data: Dict[str, str]) -> "QuestionSetResourceProvider":
+        """
+        Async counterpart of the constructor, resolving resources with the async ORM.
+
+        Args:
+            data: Validated data dictionary containing 'username' and 'block_id' keys.
+
+        Returns:
+            QuestionSetResourceProvider: The initialized provider.
+
+        Raises:
+            Http404: If the user, learning objective or default question set
+                does not exist.
+        """
+        provider = cls.__new__(cls)
+        provider._data = data
+        await provider._ainitialize_resources()
+        return provider
+
     def _initialize_resources(self) -> None:
         """Initialize all required resources and validate their existence."""
-        self._user = self.get_edx_user_from_username(self._data["username"])
-        self._learning_objective = self.get_learning_objective_from_block_id(
+        username, block_id = self._data["username"], self._data["block_id"]
+        resource_cache = ResourceContextCache.get_cache()
+
+        context = resource_cache.get(username, block_id)
+        if context is not None:
+            resources = self._rebuild_resources(context)
+        else:
+            resources = self._resolve_resources()
+            resource_cache.set(username, block_id, self._to_context(resources))
+
+        self._set_resources(resources)
+
+    async def _ainitialize_resources(self) -> None:
+        """Async version of _initialize_resources."""
+        username, block_id = self._data["username"], self._data["block_id"]
+        resource_cache = ResourceContextCache.get_cache()
+
+        context = await resource_cache.aget(username, block_id)
+        if context is not None:
+            resources = self._rebuild_resources(context)
+        else:
+            resources = await self._aresolve_resources()
+            await resource_cache.aset(username, block_id, self._to_context(resources))
+
+        self._set_resources(resources)
+
+    def _resolve_resources(self) -> Resources:
+        """Look up all required resources in the database."""
+        user = self.get_edx_user_from_username(self._data["username"])
+        learning_objective = self.get_learning_objective_from_block_id(
             self._data["block_id"]
         )
 
-        self._collection_name = self.get_collection_name_from_subtopic(
-            self._learning_objective.sub_topic
+        collection_name = self.get_collection_name_from_subtopic(
+            learning_objective.sub_topic
+        )
+        question_set_ids = self.get_user_question_set(user, learning_objective)
+        return Resources(
+            user,
+            learning_objective,
+            question_set_ids,
+            collection_name,
+            build_question_index(question_set_ids),
+        )
+
+    async def _aresolve_resources(self) -> Resources:
+        """
+        Look up all required resources, in a single query once the user's
+        question set exists.
+
+        The user question set is loaded with its user and learning objective
+        (and the objective's sub_topic, topic and course) joined in. Only when
+        the set does not exist yet are the user, the learning objective and the
+        default question set looked up, one query each, to create it.
+        """
+        username, block_id = self._data["username"], self._data["block_id"]
+
+        user_question_set = await self.aget_user_question_set_with_context(
+            username, block_id
+        )
+        if user_question_set is not None:
+            user = user_question_set.user
+            learning_objective = user_question_set.learning_objective
+            question_set_ids = user_question_set.question_list_ids
+        else:
+            user = await self.aget_edx_user_from_username(username)
+            learning_objective = await self.aget_learning_objective_from_block_id(
+                block_id
+            )
+            default_question_set = await self.aget_default_question_set_from_block_id(
+                block_id
+            )
+            question_set_ids = await self.aget_user_question_set(
+                user, learning_objective, default_question_set
+            )
+
+        collection_name = self.get_collection_name_from_subtopic(
+            learning_objective.sub_topic
+        )
+        return Resources(
+            user,
+            learning_objective,
+            question_set_ids,
+            collection_name,
+            build_question_index(question_set_ids),
+        )
+
+    @staticmethod
+    def _to_context(resources: Resources) -> ResourceContext:
+        return ResourceContext(
+            user_id=resources.user.pk,
+            learning_objective_id=resources.learning_objective.pk,
+            collection_name=resources.collection_name,
+            question_set_ids=resources.question_set_ids,
+            question_ids=resources.question_ids,
+        )
+
+    def _rebuild_resources(self, context: ResourceContext) -> Resources:
+        """
+        Rebuild cached resources without querying the database.
+
+        The user and learning objective are instances holding only their primary
+        key and the username / block_id of the request; Django loads any other
+        field, and the related rows, when a caller first touches them.
+        """
+        user = _deferred_instance(
+            EdxUser, context.user_id, username=self._data["username"]
         )
-        self._question_set_ids = self.get_user_question_set(
-            self._user, self._learning_objective
+        learning_objective = _deferred_instance(
+            LearningObjective,
+            context.learning_objective_id,
+            block_id=self._data["block_id"],
         )
+        return Resources(
+            user,
+            learning_objective,
+            context.question_set_ids,
+            context.collection_name,
+            context.question_ids,
+        )
+
+    def _set_resources(self, resources: Resources) -> None:
+        self._user = resources.user
+        self._learning_objective = resources.learning_objective
+        self._question_set_ids = resources.question_set_ids
+        self._collection_name = resources.collection_name
+        self._question_ids = resources.question_ids
         self._question_repo = MongoQuestionRepository.get_repo()
 
     def _validate_question_exists(self, question_id: str) -> bool:
@@ -64,8 +240,7 @@ class QuestionSetResourceProvider(UserResourceContextMixin):
         Raises:
             QuestionNotFoundError: If the question ID is not found.
         """
-        question_ids = {question["id"] for question in self._question_set_ids}
-        if question_id not in question_ids:
+        if question_id not in self._question_ids:
             log.error(
                 "Question ID '%s' not found in question set for user '%s'",
                 question_id,
@@ -98,6 +273,7 @@ class QuestionSetResourceProvider(UserResourceContextMixin):
             self._learning_objective,
             self._question_set_ids,
             self._collection_name,
+            self._question_ids,
         )
 
     def __repr__(self):
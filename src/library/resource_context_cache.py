@@ -0,0 +1,336 @@
+"""
+library.resource_context_cache
+~~~~~~~~~~~~
+
+Short-lived cache of resolved question set resources keyed by (username,
+block_id), with a process-local tier in front of a shared Redis tier.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from redis import Redis, RedisError
+
+from src.apps.learning_tools.questions.models import UserQuestionSet
+
+logger = logging.getLogger(__name__)
+
+ContextKey = Tuple[str, str]
+
+# The primitive parts of resolved Resources; the user and learning objective
+# are reloaded by primary key. question_ids is not stored in Redis and is
+# rebuilt from question_set_ids when an entry is read from there.
+ResourceContext = namedtuple(
+    "ResourceContext",
+    (
+        "user_id",
+        "learning_objective_id",
+        "collection_name",
+        "question_set_ids",
+        "question_ids",
+    ),
+)
+
+
+def build_question_index(question_set_ids: List[Dict[str, str]]) -> FrozenSet[str]:
+    """Return the IDs of a question list as a frozenset"""
+    return frozenset(question["id"] for question in question_set_ids)
+
+
+class ResourceContextCache:
+    """
+    Cache of resolved resource contexts, so polling endpoints skip the
+    question set lookups.
+
+    Only primitives are cached, as JSON in Redis. Entries are dropped when a
+    write to the user's question set commits and when the course is synced. Invalidation
+    only clears the local tier of the current process, so the local TTL is
+    kept short to bound staleness elsewhere.
+    """
+
+    REDIS_KEY_PREFIX = "resource_context:v1"
+    DEFAULT_LOCAL_MAX_SIZE = 2000
+    DEFAULT_LOCAL_TTL_SECONDS = 5
+    DEFAULT_REDIS_TTL_SECONDS = 60
+
+    __slots__ = (
+        "_redis_client",
+        "_redis_ttl_seconds",
+        "_local_max_size",
+        "_local_ttl_seconds",
+        "_entries",
+        "_lock",
+    )
+
+    _default_cache: Optional["ResourceContextCache"] = None
+
+    def __init__(
+        self,
+        redis_client: Optional[Redis] = None,
+        local_max_size: int = DEFAULT_LOCAL_MAX_SIZE,
+        local_ttl_seconds: float = DEFAULT_LOCAL_TTL_SECONDS,
+        redis_ttl_seconds: int = DEFAULT_REDIS_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the ResourceContextCache.
+
+        Args:
+            redis_client: Shared Redis client; the Redis tier is skipped when None
+            local_max_size: Maximum number of contexts held in the local tier
+            local_ttl_seconds: Lifetime of local entries
+            redis_ttl_seconds: Lifetime of Redis entries
+        """
+        self._redis_client = redis_client
+        self._redis_ttl_seconds = redis_ttl_seconds
+        self._local_max_size = local_max_size
+        self._local_ttl_seconds = local_ttl_seconds
+        self._entries: OrderedDict[ContextKey, Tuple[float, ResourceContext]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, username: str, block_id: str) -> Optional[ResourceContext]:
+        """
+        Return the cached context of a user and learning objective, if any.
+
+        Args:
+            username: The user's username
+            block_id: The learning objective's block ID
+
+        Returns:
+            The cached ResourceContext, or None on a miss
+        """
+        key = (username, block_id)
+        context = self._get_local(key)
+        if context is not None:
+            return context
+
+        if self._redis_client is None:
+            return None
+
+        try:
+            payload = self._redis_client.get(self._redis_key(key))
+        except RedisError as e:
+            logger.warning("Failed to read resource context from Redis: %s", e)
+            return None
+
+        if payload is None:
+            return None
+
+        try:
+            data = json.loads(payload)
+            context = ResourceContext(
+                user_id=data["user_id"],
+                learning_objective_id=data["learning_objective_id"],
+                collection_name=data["collection_name"],
+                question_set_ids=data["question_set_ids"],
+                question_ids=build_question_index(data["question_set_ids"]),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Discarding invalid cached resource context: %s", e)
+            return None
+
+        self._set_local(key, context)
+        return context
+
+    def set(self, username: str, block_id: str, context: ResourceContext) -> None:
+        """
+        Cache a resolved context in both tiers.
+
+        Args:
+            username: The user's username
+            block_id: The learning objective's block ID
+            context: The resolved context
+        """
+        key = (username, block_id)
+        self._set_local(key, context)
+
+        if self._redis_client is None:
+            return
+
+        redis_key = self._redis_key(key)
+        course_key = self._course_index_key(context.collection_name)
+        payload = {
+            "user_id": context.user_id,
+            "learning_objective_id": context.learning_objective_id,
+            "collection_name": context.collection_name,
+            "question_set_ids": context.question_set_ids,
+        }
+        try:
+            pipe = self._redis_client.pipeline()
+            pipe.set(redis_key, json.dumps(payload), ex=self._redis_ttl_seconds)
+            pipe.set(
+                self._question_set_key(context.user_id, context.learning_objective_id),
+                redis_key,
+                ex=self._redis_ttl_seconds,
+            )
+            pipe.sadd(course_key, redis_key)
+            pipe.expire(course_key, self._redis_ttl_seconds)
+            pipe.execute()
+        except RedisError as e:
+            logger.warning("Failed to write resource context to Redis: %s", e)
+
+    async def aget(self, username: str, block_id: str) -> Optional[ResourceContext]:
+        """Async version of get, keeping Redis I/O off the event loop"""
+        key = (username, block_id)
+        context = self._get_local(key)
+        if context is not None or self._redis_client is None:
+            return context
+        return await sync_to_async(self.get, thread_sensitive=False)(username, block_id)
+
+    async def aset(
+        self, username: str, block_id: str, context: ResourceContext
+    ) -> None:
+        """Async version of set, keeping Redis I/O off the event loop"""
+        await sync_to_async(self.set, thread_sensitive=False)(
+            username, block_id, context
+        )
+
+    def invalidate(self, user_id: int, learning_objective_id: int) -> None:
+        """
+        Drop the cached context of a user and learning objective.
+
+        Args:
+            user_id: Primary key of the user
+            learning_objective_id: Primary key of the learning objective
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, (_, context) in self._entries.items()
+                if context.user_id == user_id
+                and context.learning_objective_id == learning_objective_id
+            ]:
+                del self._entries[key]
+
+        if self._redis_client is None:
+            return
+
+        question_set_key = self._question_set_key(user_id, learning_objective_id)
+        try:
+            redis_key = self._redis_client.get(question_set_key)
+            if redis_key is None:
+                self._redis_client.delete(question_set_key)
+            else:
+                self._redis_client.delete(question_set_key, redis_key)
+        except RedisError as e:
+            logger.warning("Failed to invalidate resource context in Redis: %s", e)
+
+    def invalidate_course(self, course_key: str) -> None:
+        """
+        Drop every cached context of a course, e.g. after course sync.
+
+        Args:
+            course_key: The course key, which is also the collection name
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, (_, context) in self._entries.items()
+                if context.collection_name == course_key
+            ]:
+                del self._entries[key]
+
+        if self._redis_client is None:
+            return
+
+        index_key = self._course_index_key(course_key)
+        try:
+            keys = self._redis_client.smembers(index_key)
+            self._redis_client.delete(index_key, *keys)
+        except RedisError as e:
+            logger.warning(
+                "Failed to invalidate resource contexts of %s in Redis: %s",
+                course_key,
+                e,
+            )
+        logger.info("Invalidated resource contexts of course %s", course_key)
+
+    def _get_local(self, key: ContextKey) -> Optional[ResourceContext]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, context = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return context
+
+    def _set_local(self, key: ContextKey, context: ResourceContext) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._local_ttl_seconds, context)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._local_max_size:
+                self._entries.popitem(last=False)
+
+    def _redis_key(self, key: ContextKey) -> str:
+        username, block_id = key
+        return f"{self.REDIS_KEY_PREFIX}:{username}:{block_id}"
+
+    def _course_index_key(self, course_key: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}:course:{course_key}"
+
+    def _question_set_key(self, user_id: int, learning_objective_id: int) -> str:
+        """Key pointing a user question set at the context cached for it"""
+        return f"{self.REDIS_KEY_PREFIX}:question_set:{user_id}:{learning_objective_id}"
+
+    @classmethod
+    def get_cache(cls) -> "ResourceContextCache":
+        """Return the process-wide cache over the shared Redis client"""
+        if cls._default_cache is None:
+            from src.config.settings.redis import REDIS_CLIENT
+
+            cls._default_cache = cls(redis_client=REDIS_CLIENT)
+        return cls._default_cache
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {len(self._entries)} local entries>"
+
+
+def invalidate_resource_context_cache(course_key: str) -> None:
+    """Invalidate cached resource contexts after course sync"""
+    ResourceContextCache.get_cache().invalidate_course(course_key)
+
+
+def invalidate_user_question_set_context(
+    user_id: int, learning_objective_id: int, using: Optional[str] = None
+) -> None:
+    """
+    Invalidate the cached context of a user question set once the write commits.
+
+    Invalidating before the commit would let a concurrent reader cache the
+    old row again. post_save and post_delete of UserQuestionSet call this;
+    writes that bypass those signals, i.e. QuerySet.update() and
+    bulk_update(), must call it themselves.
+
+    Args:
+        user_id: Primary key of the user
+        learning_objective_id: Primary key of the learning objective
+        using: Database alias of the writing transaction
+    """
+    transaction.on_commit(
+        lambda: ResourceContextCache.get_cache().invalidate(
+            user_id, learning_objective_id
+        ),
+        using=using,
+    )
+
+
+@receiver([post_save, post_delete], sender=UserQuestionSet)
+def _invalidate_user_question_set(sender, instance: UserQuestionSet, **kwargs) -> None:
+    # Keyed on the foreign key IDs, so the signal never loads the related rows
+    invalidate_user_question_set_context(
+        instance.user_id, instance.learning_objective_id, using=kwargs.get("using")
+    )
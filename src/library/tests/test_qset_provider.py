@@ -0,0 +1,180 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.exceptions import QuestionNotFoundError
+from src.library.qset_provider import (QuestionSetResourceProvider, Resources,
+                                       build_question_index)
+from src.library.resource_context_cache import ResourceContextCache
+
+
+@pytest.fixture
+def resource_cache():
+    with (
+        patch.object(
+            ResourceContextCache, "get_cache", return_value=ResourceContextCache()
+        ) as get_cache,
+        patch("src.library.qset_provider.MongoQuestionRepository.get_repo"),
+        patch("src.library.qset_provider.EdxUser"),
+        patch("src.library.qset_provider.LearningObjective"),
+    ):
+        yield get_cache.return_value
+
+
+def _resolved(question_set_ids):
+    return Resources(
+        MagicMock(id=1, pk=1),
+        MagicMock(pk=2),
+        question_set_ids,
+        "course-v1:Org+Course+Run",
+        build_question_index(question_set_ids),
+    )
+
+
+class TestQuestionSetResourceProvider:
+    def test_question_index_is_built_once_per_resolution(self, resource_cache):
+        question_set_ids = [{"id": "q1"}, {"id": "q2"}]
+        with patch.object(
+            QuestionSetResourceProvider,
+            "_resolve_resources",
+            return_value=_resolved(question_set_ids),
+        ) as resolve:
+            QuestionSetResourceProvider({"username": "student", "block_id": "b1"})
+            provider = QuestionSetResourceProvider(
+                {"username": "student", "block_id": "b1", "question_id": "q2"}
+            )
+
+        resources = provider.get_resources()
+
+        resolve.assert_called_once()
+        assert resources.question_ids == frozenset({"q1", "q2"})
+        assert resources.question_set_ids == question_set_ids
+
+    def test_cache_hit_builds_deferred_instances_without_queries(self, resource_cache):
+        with (
+            patch.object(
+                QuestionSetResourceProvider,
+                "_resolve_resources",
+                return_value=_resolved([{"id": "q1"}]),
+            ),
+            patch("src.library.qset_provider.EdxUser") as edx_user,
+            patch("src.library.qset_provider.LearningObjective") as learning_objective,
+        ):
+            for model, field in (
+                (edx_user, "username"),
+                (learning_objective, "block_id"),
+            ):
+                model._meta.pk.attname = "id"
+                model._meta.concrete_fields = [
+                    SimpleNamespace(attname="id"),
+                    SimpleNamespace(attname="created"),
+                    SimpleNamespace(attname=field),
+                ]
+            QuestionSetResourceProvider({"username": "student", "block_id": "b1"})
+            provider = QuestionSetResourceProvider(
+                {"username": "student", "block_id": "b1"}
+            )
+
+        resources = provider.get_resources()
+
+        edx_user.objects.filter.assert_not_called()
+        learning_objective.objects.filter.assert_not_called()
+        edx_user.from_db.assert_called_once_with(
+            None, ["id", "username"], [1, "student"]
+        )
+        learning_objective.from_db.assert_called_once_with(
+            None, ["id", "block_id"], [2, "b1"]
+        )
+        assert resources.user is edx_user.from_db.return_value
+        assert resources.learning_objective is learning_objective.from_db.return_value
+
+    def test_unknown_question_raises(self, resource_cache):
+        with patch.object(
+            QuestionSetResourceProvider,
+            "_resolve_resources",
+            return_value=_resolved([{"id": "q1"}]),
+        ):
+            provider = QuestionSetResourceProvider(
+                {"username": "student", "block_id": "b1", "question_id": "q9"}
+            )
+
+        with pytest.raises(QuestionNotFoundError):
+            provider.get_resources()
+
+
+@pytest.mark.asyncio
+class TestAsyncResolution:
+    @pytest.fixture
+    def provider(self):
+        provider = QuestionSetResourceProvider.__new__(QuestionSetResourceProvider)
+        provider._data = {"username": "student", "block_id": "b1"}
+        return provider
+
+    @pytest.fixture
+    def learning_objective(self):
+        return MagicMock(sub_topic=MagicMock())
+
+    async def test_existing_question_set_is_resolved_in_one_query(
+        self, provider, learning_objective
+    ):
+        user_question_set = MagicMock(
+            learning_objective=learning_objective, question_list_ids=[{"id": "q1"}]
+        )
+        with (
+            patch.object(
+                QuestionSetResourceProvider,
+                "aget_user_question_set_with_context",
+                AsyncMock(return_value=user_question_set),
+            ) as lookup,
+            patch.object(
+                QuestionSetResourceProvider, "aget_edx_user_from_username"
+            ) as get_user,
+            patch.object(
+                QuestionSetResourceProvider,
+                "get_collection_name_from_subtopic",
+                return_value="course",
+            ),
+        ):
+            resources = await provider._aresolve_resources()
+
+        lookup.assert_awaited_once_with("student", "b1")
+        get_user.assert_not_called()
+        assert resources.user is user_question_set.user
+        assert resources.question_ids == frozenset({"q1"})
+
+    async def test_missing_question_set_is_created(self, provider, learning_objective):
+        with (
+            patch.object(
+                QuestionSetResourceProvider,
+                "aget_user_question_set_with_context",
+                AsyncMock(return_value=None),
+            ),
+            patch.object(
+                QuestionSetResourceProvider, "aget_edx_user_from_username", AsyncMock()
+            ),
+            patch.object(
+                QuestionSetResourceProvider,
+                "aget_learning_objective_from_block_id",
+                AsyncMock(return_value=learning_objective),
+            ),
+            patch.object(
+                QuestionSetResourceProvider,
+                "aget_default_question_set_from_block_id",
+                AsyncMock(),
+            ),
+            patch.object(
+                QuestionSetResourceProvider,
+                "aget_user_question_set",
+                AsyncMock(return_value=[{"id": "q2"}]),
+            ) as create,
+            patch.object(
+                QuestionSetResourceProvider,
+                "get_collection_name_from_subtopic",
+                return_value="course",
+            ),
+        ):
+            resources = await provider._aresolve_resources()
+
+        create.assert_awaited_once()
+        assert resources.question_set_ids == [{"id": "q2"}]
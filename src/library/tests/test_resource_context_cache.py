@@ -0,0 +1,140 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.library.resource_context_cache import (ResourceContext,
+                                                ResourceContextCache,
+                                                _invalidate_user_question_set,
+                                                build_question_index)
+
+
+def _context(collection_name="course-v1:Org+Course+Run", user_id=1):
+    question_set_ids = [{"id": "q1"}]
+    return ResourceContext(
+        user_id=user_id,
+        learning_objective_id=2,
+        collection_name=collection_name,
+        question_set_ids=question_set_ids,
+        question_ids=build_question_index(question_set_ids),
+    )
+
+
+class TestResourceContextCache:
+    def test_local_hit_skips_redis(self):
+        redis_client = MagicMock()
+        cache = ResourceContextCache(redis_client=redis_client)
+        context = _context()
+
+        cache.set("student", "block-1", context)
+
+        assert cache.get("student", "block-1") == context
+        redis_client.get.assert_not_called()
+
+    def test_redis_stores_primitives_as_json(self):
+        redis_client = MagicMock()
+        pipe = redis_client.pipeline.return_value
+        cache = ResourceContextCache(redis_client=redis_client)
+
+        cache.set("student", "block-1", _context())
+
+        pipe.set.assert_any_call(
+            "resource_context:v1:student:block-1",
+            json.dumps(
+                {
+                    "user_id": 1,
+                    "learning_objective_id": 2,
+                    "collection_name": "course-v1:Org+Course+Run",
+                    "question_set_ids": [{"id": "q1"}],
+                }
+            ),
+            ex=60,
+        )
+
+    def test_redis_hit_rebuilds_index_and_fills_local_tier(self):
+        redis_client = MagicMock()
+        redis_client.get.return_value = json.dumps(
+            {
+                "user_id": 1,
+                "learning_objective_id": 2,
+                "collection_name": "course-v1:Org+Course+Run",
+                "question_set_ids": [{"id": "q1"}],
+            }
+        )
+        cache = ResourceContextCache(redis_client=redis_client)
+
+        assert cache.get("student", "block-1") == _context()
+        assert cache.get("student", "block-1") == _context()
+        redis_client.get.assert_called_once_with("resource_context:v1:student:block-1")
+
+    def test_invalid_redis_entry_is_a_miss(self):
+        redis_client = MagicMock()
+        redis_client.get.return_value = b"\x80\x04not json"
+        cache = ResourceContextCache(redis_client=redis_client)
+
+        assert cache.get("student", "block-1") is None
+
+    def test_local_entries_expire(self):
+        cache = ResourceContextCache(local_ttl_seconds=0)
+        cache.set("student", "block-1", _context())
+
+        assert cache.get("student", "block-1") is None
+
+    def test_invalidate_drops_both_tiers(self):
+        redis_client = MagicMock()
+        redis_client.get.side_effect = [b"resource_context:v1:student:block-1", None]
+        cache = ResourceContextCache(redis_client=redis_client)
+        cache.set("student", "block-1", _context())
+        cache.set("other", "block-1", _context(user_id=3))
+
+        cache.invalidate(user_id=1, learning_objective_id=2)
+
+        assert cache.get("student", "block-1") is None
+        assert cache.get("other", "block-1") == _context(user_id=3)
+        redis_client.get.assert_any_call("resource_context:v1:question_set:1:2")
+        redis_client.delete.assert_called_once_with(
+            "resource_context:v1:question_set:1:2",
+            b"resource_context:v1:student:block-1",
+        )
+
+    def test_question_set_signal_invalidates_on_commit(self):
+        # Accessing instance.user or instance.learning_objective would raise
+        instance = SimpleNamespace(user_id=1, learning_objective_id=2)
+        cache = ResourceContextCache()
+        cache.set("student", "block-1", _context())
+
+        with (
+            patch.object(ResourceContextCache, "_default_cache", cache),
+            patch(
+                "src.library.resource_context_cache.transaction.on_commit"
+            ) as on_commit,
+        ):
+            _invalidate_user_question_set(
+                sender=None, instance=instance, using="default"
+            )
+
+            # Nothing is dropped before the writing transaction commits
+            assert cache.get("student", "block-1") == _context()
+            assert on_commit.call_args.kwargs == {"using": "default"}
+            on_commit.call_args.args[0]()
+
+        assert cache.get("student", "block-1") is None
+
+    def test_invalidate_course_only_drops_that_course(self):
+        cache = ResourceContextCache()
+        cache.set("student", "block-1", _context("course-a"))
+        cache.set("student", "block-2", _context("course-b"))
+
+        cache.invalidate_course("course-a")
+
+        assert cache.get("student", "block-1") is None
+        assert cache.get("student", "block-2") == _context("course-b")
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self):
+        cache = ResourceContextCache()
+
+        await cache.aset("student", "block-1", _context())
+
+        assert await cache.aget("student", "block-1") == _context()
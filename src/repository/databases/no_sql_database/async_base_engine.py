@@ -1,6 +1,8 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Union
+
+from .data_types import BulkWriteSummary, Page, WriteOperation
 
 log = logging.getLogger(__name__)
 
@@ -43,6 +45,69 @@ class AsyncAbstractNoSqLDatabaseEngine(ABC):
         """
         raise NotImplementedError("Must implement fetch_from_db")
 
+    @abstractmethod
+    async def stream_from_db(
+        self,
+        collection_name: str,
+        database_name: str,
+        query: Dict | None = None,
+        projection: Dict | None = None,
+        sort: List[tuple] | None = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncGenerator[Dict, None]:
+        """
+        Stream every matching document from a database collection.
+
+        Unlike fetch_from_db there is no limit: all matching documents are
+        yielded one at a time from a single server-side cursor.
+
+        Args:
+            collection_name: Collection name
+            database_name: Database name
+            query: Query filter
+            projection: Fields to include/exclude
+            sort: Sort criteria as (field, direction) tuples
+            batch_size: Documents per server round trip (derived from
+                document size when omitted)
+
+        Returns:
+            AsyncGenerator yielding individual documents
+        """
+        raise NotImplementedError("Must implement stream_from_db")
+
+    @abstractmethod
+    async def fetch_page_from_db(
+        self,
+        collection_name: str,
+        database_name: str,
+        query: Dict | None = None,
+        projection: Dict | None = None,
+        sort: List[tuple] | None = None,
+        page_size: int = 50,
+        continuation_token: Optional[str] = None,
+    ) -> Page:
+        """
+        Fetch one page of a listing, resuming after the previous page.
+
+        Pages are keyed on the sort key values rather than an offset, so
+        every page costs the same regardless of its position in the listing.
+
+        Args:
+            collection_name: Collection name
+            database_name: Database name
+            query: Query filter
+            projection: Fields to include/exclude
+            sort: Sort criteria as (field, direction) tuples, made unique
+                with _id; defaults to _id
+            page_size: Documents per page
+            continuation_token: Token returned with the previous page, None
+                for the first page
+
+        Returns:
+            Page of documents with the token of the next page
+        """
+        raise NotImplementedError("Must implement fetch_page_from_db")
+
     @abstractmethod
     async def fetch_one_from_db(
         self,
@@ -87,6 +152,31 @@ class AsyncAbstractNoSqLDatabaseEngine(ABC):
         """
         raise NotImplementedError("Must implement write_to_db")
 
+    @abstractmethod
+    async def bulk_write_to_db(
+        self,
+        operations: Sequence[WriteOperation],
+        collection_name: str,
+        database_name: str,
+        timestamp: bool = True,
+    ) -> BulkWriteSummary:
+        """
+        Apply mixed inserts, updates, upserts and deletes in one round trip.
+
+        Operations are independent: a failing operation does not keep the
+        others from being applied.
+
+        Args:
+            operations: Write operations to apply
+            collection_name: Collection name
+            database_name: Database name
+            timestamp: Add timestamp to inserted documents
+
+        Returns:
+            Counts of affected documents
+        """
+        raise NotImplementedError("Must implement bulk_write_to_db")
+
     @abstractmethod
     async def update_one_to_db(
         self,
@@ -131,6 +221,15 @@ class AsyncAbstractNoSqLDatabaseEngine(ABC):
         """
         raise NotImplementedError("Must implement run_aggregation")
 
+    @abstractmethod
+    async def connect(self) -> None:
+        """
+        Open the connection to the database ahead of the first operation.
+
+        Should be safe to call more than once and concurrently.
+        """
+        raise NotImplementedError("Must implement connect")
+
     @abstractmethod
     async def disconnect(self) -> None:
         """
@@ -0,0 +1,327 @@
+"""
+no_sql_database.circuit_breaker
+~~~~~~~~~~~~
+
+Fast failure and load shedding for database operations: a circuit breaker
+per database stops calls to a failing database, and a bound on operations
+in flight sheds excess load instead of queueing it behind a slow database.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from contextlib import aclosing, asynccontextmanager
+from enum import Enum
+from typing import (AsyncGenerator, AsyncIterator, Awaitable, Callable, Dict,
+                    TypeVar)
+
+from pymongo.errors import ExecutionTimeout, OperationFailure, WTimeoutError
+
+from src.exceptions import (MongoDbCircuitOpenError, MongoDbConnectionError,
+                            MongoDbOverloadedError,
+                            MongoDbTemporaryConnectionError,
+                            MongoDbTemporaryOperationError)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Errors showing the database is unhealthy; other errors say nothing about it
+FAILURE_ERRORS = (
+    MongoDbConnectionError,
+    MongoDbTemporaryConnectionError,
+    MongoDbTemporaryOperationError,
+)
+
+# A server error reported as an OperationFailure only shows the database is
+# unhealthy if the server labels it transient; a bad query, a failed
+# validation or a missing permission fails the same way on a healthy one
+TRANSIENT_ERROR_LABELS = (
+    "TransientTransactionError",
+    "RetryableWriteError",
+    "RetryableError",
+    "SystemOverloadedError",
+)
+
+
+def shows_database_unhealthy(error: BaseException) -> bool:
+    """
+    Check whether an error raised by an operation counts as a database failure.
+
+    Args:
+        error: The error the operation raised
+
+    Returns:
+        bool: True for connection errors, timeouts and labelled transient
+            server errors
+    """
+    if not isinstance(error, FAILURE_ERRORS):
+        return False
+
+    cause = error.__cause__
+    if isinstance(cause, OperationFailure) and not isinstance(
+        cause, (ExecutionTimeout, WTimeoutError)
+    ):
+        return any(cause.has_error_label(label) for label in TRANSIENT_ERROR_LABELS)
+    return True
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single database.
+
+    The circuit opens after failure_threshold consecutive failures and then
+    rejects calls for reset_timeout_seconds. After that it is half-open and
+    admits up to half_open_max_calls probes: a successful probe closes it,
+    a failed one opens it again.
+    """
+
+    __slots__ = (
+        "name",
+        "_failure_threshold",
+        "_reset_timeout_seconds",
+        "_half_open_max_calls",
+        "_state",
+        "_failures",
+        "_opened_at",
+        "_probes",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+            logger.info("Circuit of %s half-open, probing", self.name)
+        return self._state
+
+    def acquire(self) -> None:
+        """
+        Admit a call.
+
+        Raises:
+            MongoDbCircuitOpenError: If the circuit is open, or half-open with
+                all probes already in flight
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+
+        if state is CircuitState.HALF_OPEN and self._probes < self._half_open_max_calls:
+            self._probes += 1
+            return
+
+        raise MongoDbCircuitOpenError(
+            database=self.name,
+            retry_after_seconds=max(
+                0.0,
+                self._opened_at + self._reset_timeout_seconds - time.monotonic(),
+            ),
+        )
+
+    def record_success(self) -> None:
+        if self._state is CircuitState.OPEN:
+            # A call admitted before the circuit opened; wait for the probes
+            return
+        if self._state is CircuitState.HALF_OPEN:
+            logger.info("Circuit of %s closed", self.name)
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probes = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            if self._state is not CircuitState.OPEN:
+                logger.error(
+                    "Circuit of %s opened after %d consecutive failure(s)",
+                    self.name,
+                    self._failures,
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._probes = 0
+
+    def release(self) -> None:
+        """Release a call that ended without showing whether the database is healthy"""
+        if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.name} {self._state.value}>"
+
+
+class OperationGuard:
+    """
+    Admits database operations past the circuit breakers and in-flight bound.
+
+    Operations beyond max_in_flight are rejected at once rather than queued,
+    so a slow database cannot tie up every worker.
+    """
+
+    __slots__ = (
+        "_max_in_flight",
+        "_in_flight",
+        "_breaker_options",
+        "_breakers",
+    )
+
+    def __init__(
+        self,
+        max_in_flight: int = 200,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """
+        Initialize the OperationGuard.
+
+        Args:
+            max_in_flight: Operations admitted at the same time
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout_seconds: Time an open circuit rejects calls
+            half_open_max_calls: Probes admitted while a circuit is half-open
+        """
+        self._max_in_flight = max_in_flight
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._breaker_options = {
+            "failure_threshold": failure_threshold,
+            "reset_timeout_seconds": reset_timeout_seconds,
+            "half_open_max_calls": half_open_max_calls,
+        }
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker_for(self, database_name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(database_name)
+        if breaker is None:
+            breaker = self._breakers[database_name] = CircuitBreaker(
+                database_name, **self._breaker_options
+            )
+        return breaker
+
+    def circuit_states(self) -> Dict[str, CircuitState]:
+        """Return the circuit state of every database used so far"""
+        return {name: breaker.state for name, breaker in self._breakers.items()}
+
+    @asynccontextmanager
+    async def admit(self, database_name: str) -> AsyncIterator[None]:
+        """
+        Run the block as an operation on database_name.
+
+        Raises:
+            MongoDbOverloadedError: If max_in_flight operations are running
+            MongoDbCircuitOpenError: If the database's circuit is open
+        """
+        if self._in_flight.locked():
+            logger.warning(
+                "Shedding operation on %s: %d operations in flight",
+                database_name,
+                self._max_in_flight,
+            )
+            raise MongoDbOverloadedError(max_in_flight=self._max_in_flight)
+
+        breaker = self.breaker_for(database_name)
+        breaker.acquire()
+        await self._in_flight.acquire()
+        try:
+            yield
+        except BaseException as e:
+            if shows_database_unhealthy(e):
+                breaker.record_failure()
+            else:
+                breaker.release()
+            raise
+        else:
+            breaker.record_success()
+        finally:
+            self._in_flight.release()
+
+    async def run(self, database_name: str, call: Callable[[], Awaitable[T]]) -> T:
+        async with self.admit(database_name):
+            return await call()
+
+    async def stream(
+        self,
+        database_name: str,
+        open_stream: Callable[[], Awaitable[AsyncGenerator[T, None]]],
+    ) -> AsyncGenerator[T, None]:
+        """
+        Yield from a stream, holding an in-flight slot until it ends.
+
+        The slot is released when the stream is exhausted, fails or is closed;
+        a consumer leaving the stream early must close it, e.g. with
+        contextlib.aclosing, or the slot is held until it is garbage collected.
+        """
+        async with (
+            self.admit(database_name),
+            aclosing(await open_stream()) as items,
+        ):
+            async for item in items:
+                yield item
+
+
+def _database_name_getter(method) -> Callable[..., str]:
+    signature = inspect.signature(method)
+
+    def get_database_name(self, *args, **kwargs) -> str:
+        return signature.bind(self, *args, **kwargs).arguments["database_name"]
+
+    return get_database_name
+
+
+def guarded(method):
+    """Run an engine coroutine method under the engine's operation guard"""
+    get_database_name = _database_name_getter(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await self._guard.run(
+            get_database_name(self, *args, **kwargs),
+            lambda: method(self, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+def guarded_stream(method):
+    """Run an engine method returning an async generator under the operation guard"""
+    get_database_name = _database_name_getter(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return self._guard.stream(
+            get_database_name(self, *args, **kwargs),
+            lambda: method(self, *args, **kwargs),
+        )
+
+    return wrapper
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class WriteOperationType(Enum):
+    """Kinds of single-document writes accepted by bulk_write_to_db"""
+
+    INSERT = "insert"
+    UPDATE = "update"
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class WriteOperation:
+    """
+    A single-document write, part of a bulk write.
+
+    Inserts carry a document, updates and upserts a query and update
+    operators, deletes a query.
+    """
+
+    operation: WriteOperationType
+    query: Optional[Dict] = None
+    document: Optional[Dict] = None
+    update: Optional[Dict] = None
+
+    def __post_init__(self):
+        if self.operation is WriteOperationType.INSERT:
+            if self.document is None:
+                raise ValueError("Insert operations require a document")
+        elif self.query is None:
+            raise ValueError(f"{self.operation.value} operations require a query")
+        elif self.operation is not WriteOperationType.DELETE and not self.update:
+            raise ValueError(f"{self.operation.value} operations require an update")
+
+    @classmethod
+    def insert(cls, document: Dict) -> "WriteOperation":
+        return cls(WriteOperationType.INSERT, document=document)
+
+    @classmethod
+    def update_one(cls, query: Dict, update: Dict) -> "WriteOperation":
+        return cls(WriteOperationType.UPDATE, query=query, update=update)
+
+    @classmethod
+    def upsert(cls, query: Dict, update: Dict) -> "WriteOperation":
+        return cls(WriteOperationType.UPSERT, query=query, update=update)
+
+    @classmethod
+    def delete_one(cls, query: Dict) -> "WriteOperation":
+        return cls(WriteOperationType.DELETE, query=query)
+
+
+@dataclass(frozen=True)
+class BulkWriteSummary:
+    """Counts of documents affected by a bulk write"""
+
+    inserted_count: int = 0
+    matched_count: int = 0
+    modified_count: int = 0
+    upserted_count: int = 0
+    deleted_count: int = 0
+
+
+@dataclass(frozen=True)
+class Page:
+    """
+    A page of a keyset-paginated listing.
+
+    next_token resumes the listing after the page, None on the last page.
+    """
+
+    items: List[Any]
+    next_token: Optional[str] = None
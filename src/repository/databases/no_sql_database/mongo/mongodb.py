@@ -1,12 +1,14 @@
+import asyncio
 import logging
+import weakref
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Union
 from urllib.parse import ParseResult, urlparse
 
 import certifi
 from django.conf import settings
-from pymongo import AsyncMongoClient
-from pymongo.errors import (AutoReconnect, ConfigurationError,
+from pymongo import AsyncMongoClient, DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import (AutoReconnect, BulkWriteError, ConfigurationError,
                             ConnectionFailure, CursorNotFound,
                             DocumentTooLarge, DuplicateKeyError,
                             ExecutionTimeout, NetworkTimeout, NotPrimaryError,
@@ -19,6 +21,13 @@ from src.exceptions import (MongoDbConfigurationError, MongoDbConnectionError,
                             MongoDbTemporaryOperationError)
 
 from ..async_base_engine import AsyncAbstractNoSqLDatabaseEngine
+from ..circuit_breaker import (CircuitState, OperationGuard, guarded,
+                               guarded_stream)
+from ..data_types import (BulkWriteSummary, Page, WriteOperation,
+                          WriteOperationType)
+from ..pagination import (decode_continuation_token, encode_continuation_token,
+                          keyset_filter, normalize_sort, sort_projection)
+from ..retry import Retrier, RetryPolicy, retried, retried_stream
 
 logger = logging.getLogger(__name__)
 
@@ -28,10 +37,33 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
     Async MongoDB engine with connection management and error handling.
     """
 
-    __slots__ = ("_url", "_client")
+    __slots__ = (
+        "_url",
+        "_client",
+        "_client_locks",
+        "_client_options",
+        "_retrier",
+        "_guard",
+        "_average_document_sizes",
+    )
+
+    # Byte budget for a single streamed cursor batch; batch sizes are derived
+    # from it using the collection's average document size.
+    STREAM_BATCH_BYTES = 4 * 1024 * 1024
+    MIN_STREAM_BATCH_SIZE = 10
+    MAX_STREAM_BATCH_SIZE = 1000
 
     def __init__(
-        self, mongo_url: Optional[str] = None, client: Optional[AsyncMongoClient] = None
+        self,
+        mongo_url: Optional[str] = None,
+        client: Optional[AsyncMongoClient] = None,
+        max_pool_size: Optional[int] = None,
+        min_pool_size: Optional[int] = None,
+        max_idle_time_ms: Optional[int] = None,
+        server_selection_timeout_ms: Optional[int] = None,
+        socket_timeout_ms: Optional[int] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        guard: Optional[OperationGuard] = None,
     ):
         """
         Initialize MongoDB engine.
@@ -39,6 +71,17 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
         Args:
             mongo_url: MongoDB connection URL
             client: Optional AsyncMongoClient class for dependency injection
+            max_pool_size: Maximum connections per server (driver default if None)
+            min_pool_size: Connections kept open per server (driver default if None)
+            max_idle_time_ms: Idle time before a pooled connection is closed
+                (driver default if None)
+            server_selection_timeout_ms: Time an operation waits for a usable
+                server (driver default if None)
+            socket_timeout_ms: Time a request waits for its response before
+                failing (driver default if None)
+            retry_policies: Retry policies by operation name, overriding the
+                defaults, which retry reads only
+            guard: Circuit breakers and in-flight bound the operations run under
 
         Raises:
             MongoDbConfigurationError: If mongo_url is missing
@@ -54,50 +97,131 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
 
         self._url = mongo_url
         self._client: Optional[AsyncMongoClient] = client
+        # An asyncio.Lock binds to the loop it is first contended on, and the
+        # engine is shared across loops (async_to_sync runs each call in its own)
+        self._client_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
+        self._client_options = {
+            name: value
+            for name, value in (
+                ("maxPoolSize", max_pool_size),
+                ("minPoolSize", min_pool_size),
+                ("maxIdleTimeMS", max_idle_time_ms),
+                ("serverSelectionTimeoutMS", server_selection_timeout_ms),
+                ("socketTimeoutMS", socket_timeout_ms),
+            )
+            if value is not None
+        }
+        self._retrier = Retrier(retry_policies)
+        self._guard = guard or OperationGuard()
+        self._average_document_sizes: Dict[str, int] = {}
         logger.debug("MongoDB engine initialized with URL: %s", self.host)
 
     async def _get_client(self) -> AsyncMongoClient:
         """
         Get or create MongoDB client with connection pooling.
 
+        Creation is single-flight: concurrent first callers on the same event
+        loop wait for the one client being created instead of each creating
+        their own.
+
+        Returns:
+            AsyncMongoClient: Connected MongoDB client
+
+        Raises:
+            MongoDbConnectionError: If connection fails
+        """
+        if self._client is not None:
+            return self._client
+
+        async with self._get_client_lock():
+            if self._client is None:
+                self._client = await self._create_client()
+
+        return self._client
+
+    def _get_client_lock(self) -> asyncio.Lock:
+        """
+        Get the client creation lock of the running event loop.
+
+        Returns:
+            asyncio.Lock: The lock, created on the loop's first call
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._client_locks.get(loop)
+        if lock is None:
+            lock = self._client_locks[loop] = asyncio.Lock()
+        return lock
+
+    async def _create_client(self) -> AsyncMongoClient:
+        """
+        Create a client and check the deployment is reachable.
+
         Returns:
             AsyncMongoClient: Connected MongoDB client
 
         Raises:
             MongoDbConnectionError: If connection fails
         """
-        if self._client is None:
+        logger.debug("Establishing MongoDB connection to %s:%s", self.host, self.port)
+        client = None
+        try:
+            # This has connection pooling built in
+            client = AsyncMongoClient(
+                self._url,
+                tlsCAFile=certifi.where(),
+                **self._client_options,
+            )
+            await client.admin.command("ping")
+        except (
+            ConnectionFailure,
+            ServerSelectionTimeoutError,
+            ConfigurationError,
+        ) as e:
+            logger.error(
+                "Failed to connect to MongoDB at %s:%s - %s",
+                self.host,
+                self.port,
+                e,
+            )
+            if client is not None:
+                await client.close()
+            raise MongoDbConnectionError(
+                message=f"Could not connect to MongoDB: {self._url}.",
+                host=self.host,
+                port=self.port,
+            ) from e
+
+        logger.info("Successfully connected to MongoDB at %s:%s", self.host, self.port)
+        return client
+
+    async def connect(self) -> None:
+        """
+        Create the client and open its minimum pool ahead of the first request.
+
+        Concurrent pings each check out a connection, so the pool holds
+        minPoolSize connections once this returns instead of growing on demand
+        under the first requests.
+
+        Raises:
+            MongoDbConnectionError: If connection fails
+        """
+        client = await self._get_client()
+        warm_connections = self._client_options.get("minPoolSize", 0)
+        if warm_connections > 1:
             try:
-                logger.debug(
-                    "Establishing MongoDB connection to %s:%s", self.host, self.port
-                )
-                # This has connection pooling built in
-                self._client = AsyncMongoClient(
-                    self._url,
-                    tlsCAFile=certifi.where(),
-                )
-                await self._client.admin.command("ping")
-                logger.info(
-                    "Successfully connected to MongoDB at %s:%s", self.host, self.port
+                await asyncio.gather(
+                    *(client.admin.command("ping") for _ in range(warm_connections - 1))
                 )
-            except (
-                ConnectionFailure,
-                ServerSelectionTimeoutError,
-                ConfigurationError,
-            ) as e:
-                logger.error(
-                    "Failed to connect to MongoDB at %s:%s - %s",
-                    self.host,
-                    self.port,
-                    e,
-                )
-                raise MongoDbConnectionError(
-                    message=f"Could not connect to MongoDB: {self._url}.",
-                    host=self.host,
-                    port=self.port,
-                ) from e
+            except PyMongoError as e:
+                logger.warning("MongoDB connection pool warm-up incomplete: %s", e)
+                return
 
-        return self._client
+        logger.info(
+            "MongoDB connection pool warmed up with %d connection(s)",
+            max(warm_connections, 1),
+        )
 
     async def _get_collection(self, collection_name: str, database_name: str):
         """
@@ -135,6 +259,8 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
                 max_retries=3,
             ) from e
 
+    @retried_stream("fetch_from_db")
+    @guarded_stream
     async def fetch_from_db(
         self,
         collection_name: str,
@@ -247,6 +373,249 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
 
         return generator()
 
+    @retried_stream("stream_from_db")
+    @guarded_stream
+    async def stream_from_db(
+        self,
+        collection_name: str,
+        database_name: str,
+        query: Dict | None = None,
+        projection: Dict | None = None,
+        sort: List[tuple] | None = None,
+        batch_size: Optional[int] = None,
+    ) -> AsyncGenerator[Dict, None]:
+        """
+        Stream every matching document from a MongoDB collection.
+
+        Documents are pulled through a single server-side cursor whose batch
+        size is sized against the collection's average document size, so memory
+        stays bounded to one batch regardless of the result size.
+
+        Args:
+            collection_name: Collection name
+            database_name: Database name
+            query: Query filter
+            projection: Fields to include/exclude
+            sort: Sort criteria
+            batch_size: Documents per server round trip (derived from
+                document size when omitted)
+
+        Returns:
+            AsyncGenerator yielding individual documents
+
+        Raises:
+            MongoDbOperationError: If the cursor is lost mid-stream
+            MongoDbTemporaryOperationError: If temporary issues occur
+        """
+
+        async def generator() -> AsyncGenerator[Dict, None]:
+            query_dict = query or {}
+            total_streamed = 0
+
+            try:
+                collection = await self._get_collection(collection_name, database_name)
+                cursor_batch_size = batch_size or await self._get_stream_batch_size(
+                    collection, database_name, collection_name
+                )
+
+                logger.debug(
+                    "Starting stream from %s.%s with batch_size=%d",
+                    database_name,
+                    collection_name,
+                    cursor_batch_size,
+                )
+
+                cursor = collection.find(query_dict, projection or None)
+                if sort:
+                    cursor = cursor.sort(sort)
+                cursor = cursor.batch_size(cursor_batch_size)
+
+                try:
+                    async for document in cursor:
+                        total_streamed += 1
+                        yield document
+                finally:
+                    await cursor.close()
+
+                logger.debug(
+                    "Completed stream from %s.%s - %d documents retrieved",
+                    database_name,
+                    collection_name,
+                    total_streamed,
+                )
+
+            except CursorNotFound as e:
+                logger.error(
+                    "Cursor not found for %s.%s after %d documents: %s",
+                    database_name,
+                    collection_name,
+                    total_streamed,
+                    e,
+                )
+                raise MongoDbOperationError(
+                    message=f"Failed to stream data: {str(e)}",
+                    operation="stream",
+                    collection=collection_name,
+                    query=query_dict,
+                    details=str(e),
+                ) from e
+
+            except (OperationFailure, ExecutionTimeout, AutoReconnect) as e:
+                logger.warning(
+                    "Temporary stream failure from %s.%s: %s",
+                    database_name,
+                    collection_name,
+                    e,
+                )
+                raise MongoDbTemporaryOperationError(
+                    message="Operation failed",
+                    operation="stream_from_db",
+                    collection=collection_name,
+                    query=query_dict,
+                    max_retries=3,
+                ) from e
+
+        return generator()
+
+    @retried("fetch_page_from_db")
+    @guarded
+    async def fetch_page_from_db(
+        self,
+        collection_name: str,
+        database_name: str,
+        query: Dict | None = None,
+        projection: Dict | None = None,
+        sort: List[tuple] | None = None,
+        page_size: int = 50,
+        continuation_token: Optional[str] = None,
+    ) -> Page:
+        """
+        Fetch one page of a listing using keyset pagination.
+
+        The page is read with a single limited query for page_size + 1
+        documents, the extra one only telling whether another page follows.
+        Sort keys should be indexed, together with _id, and present on every
+        document.
+
+        Args:
+            collection_name: Collection name
+            database_name: Database name
+            query: Query filter
+            projection: Fields to include/exclude; sort keys are always loaded
+            sort: Sort criteria as (field, direction) tuples, made unique
+                with _id; defaults to _id
+            page_size: Documents per page
+            continuation_token: Token returned with the previous page, None
+                for the first page
+
+        Returns:
+            Page of documents with the token of the next page
+
+        Raises:
+            InvalidContinuationTokenError: If the token does not belong to
+                this query and sort
+            MongoDbTemporaryOperationError: If temporary issues occur
+            ValueError: If page_size is below 1
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        query_dict = query or {}
+        sort = normalize_sort(sort)
+        page_filter = query_dict
+        if continuation_token is not None:
+            after = keyset_filter(
+                sort, decode_continuation_token(continuation_token, query_dict, sort)
+            )
+            page_filter = {"$and": [query_dict, after]} if query_dict else after
+
+        logger.debug(
+            "Fetching page of %d from %s.%s sorted by %s",
+            page_size,
+            database_name,
+            collection_name,
+            sort,
+        )
+
+        try:
+            collection = await self._get_collection(collection_name, database_name)
+            cursor = (
+                collection.find(page_filter, sort_projection(projection, sort))
+                .sort(sort)
+                .limit(page_size + 1)
+            )
+            documents = await cursor.to_list(length=page_size + 1)
+
+        except (OperationFailure, ExecutionTimeout, AutoReconnect) as e:
+            logger.warning(
+                "Temporary page fetch failure from %s.%s: %s",
+                database_name,
+                collection_name,
+                e,
+            )
+            raise MongoDbTemporaryOperationError(
+                message="Operation failed",
+                operation="fetch_page_from_db",
+                collection=collection_name,
+                query=query_dict,
+                max_retries=3,
+            ) from e
+
+        if len(documents) <= page_size:
+            return Page(items=documents)
+
+        documents = documents[:page_size]
+        return Page(
+            items=documents,
+            next_token=encode_continuation_token(query_dict, sort, documents[-1]),
+        )
+
+    async def _get_stream_batch_size(
+        self, collection, database_name: str, collection_name: str
+    ) -> int:
+        """
+        Derive a cursor batch size from the collection's average document size.
+
+        The average size is read once per collection from `$collStats` and
+        cached on the engine. Falls back to the minimum batch size when the
+        statistics are unavailable.
+
+        Args:
+            collection: MongoDB collection object
+            database_name: Database name
+            collection_name: Collection name
+
+        Returns:
+            Number of documents to request per cursor batch
+        """
+        namespace = f"{database_name}.{collection_name}"
+        average_size = self._average_document_sizes.get(namespace)
+
+        if average_size is None:
+            try:
+                cursor = await collection.aggregate(
+                    [
+                        {"$collStats": {"storageStats": {}}},
+                        {"$project": {"avgObjSize": "$storageStats.avgObjSize"}},
+                    ]
+                )
+                stats = await cursor.to_list(length=1)
+                average_size = int(stats[0].get("avgObjSize") or 0) if stats else 0
+            except (OperationFailure, ExecutionTimeout) as e:
+                logger.debug("Could not read collection stats for %s: %s", namespace, e)
+                average_size = 0
+            self._average_document_sizes[namespace] = average_size
+
+        if average_size <= 0:
+            return self.MIN_STREAM_BATCH_SIZE
+
+        return max(
+            self.MIN_STREAM_BATCH_SIZE,
+            min(self.MAX_STREAM_BATCH_SIZE, self.STREAM_BATCH_BYTES // average_size),
+        )
+
+    @retried("fetch_one_from_db")
+    @guarded
     async def fetch_one_from_db(
         self,
         collection_name: str,
@@ -306,6 +675,8 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
                 max_retries=3,
             ) from e
 
+    @retried("write_to_db")
+    @guarded
     async def write_to_db(
         self,
         data: Union[Dict, list],
@@ -385,6 +756,173 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
                 max_retries=3,
             ) from e
 
+    @retried("bulk_write_to_db")
+    @guarded
+    async def bulk_write_to_db(
+        self,
+        operations: Sequence[WriteOperation],
+        collection_name: str,
+        database_name: str,
+        timestamp: bool = True,
+    ) -> BulkWriteSummary:
+        """
+        Apply mixed write operations to a MongoDB collection in one round trip.
+
+        The bulk write is unordered, so the server may apply operations in
+        parallel and keeps applying the remaining ones after a failure.
+
+        Args:
+            operations: Write operations to apply
+            collection_name: Collection name
+            database_name: Database name
+            timestamp: Add created_at to inserted and upserted documents
+
+        Returns:
+            Counts of affected documents
+
+        Raises:
+            MongoDbOperationError: If any operation fails, with the index,
+                code and message of each failed operation in the context
+            MongoDbTemporaryOperationError: If temporary issues occur
+        """
+        if not operations:
+            return BulkWriteSummary()
+
+        logger.debug(
+            "Bulk writing %d operation(s) to %s.%s",
+            len(operations),
+            database_name,
+            collection_name,
+        )
+
+        created_at = datetime.now(timezone.utc) if timestamp else None
+        requests = [
+            self._to_bulk_request(operation, created_at) for operation in operations
+        ]
+
+        try:
+            collection = await self._get_collection(collection_name, database_name)
+            result = await collection.bulk_write(requests, ordered=False)
+
+        except BulkWriteError as e:
+            details = e.details
+            write_errors = [
+                {
+                    "index": error["index"],
+                    "code": error.get("code"),
+                    "message": error.get("errmsg"),
+                }
+                for error in details.get("writeErrors", [])
+            ]
+            if not write_errors:
+                # Only the write concern failed; the writes may still replicate
+                logger.warning(
+                    "Write concern failed for bulk write to %s.%s: %s",
+                    database_name,
+                    collection_name,
+                    details.get("writeConcernErrors"),
+                )
+                raise MongoDbTemporaryOperationError(
+                    message="Write concern failed",
+                    operation="bulk_write_to_db",
+                    collection=collection_name,
+                    max_retries=3,
+                ) from e
+
+            logger.error(
+                "Bulk write to %s.%s partially failed - %d of %d operation(s) failed",
+                database_name,
+                collection_name,
+                len(write_errors),
+                len(requests),
+            )
+            raise MongoDbOperationError(
+                message=(
+                    f"{len(write_errors)} of {len(requests)} bulk write "
+                    "operations failed"
+                ),
+                operation="bulk_write_to_db",
+                collection=collection_name,
+                write_errors=write_errors,
+            ) from e
+
+        except DocumentTooLarge as e:
+            logger.error(
+                "Bulk write failed for %s.%s - %s", database_name, collection_name, e
+            )
+            raise MongoDbOperationError(
+                message=f"Failed to write data: {str(e)}",
+                operation="bulk_write_to_db",
+                collection=collection_name,
+                details=str(e),
+            ) from e
+
+        except (OperationFailure, AutoReconnect, WTimeoutError) as e:
+            logger.warning(
+                "Temporary bulk write failure to %s.%s: %s",
+                database_name,
+                collection_name,
+                e,
+            )
+            raise MongoDbTemporaryOperationError(
+                message="Operation failed",
+                operation="bulk_write_to_db",
+                collection=collection_name,
+                max_retries=3,
+            ) from e
+
+        summary = BulkWriteSummary(
+            inserted_count=result.inserted_count,
+            matched_count=result.matched_count,
+            modified_count=result.modified_count,
+            upserted_count=result.upserted_count,
+            deleted_count=result.deleted_count,
+        )
+        logger.info(
+            "Bulk write to %s.%s completed - %s",
+            database_name,
+            collection_name,
+            summary,
+        )
+        return summary
+
+    @staticmethod
+    def _to_bulk_request(
+        operation: WriteOperation, created_at: Optional[datetime]
+    ) -> Union[InsertOne, UpdateOne, DeleteOne]:
+        """
+        Convert a write operation into a pymongo bulk write request.
+
+        Args:
+            operation: The write operation
+            created_at: Creation timestamp for new documents, None to skip it
+
+        Returns:
+            The pymongo request
+        """
+        if operation.operation is WriteOperationType.INSERT:
+            document = operation.document
+            if created_at is not None:
+                document = {**document, "created_at": created_at}
+            return InsertOne(document)
+
+        if operation.operation is WriteOperationType.DELETE:
+            return DeleteOne(operation.query)
+
+        update = operation.update
+        upsert = operation.operation is WriteOperationType.UPSERT
+        if upsert and created_at is not None:
+            update = {
+                **update,
+                "$setOnInsert": {
+                    **update.get("$setOnInsert", {}),
+                    "created_at": created_at,
+                },
+            }
+        return UpdateOne(operation.query, update, upsert=upsert)
+
+    @retried("update_one_to_db")
+    @guarded
     async def update_one_to_db(
         self,
         collection_name: str,
@@ -456,6 +994,8 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
                 max_retries=3,
             ) from e
 
+    @retried("run_aggregation")
+    @guarded
     async def run_aggregation(
         self,
         collection_name: str,
@@ -507,6 +1047,14 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
                 max_retries=3,
             ) from e
 
+    def circuit_states(self) -> Dict[str, CircuitState]:
+        """Return the circuit state of every database used so far"""
+        return self._guard.circuit_states()
+
+    def retry_counts(self) -> Dict[str, int]:
+        """Return the number of retries made so far, by operation name"""
+        return self._retrier.retry_counts()
+
     @property
     def parsed_url(self) -> ParseResult:
         """Parse MongoDB connection URL."""
@@ -546,4 +1094,20 @@ class AsyncMongoDatabaseEngine(AsyncAbstractNoSqLDatabaseEngine):
         return "AsyncMongoDatabaseEngine"
 
 
-mongo_database = AsyncMongoDatabaseEngine(getattr(settings, "MONGO_URL", None))
+mongo_database = AsyncMongoDatabaseEngine(
+    getattr(settings, "MONGO_URL", None),
+    max_pool_size=getattr(settings, "MONGO_MAX_POOL_SIZE", None),
+    min_pool_size=getattr(settings, "MONGO_MIN_POOL_SIZE", None),
+    max_idle_time_ms=getattr(settings, "MONGO_MAX_IDLE_TIME_MS", None),
+    server_selection_timeout_ms=getattr(
+        settings, "MONGO_SERVER_SELECTION_TIMEOUT_MS", None
+    ),
+    socket_timeout_ms=getattr(settings, "MONGO_SOCKET_TIMEOUT_MS", None),
+    guard=OperationGuard(
+        max_in_flight=getattr(settings, "MONGO_MAX_IN_FLIGHT", 200),
+        failure_threshold=getattr(settings, "MONGO_CIRCUIT_FAILURE_THRESHOLD", 5),
+        reset_timeout_seconds=getattr(
+            settings, "MONGO_CIRCUIT_RESET_TIMEOUT_SECONDS", 30.0
+        ),
+    ),
+)
@@ -0,0 +1,172 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pymongo import DeleteOne, InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, ServerSelectionTimeoutError
+
+from src.exceptions import MongoDbConnectionError, MongoDbOperationError
+
+from ...data_types import BulkWriteSummary, WriteOperation, WriteOperationType
+from ..mongodb import AsyncMongoDatabaseEngine
+
+
+@pytest.fixture
+def mongo_client_class():
+    async def ping(*args, **kwargs):
+        await asyncio.sleep(0)
+        return {"ok": 1}
+
+    with patch(
+        "src.repository.databases.no_sql_database.mongo.mongodb.AsyncMongoClient"
+    ) as client_class:
+        client_class.return_value.admin.command = AsyncMock(side_effect=ping)
+        client_class.return_value.close = AsyncMock()
+        yield client_class
+
+
+@pytest.mark.asyncio
+class TestAsyncMongoDatabaseEngine:
+    async def test_concurrent_first_calls_create_one_client(self, mongo_client_class):
+        engine = AsyncMongoDatabaseEngine("mongodb://localhost:27017")
+
+        clients = await asyncio.gather(*(engine._get_client() for _ in range(5)))
+
+        mongo_client_class.assert_called_once()
+        assert all(client is clients[0] for client in clients)
+
+    async def test_connect_applies_pool_options_and_warms_pool(
+        self, mongo_client_class
+    ):
+        engine = AsyncMongoDatabaseEngine(
+            "mongodb://localhost:27017",
+            max_pool_size=50,
+            min_pool_size=4,
+            max_idle_time_ms=1000,
+        )
+
+        await engine.connect()
+
+        kwargs = mongo_client_class.call_args.kwargs
+        assert kwargs["maxPoolSize"] == 50
+        assert kwargs["minPoolSize"] == 4
+        assert kwargs["maxIdleTimeMS"] == 1000
+        assert mongo_client_class.return_value.admin.command.await_count == 4
+
+    async def test_failed_connection_is_not_kept(self, mongo_client_class):
+        client = mongo_client_class.return_value
+        client.admin.command.side_effect = ServerSelectionTimeoutError("down")
+        engine = AsyncMongoDatabaseEngine("mongodb://localhost:27017")
+
+        with pytest.raises(MongoDbConnectionError):
+            await engine._get_client()
+
+        client.close.assert_awaited_once()
+        assert engine._client is None
+
+    async def test_disconnect_resets_client(self, mongo_client_class):
+        engine = AsyncMongoDatabaseEngine("mongodb://localhost:27017")
+        await engine.connect()
+
+        await engine.disconnect()
+
+        mongo_client_class.return_value.close.assert_awaited_once()
+        assert engine._client is None
+
+
+def test_client_creation_is_single_flight_on_each_event_loop(mongo_client_class):
+    engine = AsyncMongoDatabaseEngine("mongodb://localhost:27017")
+
+    async def first_calls():
+        engine._client = None
+        return await asyncio.gather(*(engine._get_client() for _ in range(3)))
+
+    # async_to_sync runs each call on its own loop; a lock bound to the
+    # first loop would raise on the second
+    for _ in range(2):
+        clients = asyncio.run(first_calls())
+        assert all(client is clients[0] for client in clients)
+
+    assert mongo_client_class.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestBulkWriteToDb:
+    @pytest.fixture
+    def collection(self):
+        collection = MagicMock()
+        collection.bulk_write = AsyncMock()
+        return collection
+
+    @pytest.fixture
+    def engine(self, collection):
+        engine = AsyncMongoDatabaseEngine("mongodb://localhost:27017")
+        engine._get_collection = AsyncMock(return_value=collection)
+        return engine
+
+    async def test_mixed_operations_are_sent_unordered_in_one_call(
+        self, engine, collection
+    ):
+        collection.bulk_write.return_value = MagicMock(
+            inserted_count=1,
+            matched_count=1,
+            modified_count=1,
+            upserted_count=1,
+            deleted_count=1,
+        )
+
+        summary = await engine.bulk_write_to_db(
+            [
+                WriteOperation.insert({"attempt": 1}),
+                WriteOperation.update_one({"_id": 1}, {"$set": {"score": 1}}),
+                WriteOperation.upsert({"_id": 2}, {"$inc": {"attempts": 1}}),
+                WriteOperation.delete_one({"_id": 3}),
+            ],
+            "attempts",
+            "attempts_db",
+        )
+
+        assert summary == BulkWriteSummary(1, 1, 1, 1, 1)
+        requests = collection.bulk_write.await_args.args[0]
+        assert [type(request) for request in requests] == [
+            InsertOne,
+            UpdateOne,
+            UpdateOne,
+            DeleteOne,
+        ]
+        assert collection.bulk_write.await_args.kwargs == {"ordered": False}
+        assert "created_at" in requests[0]._doc
+        assert "created_at" in requests[2]._doc["$setOnInsert"]
+        assert requests[2]._upsert and not requests[1]._upsert
+
+    async def test_partial_failure_reports_failed_operations(self, engine, collection):
+        collection.bulk_write.side_effect = BulkWriteError(
+            {
+                "writeErrors": [
+                    {"index": 1, "code": 11000, "errmsg": "duplicate key", "op": {}}
+                ],
+                "nInserted": 1,
+            }
+        )
+
+        with pytest.raises(MongoDbOperationError) as exc_info:
+            await engine.bulk_write_to_db(
+                [WriteOperation.insert({"_id": 1}), WriteOperation.insert({"_id": 1})],
+                "attempts",
+                "attempts_db",
+            )
+
+        assert exc_info.value.context["write_errors"] == [
+            {"index": 1, "code": 11000, "message": "duplicate key"}
+        ]
+
+    async def test_empty_bulk_write_skips_round_trip(self, engine, collection):
+        assert await engine.bulk_write_to_db([], "attempts", "attempts_db") == (
+            BulkWriteSummary()
+        )
+        collection.bulk_write.assert_not_awaited()
+
+
+def test_invalid_write_operation_is_rejected():
+    with pytest.raises(ValueError):
+        WriteOperation(WriteOperationType.UPSERT, query={"_id": 1})
@@ -0,0 +1,163 @@
+"""
+no_sql_database.pagination
+~~~~~~~~~~~~
+
+Keyset pagination: a page starts after the sort key values of the previous
+page's last document instead of skipping over the documents before it, so
+every page costs the same and concurrent inserts neither repeat nor skip
+documents. The position is handed to clients as an opaque continuation token.
+"""
+
+import base64
+import binascii
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+from bson.errors import InvalidBSON
+
+from src.exceptions import InvalidContinuationTokenError
+
+SortSpec = List[Tuple[str, int]]
+
+TOKEN_VERSION = 1
+
+_JSON_OPTIONS = json_util.CANONICAL_JSON_OPTIONS
+
+
+def normalize_sort(sort: Optional[SortSpec]) -> SortSpec:
+    """
+    Make a sort total by ending it with _id.
+
+    Args:
+        sort: Sort criteria as (field, direction) tuples, defaults to _id
+
+    Returns:
+        The sort criteria, with _id appended in the last key's direction
+    """
+    sort = [(key, direction) for key, direction in sort or []]
+    if not any(key == "_id" for key, _ in sort):
+        sort.append(("_id", sort[-1][1] if sort else 1))
+    return sort
+
+
+def keyset_filter(sort: SortSpec, values: List[Any]) -> Dict:
+    """
+    Build the filter matching documents that sort after the given key values.
+
+    Args:
+        sort: Normalized sort criteria
+        values: Sort key values of the last document already returned
+
+    Returns:
+        MongoDB filter expression
+    """
+    clauses = []
+    for index, (key, direction) in enumerate(sort):
+        clause = {
+            prefix_key: values[prefix_index]
+            for prefix_index, (prefix_key, _) in enumerate(sort[:index])
+        }
+        clause[key] = {"$gt" if direction > 0 else "$lt": values[index]}
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def sort_values(document: Dict, sort: SortSpec) -> List[Any]:
+    """Read the sort key values of a document, following dotted paths"""
+    values = []
+    for key, _ in sort:
+        value: Any = document
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        values.append(value)
+    return values
+
+
+def sort_projection(projection: Optional[Dict], sort: SortSpec) -> Optional[Dict]:
+    """
+    Adjust a projection so the sort keys of every document are loaded.
+
+    Args:
+        projection: Fields to include/exclude
+        sort: Normalized sort criteria
+
+    Returns:
+        The projection, including the sort keys
+    """
+    if not projection:
+        return projection
+
+    sort_keys = {key for key, _ in sort}
+    if any(value for key, value in projection.items() if key != "_id"):
+        return {**projection, **{key: 1 for key in sort_keys}}
+    return {key: value for key, value in projection.items() if key not in sort_keys}
+
+
+def query_fingerprint(query: Dict, sort: SortSpec) -> str:
+    """Digest of a query and its sort, binding tokens to the listing they came from"""
+    canonical = json_util.dumps([query, sort], json_options=_JSON_OPTIONS)
+    return hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()
+
+
+def encode_continuation_token(query: Dict, sort: SortSpec, last_document: Dict) -> str:
+    """
+    Encode the position after a document as an opaque token.
+
+    Args:
+        query: Query filter of the listing
+        sort: Normalized sort criteria
+        last_document: Last document of the current page
+
+    Returns:
+        URL-safe continuation token
+    """
+    payload = json_util.dumps(
+        {
+            "v": TOKEN_VERSION,
+            "q": query_fingerprint(query, sort),
+            "k": sort_values(last_document, sort),
+        },
+        json_options=_JSON_OPTIONS,
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_continuation_token(token: str, query: Dict, sort: SortSpec) -> List[Any]:
+    """
+    Decode the sort key values a continuation token resumes after.
+
+    Args:
+        token: Token returned with the previous page
+        query: Query filter of the listing
+        sort: Normalized sort criteria
+
+    Returns:
+        Sort key values of the previous page's last document
+
+    Raises:
+        InvalidContinuationTokenError: If the token is malformed or was issued
+            for another query or sort
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json_util.loads(
+            base64.urlsafe_b64decode(padded.encode()).decode(),
+            json_options=_JSON_OPTIONS,
+        )
+        version, fingerprint, values = payload["v"], payload["q"], payload["k"]
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        ValueError,
+        InvalidBSON,
+        KeyError,
+        TypeError,
+    ) as e:
+        raise InvalidContinuationTokenError("malformed token") from e
+
+    if version != TOKEN_VERSION:
+        raise InvalidContinuationTokenError("unsupported token version")
+    if fingerprint != query_fingerprint(query, sort) or len(values) != len(sort):
+        raise InvalidContinuationTokenError("token belongs to another query")
+    return values
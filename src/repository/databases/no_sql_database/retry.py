@@ -0,0 +1,253 @@
+"""
+no_sql_database.retry
+~~~~~~~~~~~~
+
+Retries of temporary database errors with jittered exponential backoff,
+within a per-operation time budget that never outlasts the request deadline.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import aclosing, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import (AsyncGenerator, Awaitable, Callable, Dict, Iterator,
+                    Optional, TypeVar)
+
+from src.exceptions import (MongoDbTemporaryConnectionError,
+                            MongoDbTemporaryOperationError)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_ERRORS = (MongoDbTemporaryOperationError, MongoDbTemporaryConnectionError)
+
+# Monotonic time by which the current request must have been answered
+_request_deadline: ContextVar[Optional[float]] = ContextVar(
+    "request_deadline", default=None
+)
+
+
+@contextmanager
+def request_deadline(timeout_seconds: float) -> Iterator[None]:
+    """
+    Bound the retries of database operations run within the block.
+
+    Args:
+        timeout_seconds: Time left to answer the current request
+    """
+    token = _request_deadline.set(time.monotonic() + timeout_seconds)
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def remaining_request_time() -> Optional[float]:
+    """Return the seconds left until the request deadline, None without one"""
+    deadline = _request_deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How often and for how long an operation is retried.
+
+    Attributes:
+        max_attempts: Attempts including the first one
+        base_delay_seconds: Backoff cap of the first retry, doubled per retry
+        max_delay_seconds: Upper bound of the backoff cap
+        budget_seconds: Time after the first attempt in which retries may start
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.05
+    max_delay_seconds: float = 1.0
+    budget_seconds: float = 2.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before the attempt following `attempt`"""
+        cap = min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+READ_RETRY_POLICY = RetryPolicy()
+
+# Reads are idempotent, writes are only retried where configured, e.g. for
+# upserts whose update is idempotent
+DEFAULT_RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "fetch_from_db": READ_RETRY_POLICY,
+    "stream_from_db": READ_RETRY_POLICY,
+    "fetch_page_from_db": READ_RETRY_POLICY,
+    "fetch_one_from_db": READ_RETRY_POLICY,
+    "run_aggregation": READ_RETRY_POLICY,
+}
+
+
+class Retrier:
+    """
+    Runs database operations under their retry policy and counts the retries.
+    """
+
+    __slots__ = ("_policies", "_retry_counts")
+
+    def __init__(self, policies: Optional[Dict[str, RetryPolicy]] = None) -> None:
+        """
+        Initialize the Retrier.
+
+        Args:
+            policies: Policies by operation name, overriding the defaults;
+                operations without a policy are not retried
+        """
+        self._policies = {**DEFAULT_RETRY_POLICIES, **(policies or {})}
+        self._retry_counts: Counter = Counter()
+
+    def policy_for(self, operation: str) -> RetryPolicy:
+        return self._policies.get(operation, NO_RETRY)
+
+    def retry_counts(self) -> Dict[str, int]:
+        """Return the number of retries made so far, by operation name"""
+        return dict(self._retry_counts)
+
+    async def run(self, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await call, calling it again on temporary errors while the policy allows.
+
+        Args:
+            operation: Operation name, selecting the policy
+            call: Starts one attempt of the operation
+
+        Returns:
+            The result of the first successful attempt
+        """
+        policy = self.policy_for(operation)
+        budget_ends_at = time.monotonic() + policy.budget_seconds
+        attempt = 1
+        while True:
+            try:
+                return await call()
+            except RETRYABLE_ERRORS as e:
+                delay = self._retry_delay(operation, policy, attempt, budget_ends_at, e)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def stream(
+        self,
+        operation: str,
+        open_stream: Callable[[], Awaitable[AsyncGenerator[T, None]]],
+    ) -> AsyncGenerator[T, None]:
+        """
+        Yield from a stream, reopening it on temporary errors before its first item.
+
+        Once an item was yielded the stream is not retried, as the caller
+        would see items twice.
+
+        Args:
+            operation: Operation name, selecting the policy
+            open_stream: Opens the stream for one attempt
+
+        Returns:
+            AsyncGenerator yielding the stream's items
+        """
+        policy = self.policy_for(operation)
+        budget_ends_at = time.monotonic() + policy.budget_seconds
+        attempt = 1
+        while True:
+            started = False
+            try:
+                async with aclosing(await open_stream()) as items:
+                    async for item in items:
+                        started = True
+                        yield item
+                return
+            except RETRYABLE_ERRORS as e:
+                delay = (
+                    None
+                    if started
+                    else self._retry_delay(
+                        operation, policy, attempt, budget_ends_at, e
+                    )
+                )
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _retry_delay(
+        self,
+        operation: str,
+        policy: RetryPolicy,
+        attempt: int,
+        budget_ends_at: float,
+        error: Exception,
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Returns:
+            The backoff before the next attempt, None to give up
+        """
+        error.context["current_retry"] = attempt - 1
+        if attempt >= policy.max_attempts:
+            return None
+
+        delay = policy.backoff(attempt)
+        retry_at = time.monotonic() + delay
+        remaining = remaining_request_time()
+        if retry_at >= budget_ends_at or (remaining is not None and delay >= remaining):
+            logger.warning(
+                "Not retrying %s after attempt %d: out of time budget",
+                operation,
+                attempt,
+            )
+            return None
+
+        self._retry_counts[operation] += 1
+        logger.warning(
+            "Retrying %s in %.3fs after attempt %d/%d failed: %s",
+            operation,
+            delay,
+            attempt,
+            policy.max_attempts,
+            error,
+        )
+        return delay
+
+
+def retried(operation: str):
+    """Run an engine coroutine method under the engine's retrier"""
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            return await self._retrier.run(
+                operation, lambda: method(self, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def retried_stream(operation: str):
+    """Run an engine method returning an async generator under the engine's retrier"""
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            return self._retrier.stream(
+                operation, lambda: method(self, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
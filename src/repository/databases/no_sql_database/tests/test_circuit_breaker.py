@@ -0,0 +1,151 @@
+import asyncio
+from contextlib import aclosing
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pymongo.errors import AutoReconnect, OperationFailure
+
+from src.exceptions import (MongoDbCircuitOpenError, MongoDbOperationError,
+                            MongoDbOverloadedError,
+                            MongoDbTemporaryOperationError)
+
+from ..circuit_breaker import CircuitBreaker, CircuitState, OperationGuard
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("questions", failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(MongoDbCircuitOpenError):
+            breaker.acquire()
+
+    def test_half_open_probe_closes_or_reopens_the_circuit(self):
+        breaker = CircuitBreaker(
+            "questions", failure_threshold=1, reset_timeout_seconds=10
+        )
+        with patch("time.monotonic", return_value=100.0):
+            breaker.record_failure()
+
+        with patch("time.monotonic", return_value=111.0):
+            breaker.acquire()
+            assert breaker.state is CircuitState.HALF_OPEN
+            # Only one probe at a time
+            with pytest.raises(MongoDbCircuitOpenError):
+                breaker.acquire()
+
+            breaker.record_failure()
+            assert breaker.state is CircuitState.OPEN
+
+        with patch("time.monotonic", return_value=122.0):
+            breaker.acquire()
+            breaker.record_success()
+            assert breaker.state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+class TestOperationGuard:
+    async def test_failures_open_only_that_databases_circuit(self):
+        guard = OperationGuard(failure_threshold=1)
+        failing = AsyncMock(side_effect=MongoDbTemporaryOperationError())
+
+        with pytest.raises(MongoDbTemporaryOperationError):
+            await guard.run("attempts", failing)
+        with pytest.raises(MongoDbCircuitOpenError):
+            await guard.run("attempts", failing)
+
+        assert failing.await_count == 1
+        assert await guard.run("questions", AsyncMock(return_value=1)) == 1
+        assert guard.circuit_states() == {
+            "attempts": CircuitState.OPEN,
+            "questions": CircuitState.CLOSED,
+        }
+
+    async def test_permanent_errors_do_not_open_the_circuit(self):
+        guard = OperationGuard(failure_threshold=1)
+
+        with pytest.raises(MongoDbOperationError):
+            await guard.run("attempts", AsyncMock(side_effect=MongoDbOperationError()))
+
+        assert guard.circuit_states() == {"attempts": CircuitState.CLOSED}
+
+    async def test_only_labelled_server_errors_open_the_circuit(self):
+        guard = OperationGuard(failure_threshold=1)
+
+        async def fail_with(cause):
+            raise MongoDbTemporaryOperationError() from cause
+
+        with pytest.raises(MongoDbTemporaryOperationError):
+            await guard.run(
+                "attempts", lambda: fail_with(OperationFailure("bad $match", 2))
+            )
+        assert guard.circuit_states() == {"attempts": CircuitState.CLOSED}
+
+        transient = OperationFailure(
+            "primary stepped down", 189, {"errorLabels": ["RetryableWriteError"]}
+        )
+        with pytest.raises(MongoDbTemporaryOperationError):
+            await guard.run("attempts", lambda: fail_with(transient))
+        assert guard.circuit_states() == {"attempts": CircuitState.OPEN}
+
+        with pytest.raises(MongoDbTemporaryOperationError):
+            await guard.run("questions", lambda: fail_with(AutoReconnect("reset")))
+        assert guard.circuit_states()["questions"] is CircuitState.OPEN
+
+    async def test_stream_left_early_releases_its_slot_when_closed(self):
+        guard = OperationGuard(max_in_flight=1)
+        cursor_closed = asyncio.Event()
+
+        async def cursor():
+            try:
+                for item in range(3):
+                    yield item
+            finally:
+                cursor_closed.set()
+
+        async def open_stream():
+            return cursor()
+
+        async with aclosing(guard.stream("questions", open_stream)) as items:
+            async for item in items:
+                break
+
+        assert cursor_closed.is_set()
+        assert await guard.run("questions", AsyncMock(return_value=1)) == 1
+
+    async def test_exhausted_stream_releases_its_slot(self):
+        guard = OperationGuard(max_in_flight=1)
+
+        async def cursor():
+            yield 1
+
+        async def open_stream():
+            return cursor()
+
+        items = guard.stream("questions", open_stream)
+        assert [item async for item in items] == [1]
+        assert await guard.run("questions", AsyncMock(return_value=1)) == 1
+
+    async def test_excess_operations_are_shed(self):
+        guard = OperationGuard(max_in_flight=1)
+        release = asyncio.Event()
+
+        async def slow_call():
+            await release.wait()
+            return "done"
+
+        running = asyncio.create_task(guard.run("questions", slow_call))
+        await asyncio.sleep(0)
+
+        with pytest.raises(MongoDbOverloadedError):
+            await guard.run("questions", AsyncMock())
+
+        release.set()
+        assert await running == "done"
+        assert await guard.run("questions", AsyncMock(return_value=1)) == 1
@@ -0,0 +1,168 @@
+from functools import cmp_to_key
+from unittest.mock import AsyncMock
+
+import pytest
+from bson import ObjectId
+
+from src.exceptions import InvalidContinuationTokenError
+
+from ..mongo.mongodb import AsyncMongoDatabaseEngine
+from ..pagination import (decode_continuation_token, encode_continuation_token,
+                          keyset_filter, normalize_sort, sort_projection)
+
+
+def _matches(document, query):
+    """Evaluate the subset of MongoDB filters built for keyset pagination."""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(_matches(document, clause) for clause in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(document, clause) for clause in condition):
+                return False
+        elif isinstance(condition, dict):
+            ((operator, value),) = condition.items()
+            if operator == "$gt" and not document[key] > value:
+                return False
+            if operator == "$lt" and not document[key] < value:
+                return False
+        elif document[key] != condition:
+            return False
+    return True
+
+
+class _Cursor:
+    def __init__(self, documents):
+        self._documents = documents
+
+    def sort(self, sort):
+        def compare(left, right):
+            for key, direction in sort:
+                if left[key] != right[key]:
+                    return direction if left[key] > right[key] else -direction
+            return 0
+
+        return _Cursor(sorted(self._documents, key=cmp_to_key(compare)))
+
+    def limit(self, limit):
+        return _Cursor(self._documents[:limit])
+
+    async def to_list(self, length):
+        return self._documents[:length]
+
+
+class _Collection:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def find(self, query, projection=None):
+        return _Cursor([doc for doc in self.documents if _matches(doc, query)])
+
+
+class TestContinuationToken:
+    def test_round_trip(self):
+        sort = normalize_sort([("difficulty", -1)])
+        document = {"_id": ObjectId(), "difficulty": "Hard"}
+
+        token = encode_continuation_token({"topic": "Algebra"}, sort, document)
+
+        assert decode_continuation_token(token, {"topic": "Algebra"}, sort) == [
+            "Hard",
+            document["_id"],
+        ]
+
+    def test_token_of_another_query_is_rejected(self):
+        sort = normalize_sort(None)
+        token = encode_continuation_token({"topic": "Algebra"}, sort, {"_id": 1})
+
+        with pytest.raises(InvalidContinuationTokenError):
+            decode_continuation_token(token, {"topic": "Geometry"}, sort)
+
+    @pytest.mark.parametrize("token", ["not a token", "", "e30"])
+    def test_malformed_token_is_rejected(self, token):
+        with pytest.raises(InvalidContinuationTokenError):
+            decode_continuation_token(token, {}, normalize_sort(None))
+
+
+class TestKeysetHelpers:
+    def test_sort_is_made_unique_with_id(self):
+        assert normalize_sort(None) == [("_id", 1)]
+        assert normalize_sort([("difficulty", -1)]) == [
+            ("difficulty", -1),
+            ("_id", -1),
+        ]
+
+    def test_filter_resumes_after_the_last_values(self):
+        sort = [("difficulty", 1), ("_id", 1)]
+
+        assert keyset_filter(sort, ["Easy", 5]) == {
+            "$or": [
+                {"difficulty": {"$gt": "Easy"}},
+                {"difficulty": "Easy", "_id": {"$gt": 5}},
+            ]
+        }
+
+    def test_projection_loads_sort_keys(self):
+        sort = [("difficulty", 1), ("_id", 1)]
+
+        assert sort_projection({"text": 1, "_id": 0}, sort) == {
+            "text": 1,
+            "_id": 1,
+            "difficulty": 1,
+        }
+        assert sort_projection({"solution": 0, "difficulty": 0}, sort) == {
+            "solution": 0
+        }
+
+
+@pytest.mark.asyncio
+class TestFetchPageFromDb:
+    @pytest.fixture
+    def collection(self):
+        return _Collection(
+            [{"_id": index, "difficulty": index % 3} for index in range(10)]
+        )
+
+    @pytest.fixture
+    def engine(self, collection):
+        engine = AsyncMongoDatabaseEngine("mongodb://localhost:27017")
+        engine._get_collection = AsyncMock(return_value=collection)
+        return engine
+
+    async def _read_all(self, engine, collection, insert_after_first_page=None):
+        pages, token = [], None
+        while True:
+            page = await engine.fetch_page_from_db(
+                "questions",
+                "questions_db",
+                sort=[("difficulty", 1)],
+                page_size=3,
+                continuation_token=token,
+            )
+            pages.append([document["_id"] for document in page.items])
+            if insert_after_first_page and len(pages) == 1:
+                collection.documents.append(insert_after_first_page)
+            token = page.next_token
+            if token is None:
+                return pages
+
+    async def test_pages_cover_every_document_once_in_order(self, engine, collection):
+        pages = await self._read_all(engine, collection)
+
+        assert pages == [[0, 3, 6], [9, 1, 4], [7, 2, 5], [8]]
+
+    async def test_concurrent_inserts_do_not_repeat_or_skip(self, engine, collection):
+        pages = await self._read_all(
+            engine, collection, insert_after_first_page={"_id": -1, "difficulty": 0}
+        )
+
+        # Inserted before the cursor position: not returned, nothing repeated
+        assert sum(pages, []) == [0, 3, 6, 9, 1, 4, 7, 2, 5, 8]
+
+    async def test_last_full_page_has_no_next_token(self, engine, collection):
+        page = await engine.fetch_page_from_db(
+            "questions", "questions_db", page_size=10
+        )
+
+        assert len(page.items) == 10
+        assert page.next_token is None
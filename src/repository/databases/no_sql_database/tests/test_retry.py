@@ -0,0 +1,113 @@
+from contextlib import aclosing
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.exceptions import (MongoDbOperationError,
+                            MongoDbTemporaryOperationError)
+
+from ..retry import Retrier, RetryPolicy, request_deadline
+
+FAST_POLICY = RetryPolicy(max_attempts=3, base_delay_seconds=0.001)
+
+
+def _temporary_error():
+    return MongoDbTemporaryOperationError(operation="fetch_one_from_db")
+
+
+def _raise_temporary_error():
+    raise _temporary_error()
+
+
+async def _stream(*items, error=None):
+    for item in items:
+        yield item
+    if error is not None:
+        raise error
+
+
+@pytest.mark.asyncio
+class TestRetrier:
+    async def test_read_is_retried_until_it_succeeds(self):
+        retrier = Retrier({"fetch_one_from_db": FAST_POLICY})
+        call = AsyncMock(side_effect=[_temporary_error(), {"_id": 1}])
+
+        assert await retrier.run("fetch_one_from_db", call) == {"_id": 1}
+        assert call.await_count == 2
+        assert retrier.retry_counts() == {"fetch_one_from_db": 1}
+
+    async def test_gives_up_after_max_attempts(self):
+        retrier = Retrier({"fetch_one_from_db": FAST_POLICY})
+        call = AsyncMock(side_effect=_raise_temporary_error)
+
+        with pytest.raises(MongoDbTemporaryOperationError) as exc_info:
+            await retrier.run("fetch_one_from_db", call)
+
+        assert call.await_count == 3
+        assert exc_info.value.context["current_retry"] == 2
+
+    async def test_writes_are_not_retried_by_default(self):
+        call = AsyncMock(side_effect=_raise_temporary_error)
+
+        with pytest.raises(MongoDbTemporaryOperationError):
+            await Retrier().run("write_to_db", call)
+
+        call.assert_awaited_once()
+
+    async def test_permanent_errors_are_not_retried(self):
+        call = AsyncMock(side_effect=MongoDbOperationError())
+
+        with pytest.raises(MongoDbOperationError):
+            await Retrier().run("fetch_one_from_db", call)
+
+        call.assert_awaited_once()
+
+    async def test_request_deadline_stops_retries(self):
+        retrier = Retrier(
+            {
+                "fetch_one_from_db": RetryPolicy(
+                    base_delay_seconds=1, max_delay_seconds=1
+                )
+            }
+        )
+        call = AsyncMock(side_effect=_raise_temporary_error)
+
+        with request_deadline(0), pytest.raises(MongoDbTemporaryOperationError):
+            await retrier.run("fetch_one_from_db", call)
+
+        call.assert_awaited_once()
+        assert retrier.retry_counts() == {}
+
+    async def test_stream_is_reopened_before_its_first_item(self):
+        retrier = Retrier({"stream_from_db": FAST_POLICY})
+        open_stream = AsyncMock(
+            side_effect=[_stream(error=_temporary_error()), _stream(1, 2)]
+        )
+
+        items = [item async for item in retrier.stream("stream_from_db", open_stream)]
+
+        assert items == [1, 2]
+        assert open_stream.await_count == 2
+
+    async def test_stream_is_not_retried_after_yielding(self):
+        retrier = Retrier({"stream_from_db": FAST_POLICY})
+        open_stream = AsyncMock(return_value=_stream(1, error=_temporary_error()))
+        items = []
+
+        with pytest.raises(MongoDbTemporaryOperationError):
+            async for item in retrier.stream("stream_from_db", open_stream):
+                items.append(item)
+
+        assert items == [1]
+        open_stream.assert_awaited_once()
+
+    async def test_closing_the_stream_closes_the_opened_stream(self):
+        retrier = Retrier({"stream_from_db": FAST_POLICY})
+        opened = _stream(1, 2)
+        open_stream = AsyncMock(return_value=opened)
+
+        async with aclosing(retrier.stream("stream_from_db", open_stream)) as items:
+            async for item in items:
+                break
+
+        assert opened.ag_frame is None
@@ -0,0 +1,211 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import json_util
+
+from src.exceptions import MongoDbOperationError
+
+from ..write_behind import WriteBehindBuffer
+
+
+@pytest.fixture
+def engine():
+    engine = MagicMock()
+    engine.write_to_db = AsyncMock(return_value=True)
+    engine.bulk_write_to_db = AsyncMock()
+    return engine
+
+
+@pytest.fixture
+def redis_client():
+    redis_client = MagicMock()
+    redis_client.xautoclaim.return_value = [b"0-0", [], []]
+    redis_client.xreadgroup.return_value = []
+    return redis_client
+
+
+def _entry(document):
+    return {
+        b"database": b"grading",
+        b"collection": b"responses",
+        b"document": json.dumps(document).encode(),
+    }
+
+
+def _inserted_documents(engine):
+    return [
+        operation.document
+        for call in engine.bulk_write_to_db.await_args_list
+        for operation in call.args[0]
+    ]
+
+
+async def _until_flushed(buffer, count):
+    while buffer.stats().flushed < count:
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+class TestWriteBehindBuffer:
+    async def test_writes_through_when_not_started(self, engine):
+        buffer = WriteBehindBuffer(engine)
+
+        await buffer.write_to_db({"score": 1}, "responses", "grading")
+
+        engine.write_to_db.assert_awaited_once_with(
+            {"score": 1}, "responses", "grading", timestamp=True
+        )
+
+    async def test_flushes_full_batches_without_waiting(self, engine):
+        buffer = WriteBehindBuffer(engine, max_batch_size=2, flush_interval_seconds=10)
+        await buffer.start()
+        try:
+            await buffer.write_to_db(
+                [{"score": 1}, {"score": 2}], "responses", "grading"
+            )
+            await asyncio.wait_for(_until_flushed(buffer, 2), timeout=1)
+        finally:
+            await buffer.stop()
+
+        engine.bulk_write_to_db.assert_awaited_once()
+        args, kwargs = engine.bulk_write_to_db.await_args
+        assert args[1:] == ("responses", "grading")
+        assert kwargs == {"timestamp": False}
+        documents = _inserted_documents(engine)
+        assert [document["score"] for document in documents] == [1, 2]
+        assert all("_id" in document for document in documents)
+
+    async def test_stop_drains_queued_documents(self, engine):
+        buffer = WriteBehindBuffer(engine, flush_interval_seconds=10)
+        await buffer.start()
+        await buffer.write_to_db({"score": 1}, "responses", "grading")
+        await buffer.write_to_db({"attempt": 1}, "attempts", "attempts_db")
+
+        await buffer.stop()
+
+        assert len(_inserted_documents(engine)) == 2
+        stats = buffer.stats()
+        assert (stats.submitted, stats.flushed, stats.queued) == (2, 2, 0)
+
+    async def test_full_queue_without_redis_is_counted_as_backpressure(self, engine):
+        buffer = WriteBehindBuffer(engine, max_queue_size=1, flush_interval_seconds=0)
+        await buffer.start()
+
+        await buffer.write_to_db([{"score": 1}, {"score": 2}], "responses", "grading")
+        await buffer.stop()
+
+        assert buffer.stats().blocked_submits == 1
+        assert len(_inserted_documents(engine)) == 2
+
+    async def test_queued_documents_are_not_spilled(self, engine, redis_client):
+        buffer = WriteBehindBuffer(engine, redis_client=redis_client)
+        await buffer.start()
+
+        await buffer.write_to_db([{"score": 1}, {"score": 2}], "responses", "grading")
+        await buffer.stop()
+
+        redis_client.pipeline.return_value.xadd.assert_not_called()
+        assert buffer.stats().spilled == 0
+
+    async def test_full_queue_overflows_to_the_stream(self, engine, redis_client):
+        buffer = WriteBehindBuffer(engine, redis_client=redis_client, max_queue_size=1)
+        await buffer.start()
+
+        await buffer.write_to_db([{"score": 1}, {"score": 2}], "responses", "grading")
+
+        pipe = redis_client.pipeline.return_value
+        pipe.xadd.assert_called_once()
+        key, fields = pipe.xadd.call_args.args
+        assert key == WriteBehindBuffer.STREAM_KEY
+        assert json_util.loads(fields["document"])["score"] == 2
+        stats = buffer.stats()
+        assert (stats.spilled, stats.blocked_submits) == (1, 0)
+        await buffer.stop()
+
+    async def test_already_inserted_documents_count_as_flushed(self, engine):
+        engine.bulk_write_to_db.side_effect = MongoDbOperationError(
+            write_errors=[{"index": 0, "code": 11000, "message": "duplicate key"}]
+        )
+        buffer = WriteBehindBuffer(engine, flush_interval_seconds=0)
+        await buffer.start()
+
+        await buffer.write_to_db({"score": 1}, "responses", "grading")
+        await buffer.stop()
+
+        assert (buffer.stats().flushed, buffer.stats().failed) == (1, 0)
+
+    async def test_rejected_overflow_is_moved_to_the_dead_letter_stream(
+        self, engine, redis_client
+    ):
+        engine.bulk_write_to_db.side_effect = MongoDbOperationError(
+            write_errors=[{"index": 0, "code": 121, "message": "validation failed"}]
+        )
+        redis_client.xautoclaim.return_value = [
+            b"0-0",
+            [(b"1-0", _entry({"_id": "r1", "score": "high"}))],
+            [],
+        ]
+        buffer = WriteBehindBuffer(engine, redis_client=redis_client)
+
+        await buffer.start()
+        await buffer.stop()
+
+        pipe = redis_client.pipeline.return_value
+        key, fields = pipe.xadd.call_args.args
+        assert key == WriteBehindBuffer.DEAD_LETTER_STREAM_KEY
+        assert "validation failed" in fields["error"]
+        pipe.xack.assert_called_once_with(
+            WriteBehindBuffer.STREAM_KEY, WriteBehindBuffer.CONSUMER_GROUP, b"1-0"
+        )
+        pipe.xdel.assert_called_once_with(WriteBehindBuffer.STREAM_KEY, b"1-0")
+        assert buffer.stats().dead_lettered == 1
+
+    async def test_only_rejected_documents_of_a_batch_are_dead_lettered(
+        self, engine, redis_client
+    ):
+        engine.bulk_write_to_db.side_effect = MongoDbOperationError(
+            write_errors=[{"index": 1, "code": 121, "message": "validation failed"}]
+        )
+        buffer = WriteBehindBuffer(
+            engine,
+            redis_client=redis_client,
+            max_batch_size=2,
+            flush_interval_seconds=10,
+        )
+        await buffer.start()
+
+        await buffer.write_to_db(
+            [{"score": 1}, {"score": "high"}], "responses", "grading"
+        )
+        await buffer.stop()
+
+        pipe = redis_client.pipeline.return_value
+        pipe.xadd.assert_called_once()
+        key, fields = pipe.xadd.call_args.args
+        assert key == WriteBehindBuffer.DEAD_LETTER_STREAM_KEY
+        assert json_util.loads(fields["document"])["score"] == "high"
+        stats = buffer.stats()
+        assert (stats.flushed, stats.dead_lettered) == (1, 1)
+
+    async def test_overflow_entries_of_crashed_workers_are_claimed(
+        self, engine, redis_client
+    ):
+        redis_client.xautoclaim.return_value = [
+            b"0-0",
+            [(b"1-0", _entry({"_id": "r1", "score": 1}))],
+            [],
+        ]
+        buffer = WriteBehindBuffer(engine, redis_client=redis_client)
+
+        await buffer.start()
+        await buffer.stop()
+
+        assert _inserted_documents(engine) == [{"_id": "r1", "score": 1}]
+        pipe = redis_client.pipeline.return_value
+        pipe.xack.assert_called_once_with(
+            WriteBehindBuffer.STREAM_KEY, WriteBehindBuffer.CONSUMER_GROUP, b"1-0"
+        )
+        pipe.xdel.assert_called_once_with(WriteBehindBuffer.STREAM_KEY, b"1-0")
+        assert buffer.stats().replayed == 1
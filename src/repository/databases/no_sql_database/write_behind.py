@@ -0,0 +1,646 @@
+"""
+no_sql_database.write_behind
+~~~~~~~~~~~~
+
+Write-behind buffer for append-only collections: documents are accepted into
+a per-worker queue and inserted in batches, off the request's critical path.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
+
+from asgiref.sync import sync_to_async
+from bson import ObjectId, json_util
+from redis import Redis, RedisError, ResponseError
+
+from src.exceptions import (MongoDbCircuitOpenError, MongoDbOperationError,
+                            MongoDbOverloadedError,
+                            MongoDbTemporaryOperationError)
+
+from .async_base_engine import AsyncAbstractNoSqLDatabaseEngine
+from .data_types import WriteOperation
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+# Canonical Extended JSON keeps BSON types, e.g. ObjectId and aware datetimes,
+# through the overflow stream
+SPILL_JSON_OPTIONS = json_util.JSONOptions(
+    json_mode=json_util.JSONMode.CANONICAL, tz_aware=True, tzinfo=timezone.utc
+)
+
+PendingWrite = namedtuple(
+    "PendingWrite", ("database_name", "collection_name", "document", "stream_id")
+)
+
+# Put on the queue by stop() so the flusher drains everything queued before it
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class WriteBehindStats:
+    """Snapshot of a buffer's counters, for backpressure monitoring"""
+
+    queued: int
+    high_water_mark: int
+    submitted: int
+    flushed: int
+    failed: int
+    blocked_submits: int
+    spilled: int
+    replayed: int
+    dead_lettered: int
+
+
+class WriteBehindBuffer:
+    """
+    Batches inserts into append-only collections behind a bounded queue.
+
+    Documents get their _id when accepted, so a batch may be inserted more
+    than once without creating duplicates. Documents in the queue are lost if
+    the worker crashes.
+
+    When the queue is full and a Redis client is given, the documents that do
+    not fit are appended to an overflow stream instead, and the flusher inserts
+    them once it has caught up. Entries are read through a consumer group, so
+    the entries of a crashed worker, or of a flush that gave up, are claimed
+    by a flusher after recovery_age_seconds. Batches the database rejects for
+    good are moved to a dead-letter stream rather than retried.
+
+    Without a Redis client, a full queue makes write_to_db wait for the
+    flusher, which slows callers down instead of growing the queue without
+    bound.
+    """
+
+    STREAM_KEY = "write_behind:v1:overflow"
+    DEAD_LETTER_STREAM_KEY = "write_behind:v1:dead_letter"
+    CONSUMER_GROUP = "write_behind"
+    DEAD_LETTER_MAX_LENGTH = 10_000
+    DEFAULT_MAX_BATCH_SIZE = 500
+    DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+    DEFAULT_MAX_QUEUE_SIZE = 10_000
+    DEFAULT_RECOVERY_AGE_SECONDS = 60
+    MAX_FLUSH_ATTEMPTS = 3
+
+    __slots__ = (
+        "_engine",
+        "_redis_client",
+        "_consumer_name",
+        "_max_batch_size",
+        "_flush_interval_seconds",
+        "_recovery_age_seconds",
+        "_queue",
+        "_flusher",
+        "_overflow_ready",
+        "_overflowed",
+        "_next_recovery_at",
+        "_high_water_mark",
+        "_submitted",
+        "_flushed",
+        "_failed",
+        "_blocked_submits",
+        "_spilled",
+        "_replayed",
+        "_dead_lettered",
+    )
+
+    _default_buffer: Optional["WriteBehindBuffer"] = None
+
+    def __init__(
+        self,
+        engine: AsyncAbstractNoSqLDatabaseEngine,
+        redis_client: Optional[Redis] = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        recovery_age_seconds: float = DEFAULT_RECOVERY_AGE_SECONDS,
+    ) -> None:
+        """
+        Initialize the WriteBehindBuffer.
+
+        Args:
+            engine: Engine the batches are written with
+            redis_client: Client of the overflow and dead-letter streams;
+                callers wait for room in a full queue when None
+            max_batch_size: Documents that trigger a flush
+            flush_interval_seconds: Longest time a document waits for a flush
+            max_queue_size: Documents queued before the overflow stream is used
+            recovery_age_seconds: Time an overflow entry may stay claimed by a
+                consumer before another flusher takes it over
+        """
+        self._engine = engine
+        self._redis_client = redis_client
+        self._consumer_name = f"{socket.gethostname()}:{os.getpid()}"
+        self._max_batch_size = max_batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._recovery_age_seconds = recovery_age_seconds
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._flusher: Optional[asyncio.Task] = None
+        self._overflow_ready = False
+        self._overflowed = False
+        self._next_recovery_at = 0.0
+        self._high_water_mark = 0
+        self._submitted = 0
+        self._flushed = 0
+        self._failed = 0
+        self._blocked_submits = 0
+        self._spilled = 0
+        self._replayed = 0
+        self._dead_lettered = 0
+
+    @property
+    def running(self) -> bool:
+        return self._flusher is not None and not self._flusher.done()
+
+    async def start(self) -> None:
+        """Start flushing, including documents left in the overflow stream"""
+        if self.running:
+            return
+
+        if self._redis_client is not None:
+            self._overflow_ready = await self._create_consumer_group()
+            # Entries spilled before this worker started are drained first
+            self._overflowed = self._overflow_ready
+
+        self._flusher = asyncio.create_task(self._run_flusher())
+        logger.info("Write-behind buffer started")
+
+    async def stop(self) -> None:
+        """Stop accepting documents and flush everything already queued"""
+        if not self.running:
+            return
+
+        flusher, self._flusher = self._flusher, None
+        await self._queue.put(_STOP)
+        await flusher
+        logger.info("Write-behind buffer drained: %s", self.stats())
+
+    async def write_to_db(
+        self,
+        data: Union[Dict, list],
+        collection_name: str,
+        database_name: str,
+        timestamp: bool = True,
+    ) -> bool:
+        """
+        Accept document(s) for insertion, with the engine's write_to_db signature.
+
+        Writes through to the engine when the buffer is not running.
+
+        Args:
+            data: Document or list of documents to insert
+            collection_name: Collection name
+            database_name: Database name
+            timestamp: Add created_at, set when the document is accepted
+
+        Returns:
+            True once the document(s) are queued, spilled or written
+        """
+        if not self.running:
+            return await self._engine.write_to_db(
+                data, collection_name, database_name, timestamp=timestamp
+            )
+
+        documents = data if isinstance(data, list) else [data]
+        created_at = datetime.now(timezone.utc)
+        documents = [
+            {
+                "_id": ObjectId(),
+                **document,
+                **({"created_at": created_at} if timestamp else {}),
+            }
+            for document in documents
+        ]
+
+        overflow = []
+        for document in documents:
+            try:
+                self._queue.put_nowait(
+                    PendingWrite(database_name, collection_name, document, None)
+                )
+            except asyncio.QueueFull:
+                overflow.append(document)
+        self._high_water_mark = max(self._high_water_mark, self._queue.qsize())
+
+        if overflow and not await self._spill(
+            [
+                PendingWrite(database_name, collection_name, document, None)
+                for document in overflow
+            ]
+        ):
+            self._blocked_submits += 1
+            logger.warning(
+                "Write-behind queue full (%d documents), waiting for a flush",
+                self._queue.qsize(),
+            )
+            for document in overflow:
+                await self._queue.put(
+                    PendingWrite(database_name, collection_name, document, None)
+                )
+
+        self._submitted += len(documents)
+        return True
+
+    def stats(self) -> WriteBehindStats:
+        return WriteBehindStats(
+            queued=self._queue.qsize(),
+            high_water_mark=self._high_water_mark,
+            submitted=self._submitted,
+            flushed=self._flushed,
+            failed=self._failed,
+            blocked_submits=self._blocked_submits,
+            spilled=self._spilled,
+            replayed=self._replayed,
+            dead_lettered=self._dead_lettered,
+        )
+
+    async def _run_flusher(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._next_batch()
+            if batch:
+                await self._flush(batch)
+            if self._overflow_ready and (
+                self._overflowed or time.monotonic() >= self._next_recovery_at
+            ):
+                await self._drain_overflow()
+
+    async def _next_batch(self) -> Tuple[List[PendingWrite], bool]:
+        """
+        Collect documents until the batch is full or the flush interval passed.
+
+        Returns:
+            The batch, empty if the overflow stream is due before a document
+            was queued, and whether stop() was requested
+        """
+        try:
+            item = self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            try:
+                item = await asyncio.wait_for(self._queue.get(), self._idle_timeout())
+            except asyncio.TimeoutError:
+                return [], False
+        if item is _STOP:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self._flush_interval_seconds
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _idle_timeout(self) -> Optional[float]:
+        """Return how long an idle flusher may wait before draining the overflow"""
+        if not self._overflow_ready:
+            return None
+        if self._overflowed:
+            return 0
+        return max(self._next_recovery_at - time.monotonic(), 0)
+
+    async def _flush(self, batch: List[PendingWrite]) -> None:
+        groups: Dict[Tuple[str, str], List[PendingWrite]] = {}
+        for pending in batch:
+            groups.setdefault(
+                (pending.database_name, pending.collection_name), []
+            ).append(pending)
+
+        for (database_name, collection_name), pending_writes in groups.items():
+            try:
+                stored = await self._insert(
+                    database_name,
+                    collection_name,
+                    [pending.document for pending in pending_writes],
+                )
+            except MongoDbOperationError as e:
+                # Inserts are unordered, so only the documents with a write
+                # error were not stored
+                write_errors = e.context.get("write_errors") or []
+                rejected_indexes = {
+                    error["index"]
+                    for error in write_errors
+                    if error["code"] != DUPLICATE_KEY_ERROR_CODE
+                }
+                rejected = [
+                    pending
+                    for index, pending in enumerate(pending_writes)
+                    if not write_errors or index in rejected_indexes
+                ]
+                self._failed += len(rejected)
+                await self._dead_letter(rejected, e)
+                pending_writes = [
+                    pending
+                    for index, pending in enumerate(pending_writes)
+                    if write_errors and index not in rejected_indexes
+                ]
+                stored = True
+
+            if stored:
+                self._flushed += len(pending_writes)
+                await self._acknowledge(
+                    [
+                        pending.stream_id
+                        for pending in pending_writes
+                        if pending.stream_id is not None
+                    ]
+                )
+            else:
+                self._failed += len(pending_writes)
+                await self._spill(
+                    [pending for pending in pending_writes if pending.stream_id is None]
+                )
+
+    async def _insert(
+        self, database_name: str, collection_name: str, documents: List[Dict]
+    ) -> bool:
+        """
+        Insert a batch, tolerating documents inserted by an earlier attempt.
+
+        Returns:
+            Whether every document is now stored; False when temporary errors
+            outlasted MAX_FLUSH_ATTEMPTS
+
+        Raises:
+            MongoDbOperationError: If the database rejected the batch, which
+                retrying would not change
+        """
+        operations = [WriteOperation.insert(document) for document in documents]
+        for attempt in range(1, self.MAX_FLUSH_ATTEMPTS + 1):
+            try:
+                await self._engine.bulk_write_to_db(
+                    operations, collection_name, database_name, timestamp=False
+                )
+                return True
+            except MongoDbOperationError as e:
+                write_errors = e.context.get("write_errors") or []
+                if write_errors and all(
+                    error["code"] == DUPLICATE_KEY_ERROR_CODE for error in write_errors
+                ):
+                    return True
+                logger.error(
+                    "Write-behind batch of %d document(s) for %s.%s rejected: %s",
+                    len(documents),
+                    database_name,
+                    collection_name,
+                    e.context,
+                )
+                raise
+            except (
+                MongoDbTemporaryOperationError,
+                MongoDbCircuitOpenError,
+                MongoDbOverloadedError,
+            ) as e:
+                logger.warning(
+                    "Write-behind flush to %s.%s failed (attempt %d/%d): %s",
+                    database_name,
+                    collection_name,
+                    attempt,
+                    self.MAX_FLUSH_ATTEMPTS,
+                    e,
+                )
+                await asyncio.sleep(self._flush_interval_seconds * attempt)
+
+        logger.error(
+            "Giving up on write-behind batch of %d document(s) for %s.%s%s",
+            len(documents),
+            database_name,
+            collection_name,
+            "; kept in the overflow stream" if self._overflow_ready else "",
+        )
+        return False
+
+    async def _create_consumer_group(self) -> bool:
+        def create() -> None:
+            try:
+                self._redis_client.xgroup_create(
+                    self.STREAM_KEY, self.CONSUMER_GROUP, id="0", mkstream=True
+                )
+            except ResponseError as e:
+                if not str(e).startswith("BUSYGROUP"):
+                    raise
+
+        try:
+            await sync_to_async(create, thread_sensitive=False)()
+        except RedisError as e:
+            logger.warning(
+                "Write-behind overflow stream unavailable, a full queue blocks: %s", e
+            )
+            return False
+        return True
+
+    async def _spill(self, pending_writes: List[PendingWrite]) -> bool:
+        """
+        Append documents to the overflow stream.
+
+        Returns:
+            Whether the documents are in the stream
+        """
+        if not pending_writes:
+            return True
+        if not self._overflow_ready:
+            return False
+
+        def spill() -> None:
+            pipe = self._redis_client.pipeline(transaction=False)
+            for pending in pending_writes:
+                pipe.xadd(self.STREAM_KEY, _encode_entry(pending))
+            pipe.execute()
+
+        try:
+            await sync_to_async(spill, thread_sensitive=False)()
+        except RedisError as e:
+            logger.warning("Failed to spill write-behind documents to Redis: %s", e)
+            return False
+
+        self._spilled += len(pending_writes)
+        self._overflowed = True
+        return True
+
+    async def _drain_overflow(self) -> None:
+        """
+        Insert a batch from the overflow stream.
+
+        Entries claimed by another consumer for longer than the recovery age,
+        e.g. by a crashed worker, are taken over before new entries are read.
+        """
+        self._overflowed = False
+        self._next_recovery_at = time.monotonic() + self._recovery_age_seconds
+
+        def claim() -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+            _, entries, *_ = self._redis_client.xautoclaim(
+                self.STREAM_KEY,
+                self.CONSUMER_GROUP,
+                self._consumer_name,
+                min_idle_time=int(self._recovery_age_seconds * 1000),
+                start_id="0-0",
+                count=self._max_batch_size,
+            )
+            # Entries deleted while claimed come back without fields
+            entries = [(stream_id, fields) for stream_id, fields in entries if fields]
+            if entries:
+                return entries
+
+            response = self._redis_client.xreadgroup(
+                self.CONSUMER_GROUP,
+                self._consumer_name,
+                {self.STREAM_KEY: ">"},
+                count=self._max_batch_size,
+            )
+            return response[0][1] if response else []
+
+        try:
+            entries = await sync_to_async(claim, thread_sensitive=False)()
+        except RedisError as e:
+            logger.warning("Failed to read write-behind overflow documents: %s", e)
+            return
+        if not entries:
+            return
+
+        # A full batch may have more entries behind it
+        self._overflowed = self._overflowed or len(entries) >= self._max_batch_size
+        await self._flush(
+            [_decode_entry(stream_id, fields) for stream_id, fields in entries]
+        )
+        self._replayed += len(entries)
+        logger.info("Replayed %d write-behind overflow document(s)", len(entries))
+
+    async def _acknowledge(self, stream_ids: List[bytes]) -> None:
+        if not stream_ids:
+            return
+
+        def acknowledge() -> None:
+            pipe = self._redis_client.pipeline(transaction=False)
+            pipe.xack(self.STREAM_KEY, self.CONSUMER_GROUP, *stream_ids)
+            pipe.xdel(self.STREAM_KEY, *stream_ids)
+            pipe.execute()
+
+        try:
+            await sync_to_async(acknowledge, thread_sensitive=False)()
+        except RedisError as e:
+            # The entries are claimed again later; their _id keeps that idempotent
+            logger.warning("Failed to remove flushed documents from Redis: %s", e)
+
+    async def _dead_letter(
+        self, pending_writes: List[PendingWrite], error: MongoDbOperationError
+    ) -> None:
+        """Move documents the database rejected to the dead-letter stream"""
+        if self._redis_client is None:
+            logger.error(
+                "Dropping %d rejected write-behind document(s)", len(pending_writes)
+            )
+            return
+
+        reason = json.dumps(error.context, default=str)
+        stream_ids = [
+            pending.stream_id
+            for pending in pending_writes
+            if pending.stream_id is not None
+        ]
+
+        def dead_letter() -> None:
+            pipe = self._redis_client.pipeline(transaction=True)
+            for pending in pending_writes:
+                pipe.xadd(
+                    self.DEAD_LETTER_STREAM_KEY,
+                    {**_encode_entry(pending), "error": reason},
+                    maxlen=self.DEAD_LETTER_MAX_LENGTH,
+                    approximate=True,
+                )
+            if stream_ids:
+                pipe.xack(self.STREAM_KEY, self.CONSUMER_GROUP, *stream_ids)
+                pipe.xdel(self.STREAM_KEY, *stream_ids)
+            pipe.execute()
+
+        try:
+            await sync_to_async(dead_letter, thread_sensitive=False)()
+        except RedisError as e:
+            logger.error(
+                "Dropping %d rejected write-behind document(s), dead-lettering "
+                "failed: %s",
+                len(pending_writes),
+                e,
+            )
+            return
+
+        self._dead_lettered += len(pending_writes)
+        logger.warning(
+            "Moved %d rejected write-behind document(s) to %s",
+            len(pending_writes),
+            self.DEAD_LETTER_STREAM_KEY,
+        )
+
+    @classmethod
+    def get_buffer(cls) -> Optional["WriteBehindBuffer"]:
+        """Return the process-wide buffer, or None when write-behind is disabled"""
+        from django.conf import settings
+
+        if not getattr(settings, "MONGO_WRITE_BEHIND_ENABLED", False):
+            return None
+
+        if cls._default_buffer is None:
+            from src.config.settings.redis import REDIS_CLIENT
+
+            from .mongo.mongodb import mongo_database
+
+            cls._default_buffer = cls(
+                mongo_database,
+                redis_client=REDIS_CLIENT,
+                max_batch_size=getattr(
+                    settings,
+                    "MONGO_WRITE_BEHIND_BATCH_SIZE",
+                    cls.DEFAULT_MAX_BATCH_SIZE,
+                ),
+                flush_interval_seconds=getattr(
+                    settings,
+                    "MONGO_WRITE_BEHIND_FLUSH_SECONDS",
+                    cls.DEFAULT_FLUSH_INTERVAL_SECONDS,
+                ),
+                max_queue_size=getattr(
+                    settings,
+                    "MONGO_WRITE_BEHIND_MAX_QUEUE_SIZE",
+                    cls.DEFAULT_MAX_QUEUE_SIZE,
+                ),
+            )
+        return cls._default_buffer
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self._queue.qsize()} queued>"
+
+
+def _encode_entry(pending: PendingWrite) -> Dict[str, str]:
+    return {
+        "database": pending.database_name,
+        "collection": pending.collection_name,
+        "document": json_util.dumps(pending.document, json_options=SPILL_JSON_OPTIONS),
+    }
+
+
+def _decode_entry(stream_id: bytes, fields: Dict[bytes, bytes]) -> PendingWrite:
+    return PendingWrite(
+        _decode(fields[b"database"]),
+        _decode(fields[b"collection"]),
+        json_util.loads(fields[b"document"], json_options=SPILL_JSON_OPTIONS),
+        stream_id,
+    )
+
+
+def _decode(value: Union[bytes, str]) -> str:
+    return value.decode() if isinstance(value, bytes) else value
@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 from src.apps.learning_tools.questions.models import QuestionSet
-from src.repository.question_repository.data_types import Question
+from src.repository.databases.no_sql_database.data_types import Page
+from src.repository.question_repository.data_types import (Question,
+                                                           QuestionProfile,
+                                                           QuestionView)
 
 
 class AbstractQuestionRepository(ABC):
     """
-    Abstract class that provides an interface for question retrieval operations.
+    Abstract class that provides an interface for question retrieval and storage.
 
     This class defines the contract for accessing question data from various
     storage backends (database, cache, external APIs, etc.).
@@ -52,6 +55,43 @@ class AbstractQuestionRepository(ABC):
         """
         raise NotImplementedError("get_question_by_single_id is not implemented")
 
+    @abstractmethod
+    async def get_question_views_by_ids(
+        self,
+        question_ids: List[QuestionSet],
+        collection_name: str,
+        profile: QuestionProfile,
+    ) -> List[QuestionView]:
+        """
+        Retrieve multiple questions as the lighter model of a read profile.
+
+        Args:
+            question_ids: List of question identifiers to retrieve
+            collection_name: Name of the question collection/category
+            profile: Read profile deciding which fields are loaded
+
+        Returns:
+            List of question views matching the provided identifiers
+        """
+        raise NotImplementedError("get_question_views_by_ids is not implemented")
+
+    @abstractmethod
+    async def get_question_view_by_id(
+        self, question_id: str, collection_name: str, profile: QuestionProfile
+    ) -> QuestionView:
+        """
+        Retrieve a single question as the lighter model of a read profile.
+
+        Args:
+            question_id: Unique identifier of the question
+            collection_name: Name of the question collection/category
+            profile: Read profile deciding which fields are loaded
+
+        Returns:
+            The question view
+        """
+        raise NotImplementedError("get_question_view_by_id is not implemented")
+
     @abstractmethod
     async def get_question_by_custom_query(
         self, collection_name: str, query: dict[Any, Any]
@@ -82,3 +122,51 @@ class AbstractQuestionRepository(ABC):
             List of processed Question objects
         """
         raise NotImplementedError("get_questions_by_aggregation is not implemented")
+
+    @abstractmethod
+    async def get_questions_page(
+        self,
+        collection_name: str,
+        profile: QuestionProfile,
+        query: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[tuple]] = None,
+        page_size: int = 50,
+        continuation_token: Optional[str] = None,
+    ) -> Page:
+        """
+        Retrieve one page of a collection's questions, e.g. for admin listings.
+
+        Args:
+            collection_name: Name of the question collection/category
+            profile: Read profile deciding which fields are loaded
+            query: Dictionary of question query parameters
+            sort: Sort criteria as (field, direction) tuples; defaults to _id
+            page_size: Questions per page
+            continuation_token: Token returned with the previous page, None
+                for the first page
+
+        Returns:
+            Page of question views with the token of the next page
+
+        Raises:
+            InvalidContinuationTokenError: If the token does not belong to
+                this query and sort
+        """
+        raise NotImplementedError("get_questions_page is not implemented")
+
+    @abstractmethod
+    async def save_questions(
+        self, collection_name: str, questions: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Insert or update questions, e.g. when questions are ingested.
+
+        Args:
+            collection_name: Name of the question collection/category
+            questions: Raw question documents; documents without an _id are
+                inserted as new questions
+
+        Returns:
+            IDs of the saved questions, in the order given
+        """
+        raise NotImplementedError("save_questions is not implemented")
@@ -0,0 +1,552 @@
+"""
+question_repository.cache.cached_repo
+~~~~~~~~~~~~
+
+Read-through question cache that sits in front of any AbstractQuestionRepository,
+with a process-local LRU tier and a shared Redis tier.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from pydantic import BaseModel, ValidationError
+from redis import Redis, RedisError
+
+from src.apps.learning_tools.questions.models import QuestionSet
+from src.repository.databases.no_sql_database.data_types import Page
+from src.repository.question_repository.base_repo import \
+    AbstractQuestionRepository
+from src.repository.question_repository.data_types import (Question,
+                                                           QuestionProfile,
+                                                           QuestionView)
+from src.repository.question_repository.mongo.qn_repo import \
+    MongoQuestionRepository
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters used to size the question cache"""
+
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.local_hits + self.redis_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LocalTTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Keys are (collection_name, question_id) tuples. Questions are copied in
+    and out, so a caller mutating its question cannot change the cached one.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[CacheKey, Tuple[float, Question]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[Question]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, question = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+        return question.model_copy(deep=True)
+
+    def set(self, key: CacheKey, question: Question) -> None:
+        question = question.model_copy(deep=True)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, question)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: CacheKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear_collection(self, collection_name: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == collection_name]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _to_payload(value: Any) -> Any:
+    """
+    Convert a pydantic model into JSON-compatible data, keeping excluded fields.
+
+    Question hides answers and solutions from API serialization with
+    `exclude=True`, so model_dump cannot be used to round-trip it.
+    """
+    if isinstance(value, BaseModel):
+        return {
+            name: _to_payload(getattr(value, name)) for name in type(value).model_fields
+        }
+    if isinstance(value, list):
+        return [_to_payload(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class CachedQuestionRepository(AbstractQuestionRepository):
+    """
+    Read-through cache in front of another question repository.
+
+    Lookups are served from the local LRU tier first, then from Redis, where
+    every question has its own key and TTL, and only the remaining misses
+    reach the wrapped repository. Queries that cannot be keyed by question ID
+    are passed straight through, and writes drop the written questions.
+
+    Attributes:
+        stats: Hit/miss counters for both tiers.
+    """
+
+    REDIS_KEY_PREFIX = "question_cache:v1"
+    DEFAULT_LOCAL_MAX_SIZE = 5000
+    DEFAULT_LOCAL_TTL_SECONDS = 60
+    # Question edits made outside save_questions (e.g. by the ingest service)
+    # are not seen by the cache, so this bounds how long they are served stale
+    DEFAULT_REDIS_TTL_SECONDS = 5 * 60
+    INVALIDATION_BATCH_SIZE = 500
+
+    __slots__ = (
+        "_question_repo",
+        "_redis_client",
+        "_redis_ttl_seconds",
+        "_local_cache",
+        "stats",
+    )
+
+    _default_repo: Optional["CachedQuestionRepository"] = None
+
+    def __init__(
+        self,
+        question_repo: AbstractQuestionRepository,
+        redis_client: Optional[Redis] = None,
+        local_max_size: int = DEFAULT_LOCAL_MAX_SIZE,
+        local_ttl_seconds: float = DEFAULT_LOCAL_TTL_SECONDS,
+        redis_ttl_seconds: int = DEFAULT_REDIS_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the CachedQuestionRepository.
+
+        Args:
+            question_repo: Repository used to load questions on a cache miss
+            redis_client: Shared Redis client; the Redis tier is skipped when None
+            local_max_size: Maximum number of questions held in the local tier
+            local_ttl_seconds: Lifetime of local entries
+            redis_ttl_seconds: Lifetime of a question's Redis entry
+        """
+        self._question_repo = question_repo
+        self._redis_client = redis_client
+        self._redis_ttl_seconds = redis_ttl_seconds
+        self._local_cache = LocalTTLCache(local_max_size, local_ttl_seconds)
+        self.stats = CacheStats()
+
+    async def get_questions_by_ids(
+        self, question_ids: List[QuestionSet], collection_name: str
+    ) -> List[Question]:
+        """
+        Retrieve multiple questions by their IDs, serving cached entries first.
+
+        Args:
+            question_ids: List of question ID dictionaries to retrieve
+            collection_name: Name of the question collection
+
+        Returns:
+            List of Question objects in the order they were requested
+
+        Raises:
+            ValueError: If collection_name is empty.
+        """
+        if not collection_name:
+            logger.error("Empty collection name provided")
+            raise ValueError("Collection name cannot be empty")
+
+        requested_ids = list(dict.fromkeys(str(item["id"]) for item in question_ids))
+        found = await self._get_many(collection_name, requested_ids)
+
+        return [
+            found[question_id] for question_id in requested_ids if question_id in found
+        ]
+
+    async def get_question_by_single_id(
+        self, question_id: str, collection_name: str
+    ) -> Question:
+        """
+        Retrieve a single question by its ID, serving a cached entry first.
+
+        Args:
+            question_id: Unique identifier of the question
+            collection_name: Name of the question collection
+
+        Returns:
+            The Question object
+        """
+        key = (collection_name, question_id)
+        question = self._local_cache.get(key)
+        if question is not None:
+            self.stats.local_hits += 1
+            return question
+
+        cached = await self._read_from_redis(collection_name, [question_id])
+        if question_id in cached:
+            self.stats.redis_hits += 1
+            self._local_cache.set(key, cached[question_id])
+            return cached[question_id]
+
+        self.stats.misses += 1
+        question = await self._question_repo.get_question_by_single_id(
+            question_id=question_id, collection_name=collection_name
+        )
+        await self._store(collection_name, [question])
+        return question
+
+    async def get_question_views_by_ids(
+        self,
+        question_ids: List[QuestionSet],
+        collection_name: str,
+        profile: QuestionProfile,
+    ) -> List[QuestionView]:
+        """
+        Retrieve multiple question views.
+
+        The cache holds full questions, so only GRADING is served from it.
+        Lighter profiles go to the wrapped repository, which loads just
+        their fields.
+
+        Args:
+            question_ids: List of question ID dictionaries to retrieve
+            collection_name: Name of the question collection
+            profile: Read profile deciding which model is returned
+
+        Returns:
+            List of question views in the order they were requested
+        """
+        if profile is QuestionProfile.GRADING:
+            return await self.get_questions_by_ids(question_ids, collection_name)
+        return await self._question_repo.get_question_views_by_ids(
+            question_ids=question_ids, collection_name=collection_name, profile=profile
+        )
+
+    async def get_question_view_by_id(
+        self, question_id: str, collection_name: str, profile: QuestionProfile
+    ) -> QuestionView:
+        """
+        Retrieve a single question view, served from the cache for GRADING only.
+
+        Args:
+            question_id: Unique identifier of the question
+            collection_name: Name of the question collection
+            profile: Read profile deciding which model is returned
+
+        Returns:
+            The question view
+        """
+        if profile is QuestionProfile.GRADING:
+            return await self.get_question_by_single_id(question_id, collection_name)
+        return await self._question_repo.get_question_view_by_id(
+            question_id=question_id, collection_name=collection_name, profile=profile
+        )
+
+    async def get_question_by_custom_query(
+        self, collection_name: str, query: dict[Any, Any]
+    ) -> List[Question]:
+        """Custom queries are not cacheable by ID and go to the wrapped repository."""
+        return await self._question_repo.get_question_by_custom_query(
+            collection_name=collection_name, query=query
+        )
+
+    async def get_questions_by_aggregation(
+        self, collection_name: str, pipeline: Any
+    ) -> List[Question]:
+        """Aggregations are not cacheable by ID and go to the wrapped repository."""
+        return await self._question_repo.get_questions_by_aggregation(
+            collection_name=collection_name, pipeline=pipeline
+        )
+
+    async def get_questions_page(
+        self,
+        collection_name: str,
+        profile: QuestionProfile,
+        query: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[tuple]] = None,
+        page_size: int = 50,
+        continuation_token: Optional[str] = None,
+    ) -> Page:
+        """Pages are not cacheable by ID and go to the wrapped repository."""
+        return await self._question_repo.get_questions_page(
+            collection_name=collection_name,
+            profile=profile,
+            query=query,
+            sort=sort,
+            page_size=page_size,
+            continuation_token=continuation_token,
+        )
+
+    async def save_questions(
+        self, collection_name: str, questions: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Save questions through the wrapped repository and drop their cached copies.
+
+        Args:
+            collection_name: Name of the question collection
+            questions: Raw question documents to insert or update
+
+        Returns:
+            IDs of the saved questions
+        """
+        question_ids = await self._question_repo.save_questions(
+            collection_name=collection_name, questions=questions
+        )
+        await sync_to_async(self.invalidate, thread_sensitive=False)(
+            collection_name, question_ids
+        )
+        return question_ids
+
+    def invalidate(
+        self, collection_name: str, question_ids: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Drop cached questions for a collection from both tiers.
+
+        The local tier is only cleared in the current process; other workers
+        pick up the change once their local entries expire.
+
+        Args:
+            collection_name: Name of the question collection
+            question_ids: Question IDs to drop, or None for the whole collection
+        """
+        if question_ids is None:
+            self._local_cache.clear_collection(collection_name)
+        else:
+            question_ids = [str(question_id) for question_id in question_ids]
+            if not question_ids:
+                return
+            for question_id in question_ids:
+                self._local_cache.delete((collection_name, question_id))
+
+        if self._redis_client is None:
+            return
+
+        try:
+            if question_ids is None:
+                self._delete_collection_keys(collection_name)
+            else:
+                self._redis_client.delete(
+                    *(
+                        self._redis_key(collection_name, question_id)
+                        for question_id in question_ids
+                    )
+                )
+            logger.info(
+                "Invalidated cached questions for collection '%s'", collection_name
+            )
+        except RedisError as e:
+            logger.warning(
+                "Failed to invalidate Redis question cache for '%s': %s",
+                collection_name,
+                e,
+            )
+
+    def _delete_collection_keys(self, collection_name: str) -> None:
+        """Delete every Redis entry of a collection, a batch of keys at a time."""
+        pattern = f"{self._redis_key_prefix(collection_name)}*"
+        batch: List[Any] = []
+        for key in self._redis_client.scan_iter(
+            match=pattern, count=self.INVALIDATION_BATCH_SIZE
+        ):
+            batch.append(key)
+            if len(batch) >= self.INVALIDATION_BATCH_SIZE:
+                self._redis_client.delete(*batch)
+                batch = []
+        if batch:
+            self._redis_client.delete(*batch)
+
+    async def _get_many(
+        self, collection_name: str, question_ids: List[str]
+    ) -> Dict[str, Question]:
+        """Resolve question IDs through both cache tiers, then the wrapped repository."""
+        found: Dict[str, Question] = {}
+        pending: List[str] = []
+
+        for question_id in question_ids:
+            question = self._local_cache.get((collection_name, question_id))
+            if question is None:
+                pending.append(question_id)
+            else:
+                found[question_id] = question
+        self.stats.local_hits += len(found)
+
+        if pending:
+            cached = await self._read_from_redis(collection_name, pending)
+            self.stats.redis_hits += len(cached)
+            for question_id, question in cached.items():
+                found[question_id] = question
+                self._local_cache.set((collection_name, question_id), question)
+            pending = [
+                question_id for question_id in pending if question_id not in cached
+            ]
+
+        if pending:
+            self.stats.misses += len(pending)
+            logger.debug(
+                "Question cache miss for %d IDs in collection '%s'",
+                len(pending),
+                collection_name,
+            )
+            questions = await self._question_repo.get_questions_by_ids(
+                question_ids=[{"id": question_id} for question_id in pending],
+                collection_name=collection_name,
+            )
+            await self._store(collection_name, questions)
+            found.update((question.id, question) for question in questions)
+
+        return found
+
+    async def _store(self, collection_name: str, questions: List[Question]) -> None:
+        """Write freshly loaded questions into both cache tiers."""
+        for question in questions:
+            self._local_cache.set((collection_name, question.id), question)
+
+        if self._redis_client is None or not questions:
+            return
+
+        payloads = {
+            self._redis_key(collection_name, question.id): json.dumps(
+                _to_payload(question)
+            )
+            for question in questions
+        }
+
+        def write() -> None:
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for redis_key, payload in payloads.items():
+                pipeline.set(redis_key, payload, ex=self._redis_ttl_seconds)
+            pipeline.execute()
+
+        try:
+            await sync_to_async(write, thread_sensitive=False)()
+        except RedisError as e:
+            logger.warning("Failed to write questions to Redis cache: %s", e)
+
+    async def _read_from_redis(
+        self, collection_name: str, question_ids: List[str]
+    ) -> Dict[str, Question]:
+        """Read questions from Redis in a single round trip."""
+        if self._redis_client is None:
+            return {}
+
+        try:
+            payloads = await sync_to_async(
+                self._redis_client.mget, thread_sensitive=False
+            )(
+                [
+                    self._redis_key(collection_name, question_id)
+                    for question_id in question_ids
+                ]
+            )
+        except RedisError as e:
+            logger.warning("Failed to read questions from Redis cache: %s", e)
+            return {}
+
+        result: Dict[str, Question] = {}
+        for question_id, payload in zip(question_ids, payloads):
+            if payload is None:
+                continue
+            try:
+                result[question_id] = Question.model_validate_json(payload)
+            except ValidationError as e:
+                logger.warning(
+                    "Discarding invalid cached question %s: %s", question_id, e
+                )
+
+        return result
+
+    def _redis_key(self, collection_name: str, question_id: str) -> str:
+        return f"{self.REDIS_KEY_PREFIX}:{collection_name}:{question_id}"
+
+    def _redis_key_prefix(self, collection_name: str) -> str:
+        """Key prefix of a collection's entries, escaped for use as a SCAN pattern"""
+        return re.sub(
+            r"([*?\[\]\\])", r"\\\1", f"{self.REDIS_KEY_PREFIX}:{collection_name}:"
+        )
+
+    @classmethod
+    def get_repo(cls) -> "CachedQuestionRepository":
+        """
+        Return the process-wide cached repository over MongoDB and shared Redis.
+
+        A single instance is kept per process so the local tier is shared
+        between requests.
+        """
+        if cls._default_repo is None:
+            from django.conf import settings
+
+            from src.config.settings.redis import REDIS_CONNECTION_POOL
+
+            logger.info("Creating CachedQuestionRepository instance")
+            cls._default_repo = cls(
+                question_repo=MongoQuestionRepository.get_repo(),
+                redis_client=Redis(connection_pool=REDIS_CONNECTION_POOL),
+                redis_ttl_seconds=getattr(
+                    settings,
+                    "QUESTION_CACHE_REDIS_TTL_SECONDS",
+                    cls.DEFAULT_REDIS_TTL_SECONDS,
+                ),
+            )
+
+        return cls._default_repo
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self._question_repo!r}, {self.stats!r}>"
+
+
+def invalidate_question_cache(
+    collection_name: str, question_ids: Optional[Iterable[str]] = None
+) -> None:
+    """
+    Invalidate cached questions after course sync or a question write.
+
+    Writes through CachedQuestionRepository.save_questions invalidate the
+    saved questions themselves; code writing questions to MongoDB any other
+    way should call this once the write is done.
+
+    Args:
+        collection_name: Name of the question collection (the course key)
+        question_ids: Specific question IDs to drop, or None for the whole collection
+    """
+    CachedQuestionRepository.get_repo().invalidate(collection_name, question_ids)
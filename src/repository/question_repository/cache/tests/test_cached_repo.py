@@ -0,0 +1,162 @@
+import json
+from unittest.mock import ANY, AsyncMock, MagicMock
+
+import pytest
+
+from src.repository.question_repository.mongo.tests.factories import \
+    QuestionFactory
+
+from ...data_types import QuestionProfile
+from ..cached_repo import CachedQuestionRepository, LocalTTLCache, _to_payload
+
+
+@pytest.fixture
+def question():
+    return QuestionFactory(_id="question-1")
+
+
+@pytest.fixture
+def question_repo(question):
+    repo = MagicMock()
+    repo.get_questions_by_ids = AsyncMock(return_value=[question])
+    repo.get_question_by_single_id = AsyncMock(return_value=question)
+    return repo
+
+
+@pytest.fixture
+def redis_client():
+    client = MagicMock()
+    client.mget.return_value = [None]
+    return client
+
+
+@pytest.fixture
+def cached_repo(question_repo, redis_client):
+    return CachedQuestionRepository(
+        question_repo=question_repo, redis_client=redis_client
+    )
+
+
+class TestLocalTTLCache:
+    def test_expired_entries_are_dropped(self, question):
+        cache = LocalTTLCache(max_size=10, ttl_seconds=0)
+        cache.set(("course", question.id), question)
+
+        assert cache.get(("course", question.id)) is None
+
+    def test_least_recently_used_entry_is_evicted(self, question):
+        cache = LocalTTLCache(max_size=2, ttl_seconds=60)
+        cache.set(("course", "a"), question)
+        cache.set(("course", "b"), question)
+        cache.get(("course", "a"))
+        cache.set(("course", "c"), question)
+
+        assert cache.get(("course", "a")) == question
+        assert cache.get(("course", "b")) is None
+
+    def test_callers_cannot_change_cached_questions(self, question):
+        cache = LocalTTLCache(max_size=10, ttl_seconds=60)
+        original_text = question.text
+        cache.set(("course", question.id), question)
+
+        cache.get(("course", question.id)).text = "Changed by a caller"
+        question.text = "Changed after caching"
+
+        assert cache.get(("course", question.id)).text == original_text
+
+
+@pytest.mark.asyncio
+class TestCachedQuestionRepository:
+    async def test_miss_loads_from_wrapped_repo_and_fills_both_tiers(
+        self, cached_repo, question_repo, redis_client, question
+    ):
+        result = await cached_repo.get_questions_by_ids([{"id": question.id}], "course")
+
+        assert result == [question]
+        question_repo.get_questions_by_ids.assert_awaited_once()
+        redis_client.pipeline.return_value.set.assert_called_once_with(
+            f"question_cache:v1:course:{question.id}", ANY, ex=5 * 60
+        )
+        assert cached_repo.stats.misses == 1
+
+    async def test_local_hit_skips_redis_and_wrapped_repo(
+        self, cached_repo, question_repo, redis_client, question
+    ):
+        await cached_repo.get_questions_by_ids([{"id": question.id}], "course")
+        redis_client.mget.reset_mock()
+
+        result = await cached_repo.get_question_by_single_id(question.id, "course")
+
+        assert result == question
+        redis_client.mget.assert_not_called()
+        question_repo.get_question_by_single_id.assert_not_awaited()
+        assert cached_repo.stats.local_hits == 1
+
+    async def test_redis_hit_keeps_hidden_fields(
+        self, cached_repo, question_repo, redis_client, question
+    ):
+        redis_client.mget.return_value = [json.dumps(_to_payload(question))]
+
+        result = await cached_repo.get_questions_by_ids([{"id": question.id}], "course")
+
+        assert result == [question]
+        assert result[0].solution == question.solution
+        question_repo.get_questions_by_ids.assert_not_awaited()
+        assert cached_repo.stats.redis_hits == 1
+
+    async def test_invalidate_clears_collection(
+        self, cached_repo, question_repo, redis_client, question
+    ):
+        await cached_repo.get_questions_by_ids([{"id": question.id}], "course")
+
+        cached_repo.invalidate("course")
+        await cached_repo.get_questions_by_ids([{"id": question.id}], "course")
+
+        redis_client.scan_iter.assert_called_once_with(
+            match="question_cache:v1:course:*", count=500
+        )
+        assert question_repo.get_questions_by_ids.await_count == 2
+
+    async def test_save_invalidates_saved_questions(
+        self, cached_repo, question_repo, redis_client, question
+    ):
+        await cached_repo.get_questions_by_ids([{"id": question.id}], "course")
+        question_repo.save_questions = AsyncMock(return_value=[question.id])
+
+        await cached_repo.save_questions("course", [{"_id": question.id}])
+        await cached_repo.get_questions_by_ids([{"id": question.id}], "course")
+
+        redis_client.delete.assert_called_once_with(
+            f"question_cache:v1:course:{question.id}"
+        )
+        assert question_repo.get_questions_by_ids.await_count == 2
+
+    async def test_lighter_profiles_use_the_wrapped_repo_projection(
+        self, cached_repo, question_repo, redis_client, question
+    ):
+        question_repo.get_question_views_by_ids = AsyncMock(return_value=["view"])
+
+        result = await cached_repo.get_question_views_by_ids(
+            [{"id": question.id}], "course", QuestionProfile.RENDER
+        )
+
+        assert result == ["view"]
+        question_repo.get_question_views_by_ids.assert_awaited_once_with(
+            question_ids=[{"id": question.id}],
+            collection_name="course",
+            profile=QuestionProfile.RENDER,
+        )
+        question_repo.get_questions_by_ids.assert_not_awaited()
+        redis_client.mget.assert_not_called()
+
+    async def test_grading_profile_is_served_from_the_cache(
+        self, cached_repo, question_repo, question
+    ):
+        await cached_repo.get_questions_by_ids([{"id": question.id}], "course")
+
+        result = await cached_repo.get_question_view_by_id(
+            question.id, "course", QuestionProfile.GRADING
+        )
+
+        assert result == question
+        assert cached_repo.stats.local_hits == 1
@@ -1,8 +1,13 @@
 from datetime import datetime
-from typing import List, Optional
+from enum import Enum
+from typing import Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
+# Version of the Question schema that stored documents were validated against.
+# Documents tagged with it at ingest time can be loaded without revalidation.
+QUESTION_SCHEMA_VERSION = 1
+
 
 class Option(BaseModel):
     """
@@ -111,3 +116,102 @@ class Question(BaseModel):
         return dt.isoformat()
 
     model_config = ConfigDict(populate_by_name=True)
+
+
+class QuestionProfile(Enum):
+    """
+    Named read profiles, each mapped to the lightest question model that serves it.
+
+    LISTING: question metadata for listings and dashboards.
+    RENDER: everything a student sees, without answers or the solution.
+    GRADING: the complete question, including answers and the solution.
+    """
+
+    LISTING = "listing"
+    RENDER = "render"
+    GRADING = "grading"
+
+
+class OptionView(BaseModel):
+    """Answer option as shown to students, without its correctness flag."""
+
+    id: str
+    text: str
+
+
+class BlankView(BaseModel):
+    """Fill-in-the-blank slot as shown to students, without accepted answers."""
+
+    id: int
+    position: int
+
+
+class ContentView(BaseModel):
+    """Question content as shown to students."""
+
+    options: Optional[List[OptionView]] = None
+    blanks: Optional[List[BlankView]] = None
+
+
+class QuestionSummary(BaseModel):
+    """
+    Lightweight question metadata used by the LISTING profile.
+
+    Attributes:
+        id (str): Unique identifier for the question, aliased as "_id".
+        category_id (str): Identifier for categorizing the question.
+        text (str): The actual question text.
+        topic (str): Main subject area the question belongs to.
+        sub_topic (str): Specific sub-area within the main topic.
+        learning_objective (str): The learning objective addressed by the question.
+        difficulty (str): Difficulty rating of the question.
+        tags (List[str]): List of tags for categorization and searching.
+        question_type (str): Type of question (e.g., "multiple-choice").
+    """
+
+    id: str = Field(alias="_id")
+    category_id: str
+    text: str
+    topic: str
+    sub_topic: str
+    learning_objective: str
+    difficulty: str
+    tags: List[str]
+    question_type: str
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class RenderQuestion(QuestionSummary):
+    """
+    Question used by the RENDER profile.
+
+    Serializes to the same shape as Question, but never loads the answers,
+    solution, hint or misconception that Question hides from API responses.
+
+    Attributes:
+        academic_class (str): Academic class or grade level the question is intended for.
+        examination_level (str): Level of examination (e.g., JCE).
+        content (ContentView): Options or blanks without their answers.
+        created_at (datetime): Timestamp when the question was created.
+        updated_at (datetime): Timestamp when the question was last updated.
+    """
+
+    academic_class: str
+    examination_level: str
+    content: ContentView
+    created_at: datetime
+    updated_at: datetime
+
+    @field_serializer("created_at", "updated_at")
+    def serialize_datetimes(self, dt: datetime, _info):
+        return dt.isoformat()
+
+
+QuestionView = Union[QuestionSummary, RenderQuestion, Question]
+
+QUESTION_PROFILE_MODELS: Dict[QuestionProfile, Type[BaseModel]] = {
+    QuestionProfile.LISTING: QuestionSummary,
+    QuestionProfile.RENDER: RenderQuestion,
+    QuestionProfile.GRADING: Question,
+}
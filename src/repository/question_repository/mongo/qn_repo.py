@@ -1,19 +1,51 @@
+import asyncio
 import logging
-from typing import Any, Dict, Iterable, List
+import random
+from contextlib import aclosing
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Type
 
 from bson import ObjectId, errors
+from pydantic import BaseModel
 from pydantic_core._pydantic_core import ValidationError
 
 from src.apps.learning_tools.questions.models import QuestionSet
 from src.config.django import base
+from src.repository.databases.no_sql_database.data_types import (
+    Page, WriteOperation)
 from src.repository.databases.no_sql_database.mongo.mongodb import (
     AsyncMongoDatabaseEngine, mongo_database)
 from src.repository.question_repository.base_repo import \
     AbstractQuestionRepository
-from src.repository.question_repository.data_types import Question
+from src.repository.question_repository.data_types import (
+    QUESTION_PROFILE_MODELS, QUESTION_SCHEMA_VERSION, Blank, Content, Option,
+    Question, QuestionProfile, QuestionView, Solution)
 
 logger = logging.getLogger(__name__)
 
+_LISTING_PROJECTION = {
+    "category_id": 1,
+    "text": 1,
+    "topic": 1,
+    "sub_topic": 1,
+    "learning_objective": 1,
+    "difficulty": 1,
+    "tags": 1,
+    "question_type": 1,
+}
+
+_RENDER_PROJECTION = {
+    **_LISTING_PROJECTION,
+    "academic_class": 1,
+    "examination_level": 1,
+    "content.options.id": 1,
+    "content.options.text": 1,
+    "content.blanks.id": 1,
+    "content.blanks.position": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
 
 class MongoQuestionRepository(AbstractQuestionRepository):
     """
@@ -26,6 +58,20 @@ class MongoQuestionRepository(AbstractQuestionRepository):
 
     __slots__ = ("database_engine", "database_name")
 
+    # Fraction of trusted (ingest-validated) documents that still go through
+    # full pydantic validation on read, to catch drift between schema versions.
+    TRUSTED_VALIDATION_SAMPLE_RATE = 0.05
+
+    # Upper bound of a listing page, keeping memory per page constant
+    MAX_PAGE_SIZE = 200
+
+    # Fields loaded from MongoDB for each read profile; None loads the whole document.
+    PROFILE_PROJECTIONS: Dict[QuestionProfile, Optional[Dict[str, int]]] = {
+        QuestionProfile.LISTING: _LISTING_PROJECTION,
+        QuestionProfile.RENDER: _RENDER_PROJECTION,
+        QuestionProfile.GRADING: None,
+    }
+
     def __init__(
         self,
         database_engine: AsyncMongoDatabaseEngine,
@@ -74,19 +120,13 @@ class MongoQuestionRepository(AbstractQuestionRepository):
         if not object_ids:
             return []
 
-        query = {"_id": {"$in": object_ids}}
-        logger.debug("Querying collection '%s' with filter: %s", collection_name, query)
-
-        all_questions = []
-
-        # consuming the generator content for now
-        # since they're mostly a few question documents
-        async for batch in await self.database_engine.fetch_from_db(
-            collection_name, self.database_name, query
-        ):
-            all_questions.extend(batch)
+        logger.debug(
+            "Querying collection '%s' for %d question IDs",
+            collection_name,
+            len(object_ids),
+        )
 
-        result = self._process_mongo_question_data(all_questions)
+        result = await self._fetch_questions_by_object_ids(collection_name, object_ids)
         logger.info(
             "Retrieved %d questions out of %d requested IDs",
             len(result),
@@ -95,6 +135,168 @@ class MongoQuestionRepository(AbstractQuestionRepository):
 
         return result
 
+    async def get_questions_by_collection_ids(
+        self, question_ids_by_collection: Dict[str, List[QuestionSet]]
+    ) -> Dict[str, Dict[str, Question]]:
+        """
+        Retrieve questions from several collections in one concurrent round trip.
+
+        One `$in` query is issued per collection and all of them are awaited
+        together over the shared engine client.
+
+        Args:
+            question_ids_by_collection: Mapping of collection name to the question
+                ID dictionaries to retrieve from that collection.
+
+        Returns:
+            Mapping of collection name to a mapping of question ID to Question.
+            Collections with no valid IDs map to an empty dictionary.
+
+        Raises:
+            ValueError: If any collection name is empty.
+        """
+        if any(not name for name in question_ids_by_collection):
+            logger.error("Empty collection name provided")
+            raise ValueError("Collection name cannot be empty")
+
+        object_ids_by_collection = {
+            collection_name: self._validate_question_ids(question_ids)
+            for collection_name, question_ids in question_ids_by_collection.items()
+            if question_ids
+        }
+        collection_names = [
+            name for name, object_ids in object_ids_by_collection.items() if object_ids
+        ]
+
+        logger.debug(
+            "Fetching questions concurrently from %d collections",
+            len(collection_names),
+        )
+
+        fetched = await asyncio.gather(
+            *(
+                self._fetch_questions_by_object_ids(
+                    name, object_ids_by_collection[name]
+                )
+                for name in collection_names
+            )
+        )
+
+        result: Dict[str, Dict[str, Question]] = {
+            name: {} for name in question_ids_by_collection
+        }
+        for collection_name, questions in zip(collection_names, fetched):
+            result[collection_name] = {question.id: question for question in questions}
+
+        logger.info(
+            "Retrieved %d questions across %d collections",
+            sum(len(questions) for questions in fetched),
+            len(collection_names),
+        )
+        return result
+
+    async def get_question_views_by_ids(
+        self,
+        question_ids: List[QuestionSet],
+        collection_name: str,
+        profile: QuestionProfile,
+    ) -> List[QuestionView]:
+        """
+        Retrieve multiple questions as the lighter model of a read profile.
+
+        Only the profile's fields are loaded from MongoDB, so listing and
+        rendering never transfer or validate answers and solutions.
+
+        Args:
+            question_ids: A list of question ID strings to retrieve.
+            collection_name: The name of the collection to query.
+            profile: Read profile deciding which fields are loaded.
+
+        Returns:
+            A list of question views. Returns an empty list if no valid
+            question IDs are provided or found.
+
+        Raises:
+            ValueError: If collection_name is empty.
+        """
+        if profile is QuestionProfile.GRADING:
+            return await self.get_questions_by_ids(question_ids, collection_name)
+
+        if not collection_name:
+            logger.error("Empty collection name provided")
+            raise ValueError("Collection name cannot be empty")
+
+        object_ids = self._validate_question_ids(question_ids) if question_ids else []
+        if not object_ids:
+            return []
+
+        documents = await self._fetch_documents_by_object_ids(
+            collection_name, object_ids, self.PROFILE_PROJECTIONS[profile]
+        )
+        result = self._process_question_views(
+            documents, QUESTION_PROFILE_MODELS[profile]
+        )
+        logger.info(
+            "Retrieved %d '%s' question views out of %d requested IDs",
+            len(result),
+            profile.value,
+            len(question_ids),
+        )
+        return result
+
+    async def _fetch_questions_by_object_ids(
+        self, collection_name: str, object_ids: List[ObjectId]
+    ) -> List[Question]:
+        """
+        Fetch every question matching the given ObjectIds in a single batch.
+
+        Args:
+            collection_name: The name of the collection to query.
+            object_ids: Validated MongoDB ObjectIds to retrieve.
+
+        Returns:
+            List of Question objects found in the collection.
+        """
+        documents = await self._fetch_documents_by_object_ids(
+            collection_name, object_ids
+        )
+        return self._process_mongo_question_data(documents)
+
+    async def _fetch_documents_by_object_ids(
+        self,
+        collection_name: str,
+        object_ids: List[ObjectId],
+        projection: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the raw documents matching the given ObjectIds in a single batch.
+
+        The batch size and limit are pinned to the number of IDs so the `$in`
+        query is never truncated by the engine defaults.
+
+        Args:
+            collection_name: The name of the collection to query.
+            object_ids: Validated MongoDB ObjectIds to retrieve.
+            projection: Fields to load, or None for whole documents.
+
+        Returns:
+            List of raw MongoDB documents.
+        """
+        documents = []
+        batches = await self.database_engine.fetch_from_db(
+            collection_name,
+            self.database_name,
+            {"_id": {"$in": object_ids}},
+            projection=projection,
+            batch_size=len(object_ids),
+            limit=len(object_ids),
+        )
+        async with aclosing(batches):
+            async for batch in batches:
+                documents.extend(batch)
+
+        return documents
+
     async def get_question_by_single_id(
         self, question_id: str, collection_name: str
     ) -> Question:
@@ -105,7 +307,39 @@ class MongoQuestionRepository(AbstractQuestionRepository):
             raise ValueError("Mongo Question with ID '%s' not found" % question_id)
 
         result = response[0] if isinstance(response, list) else response
-        return Question(**{**result, "_id": str(question_id)})
+        return self._build_question({**result, "_id": ObjectId(question_id)})
+
+    async def get_question_view_by_id(
+        self, question_id: str, collection_name: str, profile: QuestionProfile
+    ) -> QuestionView:
+        """
+        Retrieve a single question as the lighter model of a read profile.
+
+        Args:
+            question_id: Unique identifier of the question.
+            collection_name: The name of the collection to query.
+            profile: Read profile deciding which fields are loaded.
+
+        Returns:
+            The question view.
+
+        Raises:
+            ValueError: If the question does not exist.
+        """
+        if profile is QuestionProfile.GRADING:
+            return await self.get_question_by_single_id(question_id, collection_name)
+
+        response = await self.database_engine.fetch_one_from_db(
+            collection_name,
+            self.database_name,
+            {"_id": ObjectId(question_id)},
+            projection=self.PROFILE_PROJECTIONS[profile],
+        )
+        if not response:
+            raise ValueError("Mongo Question with ID '%s' not found" % question_id)
+
+        result = response[0] if isinstance(response, list) else response
+        return QUESTION_PROFILE_MODELS[profile](**{**result, "_id": str(question_id)})
 
     async def get_questions_by_aggregation(
         self, collection_name: str, pipeline: Any
@@ -151,25 +385,141 @@ class MongoQuestionRepository(AbstractQuestionRepository):
             List of Question objects matching the provided identifiers
 
         """
-
-        all_questions = []
-
-        # consuming the generator content for now
-        # since they're mostly a few question documents
-        async for batch in await self.database_engine.fetch_from_db(
+        documents = await self.database_engine.stream_from_db(
             collection_name, self.database_name, query
-        ):
-            all_questions.extend(batch)
+        )
+        async with aclosing(documents):
+            all_questions = [document async for document in documents]
 
         result = self._process_mongo_question_data(all_questions)
         logger.info(
-            "Retrieved %d questions out of %d requested IDs",
+            "Retrieved %d questions out of %d matching documents",
             len(result),
             len(all_questions),
         )
 
         return result
 
+    async def get_questions_page(
+        self,
+        collection_name: str,
+        profile: QuestionProfile,
+        query: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[tuple]] = None,
+        page_size: int = 50,
+        continuation_token: Optional[str] = None,
+    ) -> Page:
+        """
+        Retrieve one page of a collection's questions with keyset pagination.
+
+        Only the profile's fields and the sort keys are loaded, and at most
+        MAX_PAGE_SIZE questions are held per page.
+
+        Args:
+            collection_name: The name of the collection to query.
+            profile: Read profile deciding which fields are loaded.
+            query: Dictionary of question query parameters.
+            sort: Sort criteria as (field, direction) tuples; defaults to _id.
+            page_size: Questions per page, capped at MAX_PAGE_SIZE.
+            continuation_token: Token returned with the previous page, None
+                for the first page.
+
+        Returns:
+            Page of question views with the token of the next page.
+
+        Raises:
+            ValueError: If collection_name is empty.
+            InvalidContinuationTokenError: If the token does not belong to
+                this query and sort.
+        """
+        if not collection_name:
+            logger.error("Empty collection name provided")
+            raise ValueError("Collection name cannot be empty")
+
+        page = await self.database_engine.fetch_page_from_db(
+            collection_name,
+            self.database_name,
+            query=query,
+            projection=self.PROFILE_PROJECTIONS[profile],
+            sort=sort,
+            page_size=max(1, min(page_size, self.MAX_PAGE_SIZE)),
+            continuation_token=continuation_token,
+        )
+
+        if profile is QuestionProfile.GRADING:
+            items = self._process_mongo_question_data(page.items)
+        else:
+            items = self._process_question_views(
+                page.items, QUESTION_PROFILE_MODELS[profile]
+            )
+
+        logger.info(
+            "Retrieved page of %d '%s' questions from '%s'",
+            len(items),
+            profile.value,
+            collection_name,
+        )
+        return Page(items=items, next_token=page.next_token)
+
+    async def save_questions(
+        self, collection_name: str, questions: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Validate questions and upsert them with a single bulk write keyed by _id.
+
+        Saved documents are tagged with the current schema version, so reads
+        build them without revalidation.
+
+        Args:
+            collection_name: The name of the collection to write to.
+            questions: Raw question documents; documents without an _id are
+                inserted as new questions.
+
+        Returns:
+            IDs of the saved questions, in the order given.
+
+        Raises:
+            ValueError: If collection_name is empty.
+            ValidationError: If any question does not match the Question schema;
+                nothing is written then.
+            MongoDbOperationError: If any question could not be written.
+        """
+        if not collection_name:
+            logger.error("Empty collection name provided")
+            raise ValueError("Collection name cannot be empty")
+
+        now = datetime.now(timezone.utc)
+        question_ids: List[str] = []
+        operations: List[WriteOperation] = []
+        for question in questions:
+            object_id = ObjectId(question["_id"]) if "_id" in question else ObjectId()
+            document = self.prepare_question_for_ingest(
+                {"created_at": now, **question, "_id": object_id, "updated_at": now}
+            )
+            fields = {
+                key: value
+                for key, value in document.items()
+                if key not in ("_id", "created_at")
+            }
+            operations.append(
+                WriteOperation.upsert(
+                    {"_id": object_id},
+                    {
+                        "$set": fields,
+                        "$setOnInsert": {"created_at": document["created_at"]},
+                    },
+                )
+            )
+            question_ids.append(str(object_id))
+
+        await self.database_engine.bulk_write_to_db(
+            operations, collection_name, self.database_name, timestamp=False
+        )
+        logger.info(
+            "Saved %d questions to collection '%s'", len(question_ids), collection_name
+        )
+        return question_ids
+
     @staticmethod
     def _validate_question_ids(question_ids: List[QuestionSet]) -> List[ObjectId]:
         """
@@ -227,13 +577,18 @@ class MongoQuestionRepository(AbstractQuestionRepository):
         logger.debug(f"Normalized name '{name}' to '{normalized}'")
         return normalized
 
-    @staticmethod
+    @classmethod
     def _process_mongo_question_data(
+        cls,
         questions: Iterable[Dict[str, Any]],
     ) -> List[Question]:
         """
         Process raw MongoDB documents into Question domain objects.
 
+        Documents tagged with the current schema version were validated at
+        ingest time and are built without revalidation, except for a sampled
+        fraction that is fully validated.
+
         Args:
             questions: Iterable of MongoDB document dictionaries.
 
@@ -245,13 +600,7 @@ class MongoQuestionRepository(AbstractQuestionRepository):
 
         for question in questions:
             try:
-                question_id = str(question.get("_id", "unknown"))
-                logger.debug("Processing question data for ID: %s", question_id)
-
-                question_with_string_id = {**question, "_id": question_id}
-                question_obj = Question(**question_with_string_id)
-                result.append(question_obj)
-
+                result.append(cls._build_question(question))
             except ValidationError as e:
                 error_count += 1
                 logger.error(
@@ -267,6 +616,193 @@ class MongoQuestionRepository(AbstractQuestionRepository):
         logger.debug("Successfully processed %d question objects", len(result))
         return result
 
+    @classmethod
+    def _build_question(cls, question: Dict[str, Any]) -> Question:
+        """
+        Build a Question from a raw document, skipping validation when trusted.
+
+        A trusted document that cannot be assembled without validation, e.g.
+        because content or solution is missing, goes through full validation.
+
+        Args:
+            question: Raw MongoDB document.
+
+        Returns:
+            The Question object.
+
+        Raises:
+            ValidationError: If the document does not match the Question schema.
+        """
+        question_id = str(question.get("_id", "unknown"))
+        if cls._is_trusted_document(question) and not cls._sample_for_validation():
+            try:
+                return cls._construct_trusted_question(question)
+            except (KeyError, TypeError, AttributeError) as e:
+                logger.warning(
+                    "Trusted question %s is malformed, validating it: %r",
+                    question_id,
+                    e,
+                )
+
+        logger.debug("Validating question data for ID: %s", question_id)
+        return Question(**{**question, "_id": question_id})
+
+    @staticmethod
+    def _process_question_views(
+        documents: Iterable[Dict[str, Any]], model: Type[BaseModel]
+    ) -> List[QuestionView]:
+        """
+        Validate projected MongoDB documents into a profile's question model.
+
+        Args:
+            documents: Iterable of projected MongoDB document dictionaries.
+            model: The profile's question model.
+
+        Returns:
+            List of question views; invalid documents are logged and skipped.
+        """
+        result: List[QuestionView] = []
+        for document in documents:
+            try:
+                result.append(
+                    model.model_validate({**document, "_id": str(document["_id"])})
+                )
+            except ValidationError as e:
+                logger.error(
+                    "Error processing question data: %s. Error: %s",
+                    document.get("_id", "unknown"),
+                    str(e),
+                )
+
+        return result
+
+    @staticmethod
+    def _is_trusted_document(question: Dict[str, Any]) -> bool:
+        """Check whether a document was validated at ingest against the current schema."""
+        return question.get("schema_version") == QUESTION_SCHEMA_VERSION
+
+    @classmethod
+    def _sample_for_validation(cls) -> bool:
+        """Decide whether a trusted document should still be fully validated."""
+        return random.random() < cls.TRUSTED_VALIDATION_SAMPLE_RATE
+
+    @staticmethod
+    def _construct_trusted_question(question: Dict[str, Any]) -> Question:
+        """
+        Build a Question from a trusted document without running validation.
+
+        Nested models are constructed explicitly since model_construct does
+        not recurse into sub-models.
+
+        Args:
+            question: Raw MongoDB document tagged with the current schema version.
+
+        Returns:
+            Question object sharing the document's values.
+        """
+        content = question["content"]
+        options = content.get("options")
+        blanks = content.get("blanks")
+
+        trusted_question = Question.model_construct(**question)
+        trusted_question.id = str(question["_id"])
+        trusted_question.content = Content.model_construct(
+            options=(
+                [Option.model_construct(**option) for option in options]
+                if options is not None
+                else None
+            ),
+            blanks=(
+                [Blank.model_construct(**blank) for blank in blanks]
+                if blanks is not None
+                else None
+            ),
+        )
+        trusted_question.solution = Solution.model_construct(**question["solution"])
+        return trusted_question
+
+    @staticmethod
+    def prepare_question_for_ingest(question: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate a question document once at ingest time and tag it as trusted.
+
+        Args:
+            question: Raw question document about to be written to MongoDB.
+
+        Returns:
+            A copy of the document tagged with the current schema version.
+
+        Raises:
+            ValidationError: If the document does not match the Question schema.
+        """
+        Question(**{**question, "_id": str(question.get("_id", ""))})
+        return {**question, "schema_version": QUESTION_SCHEMA_VERSION}
+
+    async def tag_trusted_questions(
+        self, collection_name: str, batch_size: int = 500
+    ) -> int:
+        """
+        Backfill the schema version of documents stored before ingest tagging.
+
+        Untagged documents are validated once and the valid ones tagged, so
+        later reads skip their validation. Invalid documents are logged and
+        left untagged. Safe to run again, e.g. after a schema version bump.
+
+        Args:
+            collection_name: The name of the collection to backfill.
+            batch_size: Documents tagged per bulk write.
+
+        Returns:
+            Number of documents tagged.
+        """
+        operations: List[WriteOperation] = []
+        tagged = 0
+        documents = await self.database_engine.stream_from_db(
+            collection_name,
+            self.database_name,
+            {"schema_version": {"$ne": QUESTION_SCHEMA_VERSION}},
+        )
+        # Closed even when a bulk write fails, so the stream's in-flight slot
+        # and cursor are not held until the generator is garbage collected
+        async with aclosing(documents):
+            async for document in documents:
+                try:
+                    self.prepare_question_for_ingest(document)
+                except ValidationError as e:
+                    logger.warning(
+                        "Not tagging invalid question %s: %s", document.get("_id"), e
+                    )
+                    continue
+
+                operations.append(
+                    WriteOperation.update_one(
+                        {"_id": document["_id"]},
+                        {"$set": {"schema_version": QUESTION_SCHEMA_VERSION}},
+                    )
+                )
+                if len(operations) >= batch_size:
+                    tagged += await self._write_schema_tags(collection_name, operations)
+                    operations = []
+
+        if operations:
+            tagged += await self._write_schema_tags(collection_name, operations)
+
+        logger.info(
+            "Tagged %d questions in collection '%s' with schema version %d",
+            tagged,
+            collection_name,
+            QUESTION_SCHEMA_VERSION,
+        )
+        return tagged
+
+    async def _write_schema_tags(
+        self, collection_name: str, operations: List[WriteOperation]
+    ) -> int:
+        summary = await self.database_engine.bulk_write_to_db(
+            operations, collection_name, self.database_name, timestamp=False
+        )
+        return summary.modified_count
+
     @classmethod
     def get_repo(cls):
         database_name = getattr(base, "NO_SQL_QUESTIONS_DATABASE_NAME", None)
@@ -0,0 +1,382 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import ObjectId
+from pydantic import ValidationError
+
+from src.repository.databases.no_sql_database.data_types import (
+    BulkWriteSummary, Page)
+
+from ...data_types import (QUESTION_SCHEMA_VERSION, Option, QuestionProfile,
+                           QuestionSummary, RenderQuestion, Solution)
+from ..qn_repo import MongoQuestionRepository
+
+
+def _question_document(question_id):
+    """Build a raw question document as it is stored in Mongo."""
+    now = datetime.now()
+    return {
+        "_id": ObjectId(question_id),
+        "category_id": "category1",
+        "text": "What is 2 + 2?",
+        "topic": "Mathematics",
+        "sub_topic": "Arithmetic",
+        "learning_objective": "Add small numbers",
+        "academic_class": "Form 1",
+        "examination_level": "JCE",
+        "difficulty": "Easy",
+        "tags": ["arithmetic"],
+        "question_type": "multiple-choice",
+        "content": {
+            "options": [
+                {"id": "option1", "text": "4", "is_correct": True},
+                {"id": "option2", "text": "5", "is_correct": False},
+            ]
+        },
+        "solution": {"explanation": "2 + 2 = 4", "steps": ["Add the numbers"]},
+        "hint": "Count on your fingers.",
+        "possible_misconception": "Confusing addition with multiplication.",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def _documents(documents):
+    """Build an async generator yielding documents one at a time."""
+
+    async def generator():
+        for document in documents:
+            yield document
+
+    return generator()
+
+
+def _batches(*batches):
+    """Build an async generator yielding the given document batches."""
+
+    async def generator():
+        for batch in batches:
+            yield batch
+
+    return generator()
+
+
+@pytest.fixture
+def database_engine():
+    engine = MagicMock()
+    engine.fetch_from_db = AsyncMock()
+    engine.stream_from_db = AsyncMock()
+    return engine
+
+
+@pytest.fixture
+def repository(database_engine):
+    return MongoQuestionRepository(
+        database_engine=database_engine, database_name="test_questions_database"
+    )
+
+
+@pytest.mark.asyncio
+class TestGetQuestionsByCollectionIds:
+    """Tests for the bulk multi-collection question fetch."""
+
+    async def test_results_are_keyed_by_collection_and_id(
+        self, repository, database_engine
+    ):
+        first_id, second_id = str(ObjectId()), str(ObjectId())
+        first = _question_document(first_id)
+        second = _question_document(second_id)
+
+        database_engine.fetch_from_db.side_effect = [
+            _batches([first]),
+            _batches([second]),
+        ]
+
+        result = await repository.get_questions_by_collection_ids(
+            {"course_a": [{"id": first_id}], "course_b": [{"id": second_id}]}
+        )
+
+        assert set(result) == {"course_a", "course_b"}
+        assert list(result["course_a"]) == [first_id]
+        assert list(result["course_b"]) == [second_id]
+        assert database_engine.fetch_from_db.await_count == 2
+
+    async def test_collections_without_valid_ids_are_not_queried(
+        self, repository, database_engine
+    ):
+        result = await repository.get_questions_by_collection_ids(
+            {"course_a": [{"id": "not-an-object-id"}], "course_b": []}
+        )
+
+        assert result == {"course_a": {}, "course_b": {}}
+        database_engine.fetch_from_db.assert_not_awaited()
+
+    async def test_query_is_not_truncated(self, repository, database_engine):
+        question_ids = [{"id": str(ObjectId())} for _ in range(25)]
+        database_engine.fetch_from_db.side_effect = [_batches([])]
+
+        await repository.get_questions_by_collection_ids({"course_a": question_ids})
+
+        kwargs = database_engine.fetch_from_db.await_args.kwargs
+        assert kwargs["limit"] == 25
+        assert kwargs["batch_size"] == 25
+
+    async def test_empty_collection_name_raises(self, repository):
+        with pytest.raises(ValueError):
+            await repository.get_questions_by_collection_ids(
+                {"": [{"id": str(ObjectId())}]}
+            )
+
+
+@pytest.mark.asyncio
+class TestGetQuestionByCustomQuery:
+    """Tests for custom query retrieval."""
+
+    async def test_all_matching_documents_are_returned(
+        self, repository, database_engine
+    ):
+        documents = [_question_document(str(ObjectId())) for _ in range(25)]
+        database_engine.stream_from_db.return_value = _documents(documents)
+
+        result = await repository.get_question_by_custom_query(
+            "course_a", {"category_id": "category1"}
+        )
+
+        assert len(result) == 25
+        database_engine.stream_from_db.assert_awaited_once_with(
+            "course_a", "test_questions_database", {"category_id": "category1"}
+        )
+
+
+class TestProcessMongoQuestionData:
+    """Tests for turning raw documents into Question objects."""
+
+    @pytest.fixture
+    def trusted_document(self):
+        document = _question_document(str(ObjectId()))
+        return MongoQuestionRepository.prepare_question_for_ingest(document)
+
+    def test_trusted_documents_skip_validation(self, monkeypatch, trusted_document):
+        monkeypatch.setattr(
+            MongoQuestionRepository, "TRUSTED_VALIDATION_SAMPLE_RATE", 0.0
+        )
+        trusted_document["tags"] = "not-a-list"
+
+        (question,) = MongoQuestionRepository._process_mongo_question_data(
+            [trusted_document]
+        )
+
+        assert question.id == str(trusted_document["_id"])
+        assert question.tags == "not-a-list"
+        assert isinstance(question.content.options[0], Option)
+        assert question.content.options[0].is_correct is True
+        assert isinstance(question.solution, Solution)
+
+    def test_sampled_trusted_documents_are_validated(
+        self, monkeypatch, trusted_document
+    ):
+        monkeypatch.setattr(
+            MongoQuestionRepository, "TRUSTED_VALIDATION_SAMPLE_RATE", 1.0
+        )
+        trusted_document["tags"] = "not-a-list"
+
+        result = MongoQuestionRepository._process_mongo_question_data(
+            [trusted_document]
+        )
+
+        assert result == []
+
+    def test_untagged_documents_are_validated(self):
+        document = _question_document(str(ObjectId()))
+        document["tags"] = "not-a-list"
+
+        result = MongoQuestionRepository._process_mongo_question_data([document])
+
+        assert result == []
+
+    def test_malformed_trusted_documents_fall_back_to_validation(
+        self, monkeypatch, trusted_document
+    ):
+        monkeypatch.setattr(
+            MongoQuestionRepository, "TRUSTED_VALIDATION_SAMPLE_RATE", 0.0
+        )
+        malformed_document = {**trusted_document, "_id": ObjectId()}
+        del malformed_document["solution"]
+
+        result = MongoQuestionRepository._process_mongo_question_data(
+            [malformed_document, trusted_document]
+        )
+
+        assert [question.id for question in result] == [str(trusted_document["_id"])]
+
+    def test_prepare_for_ingest_leaves_the_document_untouched(self):
+        document = _question_document(str(ObjectId()))
+
+        prepared = MongoQuestionRepository.prepare_question_for_ingest(document)
+
+        assert "schema_version" not in document
+        assert prepared == {**document, "schema_version": QUESTION_SCHEMA_VERSION}
+
+    def test_trusted_and_validated_questions_match(self, monkeypatch, trusted_document):
+        untagged_document = {
+            key: value
+            for key, value in trusted_document.items()
+            if key != "schema_version"
+        }
+        monkeypatch.setattr(
+            MongoQuestionRepository, "TRUSTED_VALIDATION_SAMPLE_RATE", 0.0
+        )
+
+        (trusted,) = MongoQuestionRepository._process_mongo_question_data(
+            [trusted_document]
+        )
+        (validated,) = MongoQuestionRepository._process_mongo_question_data(
+            [untagged_document]
+        )
+
+        assert trusted.model_dump() == validated.model_dump()
+
+
+@pytest.mark.asyncio
+class TestGetQuestionViewsByIds:
+    """Tests for profile-projected question retrieval."""
+
+    async def test_render_profile_projects_and_hides_answers(
+        self, repository, database_engine
+    ):
+        question_id = str(ObjectId())
+        document = _question_document(question_id)
+        for option in document["content"]["options"]:
+            del option["is_correct"]
+        for field in ("solution", "hint", "possible_misconception"):
+            del document[field]
+        database_engine.fetch_from_db.side_effect = [_batches([document])]
+
+        (view,) = await repository.get_question_views_by_ids(
+            [{"id": question_id}], "course_a", QuestionProfile.RENDER
+        )
+
+        projection = database_engine.fetch_from_db.await_args.kwargs["projection"]
+        assert "solution" not in projection
+        assert "content.options.is_correct" not in projection
+        assert isinstance(view, RenderQuestion)
+        assert not hasattr(view.content.options[0], "is_correct")
+
+    async def test_listing_profile_returns_summaries(self, repository, database_engine):
+        question_id = str(ObjectId())
+        document = {
+            key: value
+            for key, value in _question_document(question_id).items()
+            if key
+            in MongoQuestionRepository.PROFILE_PROJECTIONS[QuestionProfile.LISTING]
+            or key == "_id"
+        }
+        database_engine.fetch_from_db.side_effect = [_batches([document])]
+
+        (view,) = await repository.get_question_views_by_ids(
+            [{"id": question_id}], "course_a", QuestionProfile.LISTING
+        )
+
+        assert isinstance(view, QuestionSummary)
+        assert view.id == question_id
+
+    async def test_grading_profile_loads_full_questions(
+        self, repository, database_engine
+    ):
+        question_id = str(ObjectId())
+        database_engine.fetch_from_db.side_effect = [
+            _batches([_question_document(question_id)])
+        ]
+
+        (question,) = await repository.get_question_views_by_ids(
+            [{"id": question_id}], "course_a", QuestionProfile.GRADING
+        )
+
+        assert database_engine.fetch_from_db.await_args.kwargs["projection"] is None
+        assert question.solution.explanation == "2 + 2 = 4"
+
+
+@pytest.mark.asyncio
+class TestGetQuestionsPage:
+    async def test_page_is_loaded_with_the_profile_projection(
+        self, repository, database_engine
+    ):
+        document = _question_document("507f1f77bcf86cd799439011")
+        database_engine.fetch_page_from_db = AsyncMock(
+            return_value=Page(items=[document], next_token="next")
+        )
+
+        page = await repository.get_questions_page(
+            "questions", QuestionProfile.LISTING, page_size=1000
+        )
+
+        assert [type(item) for item in page.items] == [QuestionSummary]
+        assert page.next_token == "next"
+        kwargs = database_engine.fetch_page_from_db.await_args.kwargs
+        assert (
+            kwargs["projection"]
+            == MongoQuestionRepository.PROFILE_PROJECTIONS[QuestionProfile.LISTING]
+        )
+        assert kwargs["page_size"] == MongoQuestionRepository.MAX_PAGE_SIZE
+
+
+@pytest.mark.asyncio
+class TestSaveQuestions:
+    """Tests for the bulk question write."""
+
+    async def test_questions_are_upserted_in_one_bulk_write(
+        self, repository, database_engine
+    ):
+        database_engine.bulk_write_to_db = AsyncMock()
+        existing = _question_document(str(ObjectId()))
+        new = {key: value for key, value in existing.items() if key != "_id"}
+
+        question_ids = await repository.save_questions("course", [existing, new])
+
+        (operations, collection_name, _), kwargs = (
+            database_engine.bulk_write_to_db.await_args
+        )
+        assert collection_name == "course"
+        assert kwargs == {"timestamp": False}
+        assert question_ids[0] == str(existing["_id"])
+        assert [operation.query["_id"] for operation in operations] == [
+            ObjectId(question_id) for question_id in question_ids
+        ]
+        assert operations[0].update["$set"]["schema_version"] == QUESTION_SCHEMA_VERSION
+        assert "created_at" not in operations[0].update["$set"]
+        assert operations[0].update["$setOnInsert"] == {
+            "created_at": existing["created_at"]
+        }
+
+    async def test_invalid_questions_are_not_written(self, repository, database_engine):
+        database_engine.bulk_write_to_db = AsyncMock()
+        document = _question_document(str(ObjectId()))
+        del document["solution"]
+
+        with pytest.raises(ValidationError):
+            await repository.save_questions("course", [document])
+
+        database_engine.bulk_write_to_db.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestTagTrustedQuestions:
+    """Tests for the schema version backfill."""
+
+    async def test_only_valid_documents_are_tagged(self, repository, database_engine):
+        valid = _question_document(str(ObjectId()))
+        invalid = {**_question_document(str(ObjectId())), "tags": "not-a-list"}
+        database_engine.stream_from_db.return_value = _documents([valid, invalid])
+        database_engine.bulk_write_to_db = AsyncMock(
+            return_value=BulkWriteSummary(matched_count=1, modified_count=1)
+        )
+
+        tagged = await repository.tag_trusted_questions("course")
+
+        (operations, *_), _ = database_engine.bulk_write_to_db.await_args
+        assert tagged == 1
+        assert [operation.query for operation in operations] == [{"_id": valid["_id"]}]
+        assert operations[0].update == {
+            "$set": {"schema_version": QUESTION_SCHEMA_VERSION}
+        }
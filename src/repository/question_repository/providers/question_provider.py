@@ -5,9 +5,11 @@ from src.apps.learning_tools.questions.models import QuestionSet
 from src.exceptions import QuestionNotFoundError
 from src.repository.question_repository.base_repo import \
     AbstractQuestionRepository
-from src.repository.question_repository.data_types import Question
-from src.repository.question_repository.mongo.qn_repo import \
-    MongoQuestionRepository
+from src.repository.question_repository.cache.cached_repo import \
+    CachedQuestionRepository
+from src.repository.question_repository.data_types import (Question,
+                                                           QuestionProfile,
+                                                           QuestionView)
 from src.utils.mixins.question_mixin import QuestionSetResources
 
 logger = logging.getLogger(__name__)
@@ -102,6 +104,66 @@ class QuestionProvider:
         logger.debug(f"Successfully retrieved question: {question_id}")
         return question
 
+    async def get_question_views_from_ids(
+        self, question_set_ids: List[QuestionSet], profile: QuestionProfile
+    ) -> List[QuestionView]:
+        """
+        Retrieve questions as the lighter model of a read profile.
+
+        Args:
+            question_set_ids: List of question ID dictionaries
+            profile: Read profile, e.g. LISTING for listings or RENDER for
+                showing questions without their answers
+
+        Returns:
+            List of question views
+        """
+        if not question_set_ids:
+            logger.warning("Empty question_set_ids provided")
+            return []
+
+        logger.debug(
+            "Retrieving %d '%s' question views from collection %s",
+            len(question_set_ids),
+            profile.value,
+            self._collection_name,
+        )
+
+        return await self._question_repo.get_question_views_by_ids(
+            collection_name=self._collection_name,
+            question_ids=question_set_ids,
+            profile=profile,
+        )
+
+    async def get_question_view_by_id(
+        self, question_id: str, profile: QuestionProfile
+    ) -> QuestionView:
+        """
+        Retrieve a single question as the lighter model of a read profile.
+
+        Args:
+            question_id: Unique identifier for the question
+            profile: Read profile deciding which fields are loaded
+
+        Returns:
+            QuestionView: The retrieved question view
+        """
+        if not question_id:
+            raise ValueError("Question ID cannot be empty")
+
+        question = await self._question_repo.get_question_view_by_id(
+            collection_name=self._collection_name,
+            question_id=question_id,
+            profile=profile,
+        )
+
+        if not question:
+            raise QuestionNotFoundError(
+                question_id=question_id, collection_name=self._collection_name
+            )
+
+        return question
+
     @classmethod
     def get_mongo_provider(
         cls, resource_context: QuestionSetResources
@@ -109,6 +171,9 @@ class QuestionProvider:
         """
         Factory method to create a provider instance from resource context.
 
+        Questions are read through the process-wide question cache, which
+        falls back to MongoDB on a miss.
+
         Args:
             resource_context: QuestionSetResources containing collection configuration
 
@@ -116,7 +181,7 @@ class QuestionProvider:
             QuestionProvider: Configured provider instance
         """
         collection_name = resource_context.resources.collection_name
-        question_repo = MongoQuestionRepository.get_repo()
+        question_repo = CachedQuestionRepository.get_repo()
         return cls(question_repo, collection_name)
 
     def __repr__(self):
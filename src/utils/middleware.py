@@ -0,0 +1,34 @@
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.utils.decorators import sync_and_async_middleware
+
+from src.repository.databases.no_sql_database.retry import request_deadline
+
+
+@sync_and_async_middleware
+def request_deadline_middleware(get_response):
+    """
+    Set the request deadline that bounds retries of database operations.
+
+    The deadline is REQUEST_DEADLINE_SECONDS from the moment the request
+    reaches this middleware.
+    """
+    timeout_seconds = getattr(settings, "REQUEST_DEADLINE_SECONDS", None)
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            if timeout_seconds is None:
+                return await get_response(request)
+            with request_deadline(timeout_seconds):
+                return await get_response(request)
+
+    else:
+
+        def middleware(request):
+            if timeout_seconds is None:
+                return get_response(request)
+            with request_deadline(timeout_seconds):
+                return get_response(request)
+
+    return middleware
@@ -1,7 +1,5 @@
 from collections import namedtuple
 
-from asgiref.sync import sync_to_async
-
 from src.library.qset_provider import QuestionSetResourceProvider
 
 QuestionSetResources = namedtuple(
@@ -52,7 +50,7 @@ class QuestionSetMixin:
         serializer.is_valid(raise_exception=True)
         validated_data = serializer.validated_data
 
-        provider = await sync_to_async(QuestionSetResourceProvider)(data=validated_data)
+        provider = await QuestionSetResourceProvider.acreate(data=validated_data)
         resources = provider.get_resources()
 
         return QuestionSetResources(validated_data=validated_data, resources=resources)
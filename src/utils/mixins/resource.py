@@ -1,7 +1,7 @@
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
 
 from src.apps.core.content.models import LearningObjective, SubTopic
 from src.apps.core.users.models import EdxUser
@@ -69,6 +69,90 @@ class UserResourceContextMixin:
         )
         return user_question_set.question_list_ids
 
+    @staticmethod
+    async def aget_edx_user_from_username(username) -> EdxUser:
+        """Async version of get_edx_user_from_username."""
+        return await aget_object_or_404(EdxUser, username=username)
+
+    @staticmethod
+    async def aget_learning_objective_from_block_id(block_id) -> LearningObjective:
+        """
+        Async version of get_learning_objective_from_block_id.
+
+        The sub_topic, its topic and course are fetched in the same query, so
+        get_collection_name_from_subtopic does not hit the database.
+        """
+        return await aget_object_or_404(
+            LearningObjective.objects.select_related("sub_topic__topic__course"),
+            block_id=block_id,
+        )
+
+    @staticmethod
+    async def aget_default_question_set_from_block_id(block_id) -> DefaultQuestionSet:
+        """
+        Retrieve the DefaultQuestionSet of a learning objective by its block ID.
+
+        Args:
+            block_id: The block ID of the learning objective.
+
+        Returns:
+            DefaultQuestionSet: The learning objective's default question set.
+        """
+        return await aget_object_or_404(
+            DefaultQuestionSet, learning_objective__block_id=block_id
+        )
+
+    @staticmethod
+    async def aget_user_question_set_with_context(
+        username: str, block_id: str
+    ) -> Optional[UserQuestionSet]:
+        """
+        Retrieve an existing UserQuestionSet by username and block ID in one query.
+
+        The user and the learning objective, with its sub_topic, topic and
+        course, are joined in, so no further query is needed to build the
+        question set context.
+
+        Args:
+            username: The username of the user.
+            block_id: The block ID of the learning objective.
+
+        Returns:
+            Optional[UserQuestionSet]: The question set, or None if the user has
+                none for the learning objective yet.
+        """
+        return (
+            await UserQuestionSet.objects.select_related(
+                "user", "learning_objective__sub_topic__topic__course"
+            )
+            .filter(user__username=username, learning_objective__block_id=block_id)
+            .afirst()
+        )
+
+    @staticmethod
+    async def aget_user_question_set(
+        user: EdxUser,
+        objective: LearningObjective,
+        default_question_set: DefaultQuestionSet,
+    ) -> List[Dict[str, str]]:
+        """
+        Async version of get_user_question_set, for an already fetched default set.
+
+        Args:
+            user: The User object.
+            objective: The LearningObjective object.
+            default_question_set: The learning objective's default question set.
+
+        Returns:
+            List[Dict[str, str]]: The question list IDs from the UserQuestionSet.
+        """
+        user_question_set, created = await UserQuestionSet.objects.aget_or_create(
+            user=user,
+            learning_objective=objective,
+            defaults={"question_list_ids": default_question_set.questions},
+        )
+        return user_question_set.question_list_ids
+
     @staticmethod
     def get_collection_name_from_subtopic(sub_topic: SubTopic) -> str:
         """